@@ -1,7 +1,88 @@
 import json
+import time
+
+import numpy as np
+import pandas as pd
 import pytest
 
+from validators.instrumentation import METRICS
+from validators.row_view import ColumnStore
+from validators.text_cache import NormalizedTextCache
+
 @pytest.fixture(scope="session")
 def load_rules():
     with open("rules/rules.json") as f:
-        return json.load(f)
\ No newline at end of file
+        return json.load(f)
+
+@pytest.fixture(scope="session")
+def company_df():
+    return pd.read_csv("data/Company Master(Flat Companies Data).csv")
+
+@pytest.fixture(scope="session")
+def text_cache(company_df):
+    return NormalizedTextCache(company_df)
+
+@pytest.fixture(scope="session")
+def company_store(company_df):
+    return ColumnStore(company_df)
+
+@pytest.fixture(params=[10_000, pytest.param(1_000_000, marks=pytest.mark.benchmark)])
+def scaled_rows(request, company_df):
+    """Master row positions for a scaled run, drawn with replacement (fixed seed); the full size needs --benchmark"""
+    return np.random.default_rng(0).integers(0, len(company_df), request.param)
+
+@pytest.fixture
+def scaled_master(company_df, scaled_rows):
+    """The master resampled to scaled_rows: row i repeats master row scaled_rows[i]"""
+    return company_df.take(scaled_rows).reset_index(drop=True)
+
+
+class Timer:
+    """Times one block; the elapsed seconds are kept in .elapsed and recorded as a test report property"""
+
+    def __init__(self, record_property, label):
+        self.record_property = record_property
+        self.label = label
+        self.elapsed = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.elapsed = time.perf_counter() - self.start
+        self.record_property(self.label, round(self.elapsed, 6))
+
+
+@pytest.fixture
+def stopwatch(record_property):
+    """stopwatch(label) returns a Timer for a `with` block; benchmark timings go to the report, not stdout"""
+    return lambda label="seconds": Timer(record_property, label)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--metrics-file", default=None,
+                     help="Record validator call metrics and write them to this OpenMetrics file")
+    parser.addoption("--benchmark", action="store_true", default=False,
+                     help="Also run tests marked benchmark (full-size timing runs)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: full-size timing run, skipped unless --benchmark is given")
+    if config.getoption("--metrics-file"):
+        METRICS.enable()
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark: run with --benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session):
+    path = session.config.getoption("--metrics-file")
+    if path:
+        METRICS.write(path)
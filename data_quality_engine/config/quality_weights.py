@@ -7,3 +7,23 @@ FIELD_WEIGHTS = {
     "recency": 0.20,
     "accuracy": 0.15
 }
+
+# Revalidation priority terms (see validators/revalidation_scheduler.py)
+REVALIDATION_WEIGHTS = {
+    "staleness": 1.0,      # per year past the 12-month recency window
+    "source_tier": 0.5,    # per tier below Tier 1: weaker sources are re-checked first
+    "quality_deficit": 1.0,
+    "field_weight": 1.0,
+}
+
+# Caps and grade thresholds for scoring (TC-15.5)
+QUALITY_RULES_PATH = "rules/rules/test_tc_15_5.json"
+CRITICAL_FIELD_CAP = 0.65
+
+# Company master columns holding each scored field (recency and accuracy are not master columns)
+MASTER_FIELD_COLUMNS = {
+    "revenue": "annual_revenue",
+    "funding": "total_capital_raised",
+    "logo": "logo_url",
+    "website": "website_url",
+}
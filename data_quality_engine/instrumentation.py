@@ -0,0 +1,7 @@
+"""Validator metrics from validators.instrumentation when that package is importable, otherwise no-ops."""
+
+try:
+    from validators.instrumentation import instrument
+except ImportError:  # engine used on its own, or run from inside data_quality_engine/ where validators is ours
+    def instrument(**options):
+        return lambda fn: fn
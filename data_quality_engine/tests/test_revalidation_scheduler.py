@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from data_quality_engine.validators.revalidation_scheduler import RevalidationScheduler, revalidation_priority
+
+
+def _date(months_ago):
+    return (datetime.today() - timedelta(days=31 * months_ago)).strftime("%Y-%m-%d")
+
+
+def _record(company_id, months_ago, source_type="Crunchbase", **fields):
+    return {"company_id": company_id, "last_updated": _date(months_ago), "source_type": source_type,
+            "revenue": "2B", "funding": "1B", **fields}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_only_outdated_records_are_due():
+    assert revalidation_priority(_record("a", 1)) is None
+    assert revalidation_priority(_record("a", 8)) is None
+    assert revalidation_priority(_record("a", 20)) > 0
+
+
+def test_priority_uses_the_given_today():
+    record = {"company_id": "a", "last_updated": "2020-01-15", "source_type": "Crunchbase", "revenue": "2B"}
+    assert revalidation_priority(record, today=datetime(2020, 6, 1)) is None
+    assert revalidation_priority(record, today=datetime(2022, 1, 1)) > 0
+    assert revalidation_priority({**record, "last_updated": "2030-01-01"}, today=datetime(2031, 6, 1)) > 0
+
+
+def test_priority_orders_staleness_tier_and_fields():
+    base = revalidation_priority(_record("a", 20))
+    assert revalidation_priority(_record("a", 40)) > base
+    assert revalidation_priority(_record("a", 20, source_type="Blog")) > base
+    assert revalidation_priority(_record("a", 20, source_type="SEC 10-K")) < base
+    assert revalidation_priority(_record("a", 20, stale_fields=["logo"])) < base
+
+
+def test_batches_follow_priority_and_rate_limit():
+    clock = FakeClock()
+    scheduler = RevalidationScheduler(rate=2, burst=3, clock=clock)
+    for company_id, priority in [("a", 1.0), ("b", 5.0), ("c", 3.0), ("d", 4.0), ("e", 2.0)]:
+        scheduler.push(company_id, priority)
+
+    assert [c for c, _ in scheduler.dequeue_batch(10)] == ["b", "d", "c"]
+    assert scheduler.dequeue_batch(10) == []
+    clock.now = 0.5
+    assert [c for c, _ in scheduler.dequeue_batch(10)] == ["e"]
+    clock.now = 10
+    assert [c for c, _ in scheduler.dequeue_batch(10)] == ["a"]
+    assert len(scheduler) == 0
+
+
+def test_recency_changes_update_in_place():
+    scheduler = RevalidationScheduler(rate=100)
+    scheduler.schedule(_record("a", 20))
+    scheduler.schedule(_record("b", 30))
+    assert scheduler.peek()[0] == "b"
+
+    scheduler.schedule(_record("a", 60))
+    assert scheduler.peek()[0] == "a"
+    # Revalidated: fresh again, so it leaves the queue
+    scheduler.schedule(_record("a", 0))
+    assert "a" not in scheduler
+    assert [c for c, _ in scheduler.dequeue_batch(10)] == ["b"]
+
+
+def test_state_survives_restart(tmp_path):
+    clock = FakeClock()
+    scheduler = RevalidationScheduler(rate=1, burst=5, clock=clock)
+    for i in range(50):
+        scheduler.push(f"c{i}", i % 7)
+    scheduler.remove("c6")
+    scheduler.dequeue_batch(2)
+    path = tmp_path / "queue.json"
+    scheduler.save(path)
+
+    restored = RevalidationScheduler.load(path, clock=clock)
+    assert len(restored) == len(scheduler) == 47
+    assert restored.tokens == pytest.approx(3)
+    restored.tokens = scheduler.tokens = 100
+    assert restored.dequeue_batch(100) == scheduler.dequeue_batch(100)
+
+
+def test_many_updates_stay_compact():
+    scheduler = RevalidationScheduler(rate=1_000_000, burst=1_000_000)
+    for round_ in range(20):
+        for i in range(1000):
+            scheduler.push(i, (i * 7919 + round_) % 1000)
+    assert len(scheduler) == 1000
+    assert len(scheduler._heap) <= 3 * len(scheduler)
+    priorities = [p for _, p in scheduler.dequeue_batch(1000)]
+    assert priorities == sorted(priorities, reverse=True)
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_quality_engine.validators.confidence_validator import validate_confidence
+from data_quality_engine.validators.quality_score_engine import GRADES, assign_grade, compute_quality_score
+from data_quality_engine.validators.recency_validator import calculate_recency
+from data_quality_engine.validators.scorecard_pipeline import CONFIDENCE_CODES, RECENCY_CODES, ScorecardPipeline
+from data_quality_engine.validators.source_tier_validator import assign_source_tier
+
+
+def _date(days_ago):
+    return (datetime.today() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+
+
+FRAME = pd.DataFrame([
+    {"company_id": 1, "generation_method": "LLM_Inferred", "source_type": "SEC 10-K", "last_updated": _date(10),
+     "revenue": "2B", "funding": "1B", "logo": "l.png", "website": "x.com", "accuracy": 0.9},
+    {"company_id": 2, "source": "SEC filing", "source_name": "Crunchbase", "last_updated": _date(200),
+     "revenue": "2B", "website": "x.com"},
+    {"company_id": 3, "derivation_logic": "peer multiple", "source_type": "Blog", "last_updated": _date(800),
+     "revenue": "2B", "funding": "1B", "logo": "l.png", "website": "x.com", "recency": "old", "accuracy": 0.9},
+    {"company_id": 4, "Confidence_Level": "Low", "source_name": "Unknown Wiki", "last_updated": _date(40),
+     "logo": "l.png"},
+    {"company_id": 5, "source_type": "Market Intelligence", "last_updated": _date(100), "funding": "1B"},
+])
+
+
+def _reference(record):
+    """The four per-record validators, merged by hand"""
+    record = {key: value for key, value in record.items() if not pd.isna(value)}
+    confidence = validate_confidence(record)
+    recency = calculate_recency(record["last_updated"])
+    score = compute_quality_score({**record, **recency})
+    return {
+        "source_tier": assign_source_tier(record.get("source_name"), record.get("source_type"))["source_tier"],
+        "confidence": "Estimated" if confidence.get("Flag") == "Estimated" else confidence["Confidence_Level"],
+        "recency": recency["recency_status"],
+        "score": score,
+        "grade": assign_grade(score),
+    }
+
+
+def test_matches_per_record_validators():
+    table = ScorecardPipeline().run(FRAME)
+
+    for record in FRAME.to_dict("records"):
+        row = {column: table[column].loc[record["company_id"]] for column in table.columns}
+        expected = _reference(record)
+        assert row["source_tier"] == expected["source_tier"]
+        assert CONFIDENCE_CODES[row["confidence_code"]] == expected["confidence"]
+        assert RECENCY_CODES[row["recency_code"]] == expected["recency"]
+        assert row["score"] == pytest.approx(expected["score"], abs=1e-6)
+        assert GRADES[row["grade_code"]] == expected["grade"]
+
+
+def test_rejected_rows_get_invalid_codes():
+    frame = pd.DataFrame([
+        {"company_id": 1, "Confidence_Level": "High", "last_updated": _date(-40)},
+        {"company_id": 2, "Confidence_Level": "Medium", "last_updated": "not a date"},
+    ])
+
+    table = ScorecardPipeline().run(frame)
+    assert [CONFIDENCE_CODES[c] for c in table["confidence_code"]] == ["Invalid", "Medium"]
+    assert [RECENCY_CODES[c] for c in table["recency_code"]] == ["Invalid", "Invalid"]
+
+
+def test_compact_table_and_stage_counters():
+    pipeline = ScorecardPipeline()
+    frame = pd.concat([FRAME] * 20_000, ignore_index=True)
+    table = pipeline.run(frame, id_column=None)
+    pipeline.run(FRAME)
+
+    assert table.dtypes.to_dict() == {
+        "source_tier": np.uint8, "confidence_code": np.uint8, "recency_code": np.uint8,
+        "score": np.float32, "grade_code": np.uint8,
+    }
+    assert pipeline.rows == {stage: len(frame) + len(FRAME) for stage in ("confidence", "tier", "recency", "score")}
+    assert all(seconds > 0 for seconds in pipeline.timings.values())
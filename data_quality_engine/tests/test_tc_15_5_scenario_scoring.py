@@ -0,0 +1,62 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_quality_engine.config.quality_weights import FIELD_WEIGHTS, MASTER_FIELD_COLUMNS
+from data_quality_engine.validators.quality_score_engine import (
+    GRADES, assign_grade, compute_quality_score, grade_matrix, score_scenarios,
+)
+
+RECORDS = [
+    {"revenue": "2B", "funding": "1B", "logo": "l.png", "website": "x.com", "recency": "2025-01", "accuracy": 0.9,
+     "recency_status": "Recent"},
+    {"revenue": "2B", "funding": "1B", "logo": "l.png", "website": "x.com", "recency": "2020-01", "accuracy": 0.9,
+     "recency_status": "Outdated"},
+    {"logo": "l.png", "website": "x.com", "recency": "2025-01", "accuracy": 0.9, "recency_status": "Recent"},
+    {"revenue": "2B", "website": "", "recency_status": "Acceptable"},
+    {"funding": None, "recency_status": "Recent"},
+]
+
+
+def test_single_scenario_matches_compute_quality_score():
+    result = score_scenarios(RECORDS)
+
+    expected = [compute_quality_score(record) for record in RECORDS]
+    np.testing.assert_allclose(result["scores"][:, 0], expected)
+    assert [GRADES[code] for code in result["grade_codes"][:, 0]] == [assign_grade(s) for s in expected]
+
+
+def test_caps_apply_to_every_scenario():
+    revenue_only = {"revenue": 1.0}
+    result = score_scenarios(RECORDS, {"default": FIELD_WEIGHTS, "revenue_only": revenue_only})
+
+    scores = pd.DataFrame(result["scores"], columns=result["scenarios"])
+    assert scores["revenue_only"].tolist() == [1.0, 0.75, 0.0, 1.0, 0.0]
+    assert result["grade_distribution"]["revenue_only"] == {"A": 2, "B": 1, "C": 0, "D": 2}
+
+
+def test_grade_matrix_matches_assign_grade_at_boundaries():
+    scores = np.array([0.0, 0.6 - 1e-12, 0.6, 0.75 - 1e-12, 0.75, 0.9 - 1e-12, 0.9, 1.0])
+
+    assert [GRADES[code] for code in grade_matrix(scores)] == [assign_grade(s) for s in scores]
+
+
+@pytest.mark.benchmark
+def test_fifty_scenarios_cost_about_one(company_df):
+    frame = pd.concat([company_df] * 2000, ignore_index=True)
+    rng = np.random.default_rng(0)
+    weight_sets = {f"s{k}": dict(zip(FIELD_WEIGHTS, rng.dirichlet(np.ones(len(FIELD_WEIGHTS)))))
+                   for k in range(50)}
+
+    start = time.perf_counter()
+    single = score_scenarios(frame, field_columns=MASTER_FIELD_COLUMNS)
+    one = time.perf_counter() - start
+    start = time.perf_counter()
+    many = score_scenarios(frame, weight_sets, field_columns=MASTER_FIELD_COLUMNS)
+    fifty = time.perf_counter() - start
+
+    assert many["scores"].shape == (len(frame), 50)
+    assert sum(single["grade_distribution"]["default"].values()) == len(frame)
+    assert fifty < 5 * one + 1.0
@@ -1,4 +1,8 @@
 
+from data_quality_engine.instrumentation import instrument
+
+
+@instrument(rule_id="TC-15.1")
 def validate_confidence(record):
     generation_method = record.get("generation_method")
     source = record.get("source")
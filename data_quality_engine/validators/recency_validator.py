@@ -1,9 +1,13 @@
 
 from datetime import datetime
 
-def calculate_recency(last_updated_date):
+from data_quality_engine.instrumentation import instrument
+
+
+@instrument(rule_id="TC-15.3", violations=lambda result: int(result.get("trigger_revalidation", False)))
+def calculate_recency(last_updated_date, today=None):
     date = datetime.strptime(last_updated_date, "%Y-%m-%d")
-    today = datetime.today()
+    today = today or datetime.today()
 
     if date > today:
         raise ValueError("ERR_DATE_INVALID")
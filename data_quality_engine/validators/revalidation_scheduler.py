@@ -0,0 +1,175 @@
+import heapq
+import itertools
+import json
+import os
+import time
+from datetime import datetime
+
+from data_quality_engine.config.quality_weights import FIELD_WEIGHTS, REVALIDATION_WEIGHTS
+from data_quality_engine.validators.quality_score_engine import compute_quality_score
+from data_quality_engine.validators.recency_validator import calculate_recency
+from data_quality_engine.validators.source_tier_validator import assign_source_tier
+
+# Fields whose values are re-enriched; recency and accuracy are properties of the record
+CONTENT_FIELDS = [field for field in FIELD_WEIGHTS if field not in ("recency", "accuracy")]
+
+STATE_VERSION = 1
+
+
+def months_since(last_updated_date, today=None):
+    date = datetime.strptime(last_updated_date, "%Y-%m-%d")
+    today = today or datetime.today()
+    return (today.year - date.year) * 12 + today.month - date.month
+
+
+def revalidation_priority(record, today=None):
+    """Priority of an Outdated record (higher is revalidated first); None when it is not due.
+
+    Sum of: years past the 12-month window, tiers below Tier 1 of its source,
+    quality score deficit, and the FIELD_WEIGHTS of the fields to re-enrich
+    (record["stale_fields"], or its populated content fields), each scaled by
+    REVALIDATION_WEIGHTS.
+    """
+    recency = calculate_recency(record["last_updated"], today)
+    if not recency.get("trigger_revalidation"):
+        return None
+
+    staleness = max(months_since(record["last_updated"], today) - 12, 0) / 12
+    tier = assign_source_tier(record.get("source_name"), record.get("source_type"))["source_tier"]
+    deficit = 1 - compute_quality_score({**record, "recency_status": recency["recency_status"]})
+    fields = record.get("stale_fields") or [f for f in CONTENT_FIELDS if record.get(f) not in [None, ""]]
+    field_weight = sum(FIELD_WEIGHTS.get(field, 0) for field in fields)
+
+    return round(
+        REVALIDATION_WEIGHTS["staleness"] * staleness
+        + REVALIDATION_WEIGHTS["source_tier"] * (tier - 1)
+        + REVALIDATION_WEIGHTS["quality_deficit"] * deficit
+        + REVALIDATION_WEIGHTS["field_weight"] * field_weight,
+        6,
+    )
+
+
+class RevalidationScheduler:
+    """Max-priority queue of companies awaiting revalidation, drained at a fixed rate.
+
+    Entries live in a binary heap; updating or removing a company marks its old
+    entry dead and (for updates) pushes a new one, so both are O(log n). Dead
+    entries are skipped on pop and dropped when they outnumber live ones.
+    Dequeues draw from a token bucket refilled at `rate` companies per second,
+    holding at most `burst` tokens.
+    """
+
+    def __init__(self, rate=10.0, burst=None, clock=time.monotonic):
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self.clock = clock
+        self.tokens = self.burst
+        self._refilled_at = clock()
+        self._heap = []
+        self._entries = {}
+        self._sequence = itertools.count()
+        self._dead = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, company_id):
+        return company_id in self._entries
+
+    def priority(self, company_id):
+        return -self._entries[company_id][0]
+
+    def push(self, company_id, priority):
+        """Add a company, or move it to a new priority"""
+        self.remove(company_id)
+        # Sequence breaks ties first-in first-out and keeps ids out of comparisons
+        entry = [-priority, next(self._sequence), company_id, True]
+        self._entries[company_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def remove(self, company_id):
+        entry = self._entries.pop(company_id, None)
+        if entry is None:
+            return False
+        entry[3] = False
+        self._dead += 1
+        if self._dead > len(self._entries) and self._dead > 64:
+            self._compact()
+        return True
+
+    def schedule(self, record, company_id=None, today=None):
+        """Queue or re-prioritize a record after its recency changed; records no longer due leave the queue"""
+        company_id = company_id if company_id is not None else record["company_id"]
+        priority = revalidation_priority(record, today)
+        if priority is None:
+            self.remove(company_id)
+        else:
+            self.push(company_id, priority)
+        return priority
+
+    def peek(self):
+        self._drop_dead()
+        if not self._heap:
+            return None
+        priority, _, company_id, _ = self._heap[0]
+        return company_id, -priority
+
+    def _drop_dead(self):
+        while self._heap and not self._heap[0][3]:
+            heapq.heappop(self._heap)
+            self._dead -= 1
+
+    def _compact(self):
+        self._heap = [entry for entry in self._heap if entry[3]]
+        heapq.heapify(self._heap)
+        self._dead = 0
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def dequeue_batch(self, max_items):
+        """Highest-priority companies, at most max_items and at most the tokens available"""
+        self._refill()
+        batch = []
+        while len(batch) < max_items and self.tokens >= 1:
+            self._drop_dead()
+            if not self._heap:
+                break
+            priority, _, company_id, _ = heapq.heappop(self._heap)
+            del self._entries[company_id]
+            self.tokens -= 1
+            batch.append((company_id, -priority))
+        return batch
+
+    def save(self, path):
+        """Write the live queue and bucket state to a JSON file (atomically, via a temp file)"""
+        self._refill()
+        entries = sorted((entry for entry in self._entries.values()), key=lambda entry: entry[:2])
+        state = {
+            "version": STATE_VERSION,
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": self.tokens,
+            "queue": [[company_id, -priority] for priority, _, company_id, _ in entries],
+        }
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, clock=time.monotonic):
+        with open(path) as f:
+            state = json.load(f)
+        if state.get("version") != STATE_VERSION:
+            raise ValueError(f"Unsupported scheduler state version: {state.get('version')}")
+        scheduler = cls(rate=state["rate"], burst=state["burst"], clock=clock)
+        scheduler.tokens = state["tokens"]
+        # Saved in pop order, so re-numbering keeps tie order and the list is already a heap
+        for company_id, priority in state["queue"]:
+            entry = [-priority, next(scheduler._sequence), company_id, True]
+            scheduler._entries[company_id] = entry
+            scheduler._heap.append(entry)
+        return scheduler
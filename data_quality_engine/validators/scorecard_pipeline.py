@@ -0,0 +1,105 @@
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from data_quality_engine.config.source_tier_mapping import SOURCE_TIERS
+from data_quality_engine.validators.quality_score_engine import load_quality_rules, score_scenarios
+from data_quality_engine.instrumentation import instrument
+
+# Result codes (uint8 positions); "Invalid" marks rows the per-record validators reject with an error
+CONFIDENCE_CODES = ("High", "Medium", "Low", "Estimated", "Invalid")
+RECENCY_CODES = ("Recent", "Acceptable", "Outdated", "Invalid")
+
+
+def _text(frame, column):
+    if column not in frame.columns:
+        return pd.Series("", index=frame.index, dtype=object)
+    return frame[column].astype(object).where(frame[column].notna(), "")
+
+
+def _confidence_stage(frame, columns):
+    """validate_confidence over columns: the first matching rule wins"""
+    method, source = _text(frame, "generation_method"), _text(frame, "source")
+    derivation, level = _text(frame, "derivation_logic"), _text(frame, "Confidence_Level")
+    stated = level.map({code: i for i, code in enumerate(CONFIDENCE_CODES[:3])})
+    codes = np.select(
+        [
+            (method == "LLM_Inferred").to_numpy(),
+            source.astype(str).str.contains("SEC", regex=False).to_numpy(),
+            (derivation != "").to_numpy(),
+            ((level == "High") & (source == "")).to_numpy(),
+            (level == "").to_numpy(),
+        ],
+        [CONFIDENCE_CODES.index(code) for code in ("Low", "High", "Estimated", "Invalid", "Medium")],
+        default=stated.fillna(CONFIDENCE_CODES.index("Invalid")).to_numpy(),
+    )
+    return {"confidence_code": codes.astype(np.uint8)}
+
+
+def _tier_stage(frame, columns):
+    """assign_source_tier over columns: source type first, then source name, else Tier 3"""
+    by_type = _text(frame, "source_type").map(SOURCE_TIERS)
+    by_name = _text(frame, "source_name").map(SOURCE_TIERS)
+    return {"source_tier": by_type.fillna(by_name).fillna(3).to_numpy(dtype=np.uint8)}
+
+
+def _recency_stage(frame, columns, today):
+    """calculate_recency over columns; unparseable or future dates are Invalid"""
+    dates = pd.to_datetime(_text(frame, "last_updated"), format="%Y-%m-%d", errors="coerce")
+    months = ((today.year - dates.dt.year) * 12 + today.month - dates.dt.month).to_numpy(dtype=float)
+    invalid = (dates.isna() | (dates > pd.Timestamp(today))).to_numpy()
+    codes = np.select(
+        [invalid, months <= 3, months <= 12],
+        [RECENCY_CODES.index(code) for code in ("Invalid", "Recent", "Acceptable")],
+        default=RECENCY_CODES.index("Outdated"),
+    )
+    return {"recency_code": codes.astype(np.uint8)}
+
+
+class ScorecardPipeline:
+    """Confidence, source tier, recency and quality score for every company in one column pass.
+
+    Each stage declares the stage outputs it reads; run() executes them in order
+    over whole columns, so the recency codes feed the score's recency cap
+    directly and no per-record dicts are built. Elapsed seconds and rows per
+    stage accumulate in `timings` and `rows` across runs.
+    """
+
+    def __init__(self, field_columns=None, rules=None, today=None):
+        self.field_columns = field_columns
+        self.rules = rules or load_quality_rules()
+        self.today = today
+        self.stages = [
+            ("confidence", (), _confidence_stage),
+            ("tier", (), _tier_stage),
+            ("recency", (), lambda frame, columns: _recency_stage(frame, columns, self.today or datetime.today())),
+            ("score", ("recency_code",), self._score_stage),
+        ]
+        self.timings = {name: 0.0 for name, _, _ in self.stages}
+        self.rows = {name: 0 for name, _, _ in self.stages}
+
+    def _score_stage(self, frame, columns):
+        status = np.asarray(RECENCY_CODES, dtype=object)[columns["recency_code"]]
+        result = score_scenarios(frame, recency_status=status, field_columns=self.field_columns, rules=self.rules)
+        return {"score": result["scores"][:, 0].astype(np.float32), "grade_code": result["grade_codes"][:, 0]}
+
+    @instrument(rows=len)
+    def run(self, frame, id_column="company_id"):
+        """One row per company: source_tier, confidence_code, recency_code, score and grade_code"""
+        columns = {}
+        for name, requires, stage in self.stages:
+            missing = [column for column in requires if column not in columns]
+            if missing:
+                raise ValueError(f"Stage '{name}' runs before its inputs {missing}")
+            start = time.perf_counter()
+            columns.update(stage(frame, columns))
+            self.timings[name] += time.perf_counter() - start
+            self.rows[name] += len(frame)
+
+        index = pd.Index(frame[id_column], name=id_column) if id_column in frame.columns else frame.index
+        return pd.DataFrame(
+            {key: columns[key] for key in ("source_tier", "confidence_code", "recency_code", "score", "grade_code")},
+            index=index,
+        )
@@ -1,12 +1,16 @@
 
 from data_quality_engine.config.source_tier_mapping import SOURCE_TIERS
+from data_quality_engine.instrumentation import instrument
 
+
+@instrument(rule_id="TC-15.2", violations=lambda result: int("validation_message" in result))
 def assign_source_tier(source_name, source_type):
     tier = SOURCE_TIERS.get(source_type) or SOURCE_TIERS.get(source_name)
     if not tier:
         return {"source_tier": 3, "validation_message": "Caution: Unverified Source"}
     return {"source_tier": tier, "is_verified": tier in [1,2]}
 
+@instrument(rule_id="TC-15.2")
 def resolve_multiple_sources(sources):
     tiers = []
     for src in sources:
@@ -0,0 +1,108 @@
+"""
+Streaming Column Profiler
+Tests the HyperLogLog and t-digest sketches, chunk/merge equivalence, null
+placeholder counters, rules checks and one-pass profiling of the master
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validators.column_profiler import HyperLogLog, StreamingProfiler, TDigest, check_profile
+from validators.null_tokens import NULL_TOKENS
+
+MASTER_CSV = "data/Company Master(Flat Companies Data).csv"
+
+
+@pytest.mark.parametrize("n", [10, 1_000, 100_000])
+def test_hyperloglog_estimate(n):
+    sketch = HyperLogLog()
+    sketch.add_hashes(pd.util.hash_array(np.arange(n)))
+    sketch.add_hashes(pd.util.hash_array(np.arange(n)))  # duplicates do not count
+
+    assert sketch.count() == pytest.approx(n, rel=0.05)
+
+
+def test_sketches_merge_to_the_union():
+    left, right, whole = HyperLogLog(), HyperLogLog(), HyperLogLog()
+    left.add_hashes(pd.util.hash_array(np.arange(0, 6000)))
+    right.add_hashes(pd.util.hash_array(np.arange(4000, 10000)))
+    whole.add_hashes(pd.util.hash_array(np.arange(0, 10000)))
+    left.merge(right)
+    np.testing.assert_array_equal(left.registers, whole.registers)
+
+    values = np.random.default_rng(0).lognormal(size=200_000)
+    digest, parts = TDigest(), [TDigest() for _ in range(4)]
+    digest.add(values)
+    for part, chunk in zip(parts, np.array_split(values, 4)):
+        part.add(chunk)
+    for part in parts[1:]:
+        parts[0].merge(part)
+    for q in (0.01, 0.5, 0.99):
+        expected = np.quantile(values, q)
+        assert digest.quantile(q) == pytest.approx(expected, rel=0.02)
+        assert parts[0].quantile(q) == pytest.approx(expected, rel=0.02)
+    assert len(digest.means) < 300
+
+
+def test_chunked_profile_matches_single_pass():
+    frame = pd.read_csv(MASTER_CSV, dtype=str, keep_default_na=False, na_values=[""])
+    whole = StreamingProfiler().update(frame).summary()
+    chunked = StreamingProfiler().profile_csv(MASTER_CSV, chunksize=25).summary()
+
+    assert chunked["rows"] == whole["rows"] == len(frame) and chunked["chunks"] == 6
+    for column in ("name", "burn_rate", "glassdoor_rating"):
+        for key in ("rows", "null_count", "null_tokens", "distinct_estimate", "values"):
+            assert chunked["columns"][column][key] == whole["columns"][column][key]
+        assert chunked["columns"][column]["length"]["max"] == whole["columns"][column]["length"]["max"]
+
+
+def test_null_tokens_match_null_handler():
+    frame = pd.read_csv(MASTER_CSV, dtype=str, keep_default_na=False, na_values=[""])
+    summary = StreamingProfiler().profile_csv(MASTER_CSV, chunksize=50).summary()
+
+    for column in ("burn_rate", "net_promoter_score", "key_investors"):
+        lowered = frame[column].str.strip().str.lower()
+        expected = int((frame[column].isna() | lowered.isin(NULL_TOKENS)).sum())
+        assert summary["columns"][column]["null_count"] == expected
+        assert set(summary["columns"][column]["null_tokens"]) <= NULL_TOKENS | {"<null>"}
+
+
+def test_profile_checks_rules(load_rules, tmp_path):
+    profiler = StreamingProfiler().profile_csv(MASTER_CSV)
+    summary = profiler.save(str(tmp_path / "profile.json"))
+    assert json.load(open(tmp_path / "profile.json")) == json.loads(json.dumps(summary))
+
+    violations = check_profile(summary, load_rules)
+    # Sentiment holds free text ("Very Positive", "82/100", sentences) rather than the three labels
+    assert [(v["column"], v["check"]) for v in violations] == [("brand_sentiment_score", "enum")]
+    assert summary["columns"]["glassdoor_rating"]["numeric"]["max"] <= 5
+
+    profiler.update(pd.DataFrame({"glassdoor_rating": ["7.5/5"]}))
+    assert any(v["column"] == "glassdoor_rating" and v["check"] == "max"
+               for v in check_profile(profiler.summary(), load_rules))
+
+    sentiment = StreamingProfiler().update(pd.DataFrame({"brand_sentiment_score": ["Positive", "Great", "Great "]}))
+    assert check_profile(sentiment.summary(), load_rules)[0]["observed"] == {"Great": 2}
+
+
+def test_streaming_profile_benchmark(scaled_master, stopwatch):
+    """Fixed sketch memory per column; chunks are profiled as they arrive"""
+    n = len(scaled_master)
+    chunk = n // 4
+    profiler = StreamingProfiler()
+
+    with stopwatch():
+        for begin in range(0, n, chunk):
+            profiler.update(scaled_master.iloc[begin:begin + chunk])
+        summary = profiler.summary()
+
+    assert summary["rows"] == n and summary["chunks"] == 4
+    name = summary["columns"]["name"]
+    assert name["distinct_estimate"] == pytest.approx(scaled_master["name"].nunique(), rel=0.05)
+    # Exact counters add up across chunks to the counts over the whole sample
+    assert name["null_count"] == scaled_master["name"].isna().sum()
+    assert summary["columns"]["company_type"]["values"] == \
+        scaled_master["company_type"].str.strip().value_counts().to_dict()
@@ -0,0 +1,79 @@
+"""
+Immutable Company Records
+Tests structural sharing, freezing and copy-on-write updates
+"""
+
+import gc
+
+import pytest
+
+from validators.company_record import CompanyRecord, RecordSchema
+from validators.row_view import ColumnStore
+
+
+def test_records_share_interned_schema():
+    """Records with the same fields share one schema object"""
+    first = CompanyRecord.of({"name": "Acme", "revenue": "$2B"})
+    second = CompanyRecord.of({"name": "Beta", "revenue": "NA"})
+    
+    assert first.schema is second.schema
+    assert first.schema is RecordSchema.for_fields(["name", "revenue"])
+    assert CompanyRecord.of(first) is first
+
+
+def test_unused_schemas_are_released():
+    """The intern table does not keep a schema alive once no record uses it"""
+    fields = ("one_off_field_a", "one_off_field_b")
+    record = CompanyRecord.of(dict.fromkeys(fields))
+    
+    assert fields in RecordSchema._interned
+    del record
+    gc.collect()
+    assert fields not in RecordSchema._interned
+
+
+def test_nested_values_are_frozen():
+    """Lists, sets and dicts become tuples, frozensets and records"""
+    record = CompanyRecord.of({
+        "offices": ["Austin", "Pune"],
+        "sectors": {"AI"},
+        "ceo": {"name": "Jane Doe"},
+    })
+    
+    assert record["offices"] == ("Austin", "Pune")
+    assert record["sectors"] == frozenset({"AI"})
+    assert isinstance(record["ceo"], CompanyRecord)
+    assert hash(record) == hash(CompanyRecord.of(record.to_dict()))
+
+
+def test_records_are_read_only():
+    """Item and attribute assignment are rejected"""
+    record = CompanyRecord.of({"name": "Acme"})
+    
+    with pytest.raises(TypeError):
+        record["name"] = "Other"
+    with pytest.raises(AttributeError):
+        record._values = ("Other",)
+
+
+def test_copy_on_write_update():
+    """set() returns a new record and leaves the original untouched"""
+    record = CompanyRecord.of({"name": "Acme", "offices": ["Austin"]})
+    renamed = record.set("name", "Beta")
+    extended = record.set("founded", 1999)
+    
+    assert record["name"] == "Acme" and renamed["name"] == "Beta"
+    assert renamed["offices"] is record["offices"]
+    assert list(extended) == ["name", "offices", "founded"]
+    assert record == {"name": "Acme", "offices": ("Austin",)}
+
+
+def test_from_row_matches_series(company_df):
+    """Records built from a Series or a RowView hold the same values"""
+    fields = ["name", "focus_sectors", "employee_size"]
+    store = ColumnStore(company_df)
+    
+    for idx in range(0, len(company_df), 25):
+        from_series = CompanyRecord.from_row(company_df.iloc[idx], fields)
+        from_view = CompanyRecord.from_row(store.row(idx), fields)
+        assert from_series.to_dict() == from_view.to_dict()
@@ -0,0 +1,133 @@
+"""
+Declarative Cross-field Constraints
+Tests expression compilation, number parsing, three-valued logic and whole-frame evaluation
+"""
+
+import json
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validators.constraint_engine import CONSTRAINTS_PATH, ColumnContext, Constraint, ConstraintEngine
+
+
+def _violations(constraint: dict, frame: pd.DataFrame) -> list:
+    return ConstraintEngine([constraint]).evaluate(frame)["constraints"][constraint["id"]]["rows"]
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("$2–3B (India operations estimated)", 2.5e9),
+    ("1,200 employees", 1200.0),
+    ("$45–55 billion", 50e9),
+    ("$1.5T global enterprise IT", 1.5e12),
+    ("₹508 crore", 508e7 * 0.012),
+    ("AUD 29.3 billion", 29.3e9 * 0.66),
+    ("12%", np.nan),
+    ("Medium", np.nan),
+    ("Not Disclosed", np.nan),
+])
+def test_number_parsing(value, expected):
+    ctx = ColumnContext(pd.DataFrame({"x": [value]}), currency_rates={"INR": 0.012, "AUD": 0.66})
+    
+    assert ctx.number("x")[0] == pytest.approx(expected, nan_ok=True)
+
+
+def test_percent_only_for_percentages():
+    ctx = ColumnContext(pd.DataFrame({"share": ["5–7% of global IT", "$5B", None]}))
+    
+    np.testing.assert_array_equal(ctx.percent("share"), [6.0, np.nan, np.nan])
+
+
+def test_chained_comparison_and_unknowns():
+    """tam >= sam >= som: any broken link violates; a missing or textual size is unknown, not a violation"""
+    frame = pd.DataFrame({
+        "tam": ["$500B", "$10B", "$10B", "$10B", "Large"],
+        "sam": ["$50B", "$20B", "$5B", None, "$1B"],
+        "som": ["$5B", "$1B", "$8B", "$1B", "$2B"],
+    })
+    
+    assert _violations({"id": "T", "require": "tam >= sam >= som"}, frame) == [1, 2]
+
+
+def test_boolean_operators_follow_three_valued_logic():
+    frame = pd.DataFrame({"a": ["1", None, "5"], "b": ["2", "x", None]})
+    
+    # "a > 3 or present(b)": row 1 is known true through present(b) even though a is unknown
+    assert _violations({"id": "OR", "require": "a > 3 or present(b)"}, frame) == []
+    # "a < 3 and b < 3": row 2 is known false through a, row 1 stays unknown
+    assert _violations({"id": "AND", "require": "a < 3 and b < 3"}, frame) == [2]
+    assert _violations({"id": "NOT", "require": "not (a < 3)"}, frame) == [0]
+
+
+def test_when_restricts_rows():
+    frame = pd.DataFrame({"annual_profit": ["$1B", None, "N/A", "$2B"], "annual_revenue": [None, None, None, "$5B"]})
+    constraint = {"id": "CF", "when": "present(annual_profit)", "require": "present(annual_revenue)"}
+    
+    report = ConstraintEngine([constraint]).evaluate(frame)["constraints"]["CF"]
+    assert report["applicable"] == 2 and report["violations"] == 1 and report["rows"] == [0]
+
+
+@pytest.mark.parametrize("expression, message", [
+    ("tam >=", "cannot parse"),
+    ("tam + sam", "is a number"),
+    ("present(tam) + 1", "is a condition"),
+    ("__import__('os')", "unsupported expression"),
+    ("tam.real > 1", "unsupported expression"),
+])
+def test_invalid_expressions_rejected(expression, message):
+    with pytest.raises(ValueError, match=message):
+        Constraint("BAD", expression)
+
+
+def test_duplicate_ids_and_missing_columns():
+    with pytest.raises(ValueError, match="Duplicate constraint ids"):
+        ConstraintEngine([{"id": "X", "require": "a > 0"}, {"id": "X", "require": "b > 0"}])
+    
+    report = ConstraintEngine([{"id": "X", "require": "a > 0"}, {"id": "Y", "require": "zzz > 0"}]).evaluate(
+        pd.DataFrame({"a": [1.0, -1.0]}))
+    assert report["skipped"] == {"Y": ["zzz"]}
+    assert report["constraints"]["X"]["rows"] == [1]
+
+
+def test_current_year_is_bound_by_the_engine():
+    """current_year is not a column: it comes from the engine's date, so CF-08 does not go stale"""
+    frame = pd.DataFrame({"incorporation_year": [1999, 2026, 2027, None]})
+    constraint = {"id": "CF-08", "require": "1600 <= incorporation_year <= current_year"}
+    
+    rows = lambda engine: engine.evaluate(frame)["constraints"]["CF-08"]["rows"]
+    
+    assert rows(ConstraintEngine([constraint], today=date(2026, 10, 19))) == [2]
+    assert rows(ConstraintEngine([constraint], today=date(2025, 1, 1))) == [1, 2]
+    assert rows(ConstraintEngine.from_rules()) == \
+        [i for i, year in enumerate(frame["incorporation_year"]) if year > date.today().year]
+
+
+def test_master_constraints(company_df):
+    """Every rule-file constraint compiles and runs over the master; counts match the violation matrix"""
+    with open(CONSTRAINTS_PATH) as f:
+        ids = [constraint["id"] for constraint in json.load(f)["constraints"]]
+    report = ConstraintEngine.from_rules().evaluate(company_df)
+    
+    assert list(report["constraints"]) == ids and not report["skipped"]
+    assert list(report["violations"].columns) == ids
+    for constraint_id, result in report["constraints"].items():
+        assert result["violations"] == int(report["violations"][constraint_id].sum()) == len(result["rows"])
+        assert result["violations"] <= result["applicable"]
+    assert report["violating_rows"] == int(report["violations"].any(axis=1).sum())
+
+
+def test_constraint_evaluation_benchmark(company_df, scaled_master, scaled_rows, stopwatch):
+    """All constraints over n rows in one pass; each column is parsed once"""
+    engine = ConstraintEngine.from_rules()
+    
+    with stopwatch():
+        report = engine.evaluate(scaled_master, max_rows=100)
+    
+    # A resampled row violates exactly what its master row violates
+    expected = engine.evaluate(company_df)["violations"].take(scaled_rows).reset_index(drop=True)
+    pd.testing.assert_frame_equal(report["violations"], expected)
+    for constraint_id, result in report["constraints"].items():
+        assert result["violations"] == expected[constraint_id].sum()
+        assert result["rows"] == np.flatnonzero(expected[constraint_id])[:100].tolist()
@@ -0,0 +1,90 @@
+"""
+Contact Field Format Validation
+Tests URL, social host, handle, email and phone violation codes, the host memo and scaling
+"""
+
+import pandas as pd
+import pytest
+
+from validators.contact_fields import CODES, CONTACT_FIELDS, ContactFieldValidator, HostMemo
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return ContactFieldValidator()
+
+
+@pytest.mark.parametrize("column, value, code", [
+    ("website_url", "https://www.example.com", "OK"),
+    ("website_url", "https://example.com:8443/about?x=1", "OK"),
+    ("website_url", "example.com", "MISSING_SCHEME"),
+    ("website_url", "Official website", "INVALID_URL"),
+    ("website_url", "https://www.example.com ​", "INVALID_URL"),
+    ("website_url", "N/A", "NULL"),
+    ("linkedin_url", "https://www.linkedin.com/company/acme/", "OK"),
+    ("linkedin_url", "https://in.linkedin.com/company/acme", "OK"),
+    ("linkedin_url", "https://www.linkedin.com/", "MISSING_PROFILE_PATH"),
+    ("linkedin_url", "https://www.facebook.com/company/acme", "WRONG_HOST"),
+    ("linkedin_url", "https://notlinkedin.com/company/acme", "WRONG_HOST"),
+    ("twitter_handle", "@Acme_HQ", "OK"),
+    ("twitter_handle", "https://x.com/AcmeHQ", "OK"),
+    ("twitter_handle", "@acme corp", "INVALID_HANDLE"),
+    ("twitter_handle", "https://twitter.com/averyveryverylonghandle", "MISSING_PROFILE_PATH"),
+    ("facebook_url", "https://fb.com/acme", "OK"),
+    ("instagram_url", "https://www.instagram.com/acme.hq/", "OK"),
+    ("marketing_video_url", "https://www.youtube.com/@Acme", "OK"),
+    ("marketing_video_url", "https://vimeo.com/12345", "OK"),
+    ("marketing_video_url", "Available on YouTube", "INVALID_URL"),
+    ("primary_contact_email", "press.team+eu@acme.co.uk", "OK"),
+    ("primary_contact_email", "sales@acme.com; info@acme.com", "INVALID_EMAIL"),
+    ("primary_phone_number", "+1 (650) 857-1501", "OK"),
+    ("primary_phone_number", "+49 711 400 40990 ext. 12", "OK"),
+    ("primary_phone_number", "5273", "PHONE_LENGTH"),
+    ("primary_phone_number", "+91-124-4903344 (Acme)", "INVALID_PHONE"),
+    ("primary_phone_number", "Not Found", "NULL"),
+])
+def test_violation_codes(validator, column, value, code):
+    assert validator.validate_column(pd.Series([value]), column).iloc[0] == code
+
+
+def test_host_memo_checks_each_host_once():
+    memo = HostMemo()
+    validator = ContactFieldValidator(host_memo=memo)
+    urls = pd.Series(["https://www.linkedin.com/company/a", "https://www.linkedin.com/company/b",
+                      "https://in.linkedin.com/company/c", None] * 50)
+    
+    codes = validator.validate_column(urls, "linkedin_url")
+    validator.validate_column(urls, "linkedin_url")
+    
+    assert (codes[urls.notna()] == "OK").all() and (codes[urls.isna()] == "NULL").all()
+    assert memo.misses == 2 and memo.hits == 2
+
+
+def test_master_contact_fields(validator, company_df):
+    """Every configured column is checked; codes are categorical and counts add up"""
+    report = validator.validate(company_df)
+    codes = report["codes"]
+    
+    assert report["missing_columns"] == []
+    assert list(codes.columns) == list(CONTACT_FIELDS)
+    assert all(isinstance(codes[column].dtype, pd.CategoricalDtype) for column in codes)
+    for column, counts in report["violations"].items():
+        assert sum(counts.values()) == int((~codes[column].isin(["OK", "NULL"])).sum())
+        assert set(counts) <= set(CODES) - {"OK", "NULL"}
+    # Descriptive text instead of a link is the most common problem in the video column
+    assert report["violations"]["marketing_video_url"]["INVALID_URL"] > 0
+    assert (codes["website_url"][company_df["website_url"].isna()] == "NULL").all()
+
+
+def test_contact_validation_benchmark(company_df, scaled_master, scaled_rows, stopwatch):
+    """One column-wise pass over n rows; host checks stay proportional to distinct hosts"""
+    columns = list(CONTACT_FIELDS)
+    validator = ContactFieldValidator()
+    
+    with stopwatch():
+        report = validator.validate(scaled_master[columns])
+    
+    master_codes = ContactFieldValidator().validate(company_df)["codes"]
+    assert validator.host_memo.misses <= company_df[columns].nunique().sum()
+    # Each sampled row carries exactly the codes of the master row it repeats
+    pd.testing.assert_frame_equal(report["codes"], master_codes.take(scaled_rows).reset_index(drop=True))
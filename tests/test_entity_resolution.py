@@ -0,0 +1,96 @@
+"""
+Company-name Entity Resolution (TC-13.4-01 no name leakage)
+Tests name normalization, blocking keys, duplicate clusters and scaling
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validators.entity_resolution import (
+    NameBlockingIndex, find_duplicate_companies, name_similarity, normalize_name, soundex
+)
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("Groww Invest Tech Pvt. Ltd.", "groww invest tech"),
+    ("Google LLC (Subsidiary of Alphabet Inc.)", "google"),
+    ("The Bank of New York Mellon Corporation", "bank of new york mellon"),
+    ("Larsen & Toubro Infotech Limited", "larsen and toubro infotech"),
+    ("Smith & Co.", "smith"),
+    ("Johnson and Company Ltd", "johnson"),
+    ("Byju’s", "byjus"),
+    ("Nestlé S.A.", "nestle"),
+    ("Koninklijke Philips N.V.", "koninklijke philips"),
+    ("Ferrari S.p.A.", "ferrari"),
+    ("Siemens A G", "siemens"),
+    ("J B Hunt", "j b hunt"),
+    ("Limited", "limited"),
+    (None, ""),
+])
+def test_normalize_name(name, expected):
+    assert normalize_name(name) == expected
+
+
+def test_soundex():
+    assert [soundex(w) for w in ["robert", "rupert", "tymczak", "pfister", "ashcraft"]] == \
+        ["R163", "R163", "T522", "P236", "A261"]
+
+
+@pytest.mark.parametrize("a, b, same", [
+    ("Infosys Limited", "Infosys Ltd", True),
+    ("Microsoft Corporation", "Micro soft Corp.", True),
+    ("Tata Consultancy Services", "Tata Consultancy Service", True),
+    ("Oracle India Private Limited", "Oracle Financial Services Software Limited", False),
+    ("Studio 54 Inc.", "Studio 55 Inc.", False),
+])
+def test_name_similarity(a, b, same):
+    assert (name_similarity(normalize_name(a), normalize_name(b)) >= 0.9) == same
+
+
+def test_master_duplicate_clusters(company_df):
+    """The master lists ZS Associates twice (rows 32 and 101); no other rows share a company"""
+    report = find_duplicate_companies(company_df)
+    
+    assert report["clusters"] == [[32, 101]]
+    assert report["labels"].iloc[101] == 32
+    assert (report["labels"][company_df["name"].isna()] == -1).all()
+
+
+def test_variants_are_clustered_without_exact_match():
+    names = pd.Series([
+        "Acme Robotics Pvt. Ltd.", "Zenith Analytics", "ACME ROBOTICS PRIVATE LIMITED",
+        "Acme Robotic", "Zenith Analytic Inc.", "Northwind Traders", None,
+    ])
+    report = NameBlockingIndex().find_clusters(names)
+    
+    assert report["clusters"] == [[0, 2, 3], [1, 4]]
+    assert report["labels"].tolist() == [0, 1, 0, 0, 1, 5, -1]
+
+
+def test_comparisons_limited_to_blocks():
+    """Names that share no blocking key are never compared"""
+    names = [f"company {chr(97 + i % 26)}{chr(97 + i // 26 % 26)}{i}" for i in range(2000)]
+    index = NameBlockingIndex(window=5)
+    pairs = index.candidate_pairs(names)
+    
+    assert len(pairs) <= 2000 * 5 * len(index.KEY_TYPES)
+    assert (pairs[:, 0] < pairs[:, 1]).all()
+    assert len(np.unique(pairs, axis=0)) == len(pairs)
+
+
+def test_duplicate_detection_benchmark(scaled_master, stopwatch):
+    """Clusters of a resampled master with two in three names made unique, in near-linear time"""
+    names = scaled_master["name"].dropna().reset_index(drop=True)
+    rows = names.where(names.index % 3 == 0, names + " " + names.index.astype(str))
+    
+    with stopwatch():
+        report = find_duplicate_companies(pd.DataFrame({"name": rows}))
+    
+    # Suffixed names differ by their number, so the clusters are exactly the repeated unsuffixed names
+    kept = report["normalized"][names.index % 3 == 0]
+    repeated = kept[kept.duplicated(keep=False)]
+    assert report["comparisons"] <= report["distinct_names"] * 10 * 3
+    assert not report["matches"]
+    assert len(report["clusters"]) == repeated.nunique()
+    assert sorted(np.concatenate(report["clusters"]).tolist()) == repeated.index.tolist()
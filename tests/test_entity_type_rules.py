@@ -0,0 +1,115 @@
+"""
+Entity-type Applicability (TC-14.2)
+Tests segmenting companies into entity types, the rule/field bitmaps and the
+masked must-be-N/A check against the per-row validator
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validators.entity_type_rules import ApplicabilityIndex, load_entity_type_rules, validate_entity_type
+
+FRAME = pd.DataFrame({
+    "category": ["Venture Capital firm", "Bootstrapped startup", "Bootstrapped startup", "Remote-first company",
+                 "Enterprise", None, "Remote-first SaaS startup"],
+    "company_type": ["Dream", "Regular", "Regular", "Dream", "Marquee", "Regular", "Dream"],
+    "offerings_description": ["Fund I; Fund II", "Payroll SaaS", "Billing SaaS", "Dev tools", "Consulting", "x",
+                              "Chat"],
+    "key_investors": ["LPs", "N/A", "Sequoia", "a16z", "Public shareholders", None, "N/A"],
+    "recent_funding_rounds": ["NA", "n/a", "N/A", "Series A", "IPO", None, "N/A"],
+    "total_capital_raised": ["$1B fund", None, "N/A", "$20M", "$5B", None, "N/A"],
+    "office_locations": ["Menlo Park", "Pune", "Pune", "N/A", "London; Paris", None, "Bangalore"],
+})
+
+
+def test_rules_use_master_columns():
+    rules = load_entity_type_rules()
+
+    assert [rule["entity_type"] for rule in rules] == [
+        "Venture Capital firm", "Bootstrapped startup", "Remote-first company"]
+    assert rules[1]["must_be_na"] == ["key_investors", "recent_funding_rounds", "total_capital_raised"]
+    assert "n/a" in rules[0]["na_tokens"]
+
+
+def test_bitmaps_mark_applicable_rules_and_fields():
+    index = ApplicabilityIndex(FRAME)
+
+    assert index.rules_for(0) == ["TC_14.2-01"]
+    assert index.rules_for(4) == [] and index.rules_for(5) == []
+    assert index.rules_for(6) == ["TC_14.2-03"]
+    assert index.applies("TC_14.2-02").tolist() == [False, True, True, False, False, False, False]
+    assert np.flatnonzero(index.must_be_na("office_locations")).tolist() == [3, 6]
+    assert len(index.pairs()[0]) == 5
+    assert index.segments["stage"].tolist()[:2] == ["", "Startup"]
+
+
+def test_masked_check_matches_row_validator():
+    report = ApplicabilityIndex(FRAME).check(FRAME)
+
+    assert report["rows"] == {"TC_14.2-01": [0], "TC_14.2-02": [2], "TC_14.2-03": [6]}
+    assert report["violations"].loc[2].to_dict() == {
+        "offerings_description": False, "key_investors": True, "recent_funding_rounds": False,
+        "total_capital_raised": False, "office_locations": False,
+    }
+    flagged = set(report["violations"].index[report["violations"].any(axis=1)])
+    for position, row in FRAME.iterrows():
+        assert validate_entity_type(row["category"], row) == (position not in flagged)
+
+
+def test_company_type_and_stage_selectors():
+    rules = [{"id": "R1", "entity_type": None, "company_type": "Regular", "stage": "Startup",
+              "must_be_na": ["office_locations"]}]
+    index = ApplicabilityIndex(FRAME, rules=rules)
+
+    assert index.applies("R1").tolist() == [False, True, True, False, False, False, False]
+    assert index.check(FRAME)["rows"] == {"R1": [1, 2]}
+
+
+def test_master_has_no_hallucinated_na_fields(company_df, company_store):
+    index = ApplicabilityIndex(company_df)
+    report = index.check(company_df)
+
+    assert report["violating_rows"] == 0
+    assert all(validate_entity_type(row["category"], row) for row in company_store.rows())
+
+
+def _as_entity_types(frame, positions):
+    """frame with each category replaced by a rules-file entity type, cycling with the row's master position"""
+    entity_types = [rule["entity_type"] for rule in load_entity_type_rules()]
+    return frame.assign(category=[entity_types[p % len(entity_types)] for p in positions])
+
+
+def test_master_rows_relabelled_as_entity_types(company_df):
+    # No master company declares a rules-file entity type, so give each real row one
+    frame = _as_entity_types(company_df, range(len(company_df)))
+
+    report = ApplicabilityIndex(frame).check(frame)
+
+    flagged = set(report["violations"].index[report["violations"].any(axis=1)])
+    assert report["checked_pairs"] == len(frame)
+    assert flagged and len(flagged) == report["violating_rows"]
+    assert flagged == {position for position, row in frame.iterrows()
+                       if not validate_entity_type(row["category"], row)}
+
+
+def test_default_rules_are_loaded_once(monkeypatch):
+    validate_entity_type("Bootstrapped startup", FRAME.iloc[1])
+    monkeypatch.setattr("validators.entity_type_rules.load_entity_type_rules", None)
+
+    assert validate_entity_type("Bootstrapped startup", FRAME.iloc[1])
+    assert not validate_entity_type("Bootstrapped startup", FRAME.iloc[2])
+
+
+def test_applicability_benchmark(company_df, scaled_master, scaled_rows, stopwatch):
+    master = _as_entity_types(company_df, range(len(company_df)))
+    frame = _as_entity_types(scaled_master, scaled_rows)
+
+    with stopwatch():
+        index = ApplicabilityIndex(frame)
+        report = index.check(frame)
+
+    flagged = ApplicabilityIndex(master).check(master)["violations"].any(axis=1).to_numpy()
+    assert index.rule_bits.shape == (len(frame), 1)
+    assert report["checked_pairs"] == len(frame)
+    assert report["violating_rows"] == flagged[scaled_rows].sum()
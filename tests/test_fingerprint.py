@@ -0,0 +1,74 @@
+"""
+Dataset Fingerprinting
+Tests Merkle fingerprints detect any change with one comparison and localize it to cells
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from validators.fingerprint import DatasetFingerprint
+
+
+def make_frame(n_rows=300):
+    return pd.DataFrame({
+        "name": [f"Company {i}" for i in range(n_rows)],
+        "office_count": np.arange(n_rows, dtype=float),
+        "burn_rate": ["NA" if i % 3 else "$2M/month" for i in range(n_rows)],
+    })
+
+
+def test_identical_frames_share_root():
+    """Equal content gives equal fingerprints, regardless of object identity"""
+    df = make_frame()
+    
+    assert DatasetFingerprint.of(df) == DatasetFingerprint.of(df.copy())
+    assert DatasetFingerprint.of(df).hexdigest() == DatasetFingerprint.of(df.copy()).hexdigest()
+
+
+def test_any_change_alters_root():
+    """Value edits, NaN edits and column renames all change the root"""
+    df = make_frame()
+    baseline = DatasetFingerprint.of(df)
+    
+    edited = df.copy()
+    edited.loc[10, "office_count"] = np.nan
+    renamed = df.rename(columns={"burn_rate": "burn"})
+    
+    assert DatasetFingerprint.of(edited) != baseline
+    assert DatasetFingerprint.of(renamed) != baseline
+
+
+@pytest.mark.parametrize("block_size", [1, 64])
+def test_diff_localizes_cells(block_size):
+    """Changed cells in different blocks are reported exactly"""
+    df = make_frame()
+    baseline = DatasetFingerprint.of(df, block_size=block_size)
+    
+    edited = df.copy()
+    edited.loc[3, "name"] = "Leaked Name"
+    edited.loc[200, "burn_rate"] = "$9M/month"
+    changed = DatasetFingerprint.of(edited, block_size=block_size)
+    
+    assert baseline.changed_rows(changed) == [3, 200]
+    assert baseline.changed_columns(changed) == ["name", "burn_rate"]
+    assert baseline.diff(changed) == [(3, "name"), (200, "burn_rate")]
+    assert baseline.diff(DatasetFingerprint.of(df, block_size=block_size)) == []
+
+
+def test_diff_requires_same_shape():
+    """Fingerprints of differently shaped frames cannot be diffed"""
+    baseline = DatasetFingerprint.of(make_frame(10))
+    
+    with pytest.raises(ValueError):
+        baseline.diff(DatasetFingerprint.of(make_frame(11)))
+
+
+def test_company_master_unchanged_by_reads(company_df):
+    """Reading every row of the master leaves its fingerprint untouched"""
+    baseline = DatasetFingerprint.of(company_df)
+    
+    for idx in range(len(company_df)):
+        company_df.iloc[idx].to_dict()
+    
+    assert DatasetFingerprint.of(company_df) == baseline
@@ -0,0 +1,91 @@
+"""
+Offline Gazetteer (location normalization for TC-13.3-02 / TC-13.4-01)
+Tests alias resolution, disambiguation, case-sensitive codes and bulk resolution
+"""
+
+import json
+
+import pandas as pd
+import pytest
+
+from validators.gazetteer import GAZETTEER_PATH, Gazetteer, load_gazetteer, normalize_text
+
+
+@pytest.fixture(scope="module")
+def gazetteer():
+    return load_gazetteer()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Palo Alto, United States", ("US:palo_alto", "US")),
+    ("Santa Clara, CA", ("US:santa_clara", "US-CA")),
+    ("Bengaluru", ("IN:bangalore",)),
+    ("Bangalore, Karnataka, India", ("IN:bangalore", "IN-KA", "IN")),
+    ("São Paulo, Brazil", ("BR:sao_paulo", "BR")),
+    ("Sao Paulo", ("BR:sao_paulo",)),
+    ("New York, NY; London; Singapore", ("US:new_york", "US-NY", "GB:london", "SG")),
+])
+def test_resolves_names_and_aliases(gazetteer, text, expected):
+    assert gazetteer.resolve(text) == expected
+
+
+def test_ambiguous_names_follow_context(gazetteer):
+    """Cambridge resolves to the city in the country named alongside it"""
+    assert gazetteer.resolve("Cambridge, UK") == ("GB:cambridge", "GB")
+    assert gazetteer.resolve("Cambridge, Massachusetts")[0] == "US:cambridge"
+
+
+def test_codes_match_only_in_capitals(gazetteer):
+    """Two-letter codes are not read out of ordinary words"""
+    assert gazetteer.resolve("offices in or near the city") == ()
+    assert gazetteer.resolve("Austin, TX")[-1] == "US-TX"
+    assert gazetteer.resolve(None) == () and gazetteer.resolve(float("nan")) == ()
+
+
+def test_ancestors_and_canonical_key(gazetteer):
+    assert gazetteer.ancestors("IN:bangalore") == ("IN-KA", "IN", "X-ASIA")
+    assert gazetteer.kind("IN-KA") == "region" and gazetteer.kind("X-ASIA") == "macro_region"
+    # The country is implied by the city, so both spellings share one key
+    assert gazetteer.canonical_key("Bangalore, India") == gazetteer.canonical_key("Bengaluru") == "IN:bangalore"
+    assert gazetteer.canonical_key("Remote-first team") == normalize_text("Remote-first team") == "remote first team"
+
+
+def test_every_id_and_parent_is_known():
+    with open(GAZETTEER_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    gazetteer = Gazetteer(data)
+    
+    for place_id, entry in gazetteer.entries.items():
+        assert entry["parent"] is None or entry["parent"] in gazetteer.entries, \
+            f"{place_id} has unknown parent {entry['parent']}"
+    assert all(gazetteer.kind(country["id"]) == "country" and gazetteer.ancestors(country["id"])
+               for country in data["countries"]), "Every country should belong to a macro region"
+
+
+def test_bulk_resolution_matches_per_cell(gazetteer, company_df):
+    """Column resolution (once per distinct value) equals resolving each cell"""
+    for column in ["office_locations", "headquarters_address", "operating_countries"]:
+        resolved = gazetteer.resolve_column(company_df[column])
+        assert resolved.index.equals(company_df.index)
+        assert resolved.tolist() == [gazetteer.resolve(value) for value in company_df[column]]
+
+
+def test_master_locations_are_covered(gazetteer, company_df):
+    """Nearly every non-empty location cell in the master names a known place"""
+    for column in ["office_locations", "headquarters_address", "operating_countries"]:
+        values = company_df[column].dropna()
+        resolved = gazetteer.resolve_column(values)
+        coverage = (resolved.str.len() > 0).mean()
+        assert coverage >= 0.95, f"Only {coverage:.0%} of {column} resolved"
+
+
+def test_id_frequency_counts_rows_once(gazetteer):
+    frame = pd.DataFrame({
+        "headquarters_address": ["Bangalore, India", "Mumbai", None],
+        "office_locations": ["Bengaluru; Pune", "London", "Paris"],
+    })
+    frequency = gazetteer.id_frequency(frame)
+    
+    assert frequency["IN:bangalore"] == 1
+    assert frequency["IN"] == 2 and frequency["X-EUROPE"] == 2
+    assert frequency["FR:paris"] == 1
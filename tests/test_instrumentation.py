@@ -0,0 +1,162 @@
+"""
+Validator Instrumentation
+Tests per-validator and per-rule counters, latency quantiles, the disabled fast
+path, the OpenMetrics export and the instrumented validators
+"""
+
+import re
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from data_quality_engine.validators.recency_validator import calculate_recency
+from test_token_limit import TokenLimitValidator, load_token_limit_rules
+from validators.instrumentation import METRICS, Metrics, count_violations, instrument
+
+
+@pytest.fixture
+def metrics():
+    """The global registry, recording for the duration of a test"""
+    enabled = METRICS.enabled
+    METRICS.enable()
+    yield METRICS
+    METRICS.enabled = enabled
+
+
+def delta(before, after, key):
+    empty = {"calls": 0, "rows": 0, "violations": 0, "errors": 0}
+    return {field: after.get(key, empty)[field] - before.get(key, empty)[field] for field in empty}
+
+
+@pytest.mark.parametrize("result, expected", [
+    ((True, {"issues": ["ignored"]}), 0),
+    ((False, {"issues": ["a", "b"]}), 2),
+    ((False, {"violations": [{}, {}, {}]}), 3),
+    ((False, ["one"]), 1),
+    ((False, "reason"), 1),
+    (False, 1),
+    ({"issues": ["a"]}, 1),
+    ("High", 0),
+])
+def test_count_violations(result, expected):
+    assert count_violations(result) == expected
+
+
+def test_decorator_records_calls_rows_violations_and_rule_ids():
+    registry = Metrics(enabled=True)
+
+    @instrument(metrics=registry, rows=lambda result: result[1]["checked"])
+    def check(values):
+        bad = [v for v in values if v < 0]
+        return not bad, {"test_id": "TC-99-01", "checked": len(values), "violations": bad}
+
+    @instrument(validator="Fails", rule_id="TC-99-02", metrics=registry)
+    def fails():
+        raise ValueError("boom")
+
+    check([1, 2, 3])
+    check([-1, 2, -3, 4])
+    with pytest.raises(ValueError):
+        fails()
+    snapshot = registry.snapshot()
+
+    name = check.__qualname__
+    assert snapshot[(name, "TC-99-01")]["calls"] == 2
+    assert snapshot[(name, "TC-99-01")]["rows"] == 7
+    assert snapshot[(name, "TC-99-01")]["violations"] == 2
+    assert snapshot[("Fails", "TC-99-02")]["errors"] == 1
+    assert snapshot[(name, "TC-99-01")]["seconds"] > 0
+
+
+def test_span_times_blocks():
+    registry = Metrics(enabled=True)
+    with registry.span("Block", "TC-99-03", rows=10) as span:
+        span.violations = 4
+    registry.disable()
+    with registry.span("Block", "TC-99-03", rows=10) as span:
+        span.violations = 4
+
+    stats = registry.snapshot()[("Block", "TC-99-03")]
+    assert (stats["calls"], stats["rows"], stats["violations"]) == (1, 10, 4)
+
+
+def test_latency_quantiles():
+    registry = Metrics(enabled=True)
+    latencies = np.random.default_rng(0).exponential(0.001, 20_000)
+    for seconds in latencies:
+        registry.record("Sketch", "", seconds)
+    stats = registry.snapshot()[("Sketch", "")]
+
+    assert stats["calls"] == len(latencies)
+    assert stats["seconds"] == pytest.approx(latencies.sum())
+    assert stats["p99"] == pytest.approx(np.quantile(latencies, 0.99), rel=0.05)
+    assert stats["p50"] == pytest.approx(np.quantile(latencies, 0.5), rel=0.05)
+
+
+def test_disabled_recording_is_nearly_free():
+    registry = Metrics(enabled=False)
+
+    def plain(x):
+        return x
+
+    wrapped = instrument(metrics=registry)(plain)
+    n = 200_000
+    start = time.perf_counter()
+    for i in range(n):
+        plain(i)
+    baseline = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(n):
+        wrapped(i)
+    overhead_us = (time.perf_counter() - start - baseline) / n * 1e6
+
+    assert registry.snapshot() == {}
+    assert overhead_us < 1.0, f"{overhead_us:.2f}us per disabled call"
+
+
+def test_openmetrics_export(tmp_path):
+    registry = Metrics(enabled=True)
+    registry.record("TokenLimitValidator.validate_tc_13_3_02", "TC-13.3-02", 0.002, rows=1, violations=1)
+    registry.record('Odd "name"\\', "", 0.001)
+    path = registry.write(str(tmp_path / "metrics.prom"))
+    text = open(path).read()
+    lines = text.splitlines()
+
+    assert lines[-1] == "# EOF" and text.endswith("\n")
+    assert 'validator_violations_total{validator="TokenLimitValidator.validate_tc_13_3_02",rule_id="TC-13.3-02"} 1' \
+        in lines
+    assert 'validator_latency_seconds_count{validator="TokenLimitValidator.validate_tc_13_3_02",' \
+        'rule_id="TC-13.3-02"} 1' in lines
+    assert 'validator_rows_total{validator="Odd \\"name\\"\\\\",rule_id=""} 1' in lines
+    families = [line.split()[2] for line in lines if line.startswith("# TYPE")]
+    assert families == ["validator_latency_seconds", "validator_rows", "validator_violations", "validator_errors"]
+    sample = re.compile(r'^[a-z_]+\{(?:[a-z_]+="(?:[^"\\]|\\.)*",?)+\} \S+$')
+    assert all(sample.match(line) for line in lines if not line.startswith("#"))
+
+
+def test_instrumented_validators_report_rule_ids(metrics):
+    validator = TokenLimitValidator(load_token_limit_rules())
+    before = metrics.snapshot()
+    validator.validate_tc_13_3_02("Pune; Mumbai; Bengal...")
+    calculate_recency("2001-01-01")
+    with pytest.raises(ValueError):
+        calculate_recency("2999-01-01")
+    after = metrics.snapshot()
+
+    assert delta(before, after, ("TokenLimitValidator.validate_tc_13_3_02", "TC-13.3-02")) == \
+        {"calls": 1, "rows": 1, "violations": 1, "errors": 0}
+    assert delta(before, after, ("calculate_recency", "TC-15.3")) == \
+        {"calls": 2, "rows": 1, "violations": 1, "errors": 1}
+
+
+def test_engine_validators_import_without_pandas():
+    """Instrumenting the pure-dict data_quality_engine validators does not load pandas or numpy"""
+    code = ("import sys; import data_quality_engine.validators.confidence_validator, "
+            "data_quality_engine.validators.recency_validator; "
+            "print(any(m.split('.')[0] in ('pandas', 'numpy') for m in sys.modules))")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,136 @@
+"""
+Streaming JSON Integrity (TC-13.3-03)
+Tests the chunked structural validator against json.loads, truncation offsets and early abort
+"""
+
+import json
+
+import pytest
+
+from validators.json_stream import StreamingJSONValidator, iter_chunks, validate_json_stream
+
+DOCUMENTS = [
+    '{"name": "Acme {Corp}", "offices": ["Pune", "Austin [HQ]"], "rating": -1.5e3, "public": true, "parent": null}',
+    '{"text": "line\\nbreak \\"quoted\\" \\u00e9 \\\\ slash"}',
+    '[[], [{}], {"a": [1, 2, {"b": []}]}]',
+    '"just a string"',
+    '  42  ',
+    '{"a": 1,}',
+    '[1 2]',
+    '{"a" 1}',
+    '01',
+    '[1]]',
+    '{"a": "bad \\x escape"}',
+    '{"a": [}',
+    '{"é": "ü", "emoji": "\U0001F600"}',
+    '[truex]',
+    'true',
+    ' false ',
+    'null',
+    'tru',
+    '1e',
+    '',
+]
+
+
+def _json_loads_ok(document: str) -> bool:
+    try:
+        json.loads(document)
+        return True
+    except ValueError:
+        return False
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_agrees_with_json_loads(document):
+    """Validity matches json.loads for well-formed, malformed and truncated documents"""
+    assert validate_json_stream([document])["valid"] == _json_loads_ok(document)
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_chunking_does_not_change_result(document):
+    """Any chunk size gives the same report as a single chunk"""
+    whole = validate_json_stream([document])
+    for chunk_size in (1, 2, 3, 5, 64):
+        assert validate_json_stream(iter_chunks(document, chunk_size)) == whole
+
+
+def test_every_prefix_is_truncated_at_its_length():
+    """Cutting a document anywhere reports truncation at exactly that byte"""
+    document = json.dumps({"name": "Acme", "offices": ["Pune", "Austin", {"geo": [18.5, 73.8]}], "ok": True}).encode()
+    
+    for cut in range(len(document)):
+        report = validate_json_stream(iter_chunks(document[:cut], 4))
+        assert report["truncated"] and not report["valid"]
+        assert report["offset"] == cut
+
+
+def test_open_stack_and_path_at_truncation():
+    """The report names the containers still open and where"""
+    report = validate_json_stream(['{"company": {"offices": ["Pune", "Aus'])
+    
+    assert report["truncated"]
+    assert report["open_stack"] == ["{", "{", "["]
+    assert report["path"] == "$.company.offices[1]"
+    assert report["error"] == "Truncated inside a string"
+
+
+@pytest.mark.parametrize("document, path", [
+    ('{"a\\"b": {"c": nul', '$.a"b.c'),
+    ('{"tab\\tkey": [1, {"caf\\u00e9": tr', "$.tab\tkey[1].café"),
+    ('{"back\\\\slash": {"x\\/y": [', "$.back\\slash.x/y"),
+    ('{"' + "k" * 62 + '\\u00e9tail": {"z": ', "$." + "k" * 62 + ".z"),
+])
+def test_escaped_keys_decode_the_same_for_any_chunking(document, path):
+    """Keys are decoded from their escapes whether they arrive in one chunk or byte by byte"""
+    for chunk_size in (1, 2, 3, 5, 64, len(document)):
+        assert validate_json_stream(iter_chunks(document, chunk_size))["path"] == path
+
+
+def test_error_offset_points_at_bad_byte():
+    """Syntax errors are reported at the offending byte, not as truncation"""
+    report = validate_json_stream(['{"a": 1, "b": 2 "c": 3}'])
+    
+    assert not report["valid"] and not report["truncated"]
+    assert report["offset"] == 16
+
+
+def test_early_abort_stops_consuming():
+    """Validation stops pulling chunks once the document is invalid"""
+    pulled = []
+    
+    def chunks():
+        for chunk in ['{"a": ', '1}', ' trailing', '{"never": "read"}']:
+            pulled.append(chunk)
+            yield chunk
+    
+    report = validate_json_stream(chunks())
+    
+    assert not report["valid"]
+    assert pulled == ['{"a": ', '1}', ' trailing']
+
+
+def test_limits_abort_early():
+    """max_depth and max_bytes abort as soon as they are exceeded"""
+    validator = StreamingJSONValidator(max_depth=3)
+    assert not validator.feed("[[[[1]]]]")
+    assert validator.close()["offset"] == 3
+    
+    validator = StreamingJSONValidator(max_bytes=10)
+    assert validator.feed('{"a": ')
+    assert not validator.feed('"long value"}')
+
+
+def test_memory_is_bounded_by_depth():
+    """A multi-megabyte document keeps only its open-container stack"""
+    document = json.dumps({"rows": [{"id": i, "text": "lorem {ipsum} [dolor] " * 20} for i in range(5000)]})
+    validator = StreamingJSONValidator()
+    
+    for chunk in iter_chunks(document, 4096):
+        assert validator.feed(chunk)
+        assert len(validator._stack) <= 3
+    report = validator.close()
+    
+    assert report["valid"] and report["complete"]
+    assert report["bytes_consumed"] == len(document)
+    assert report["max_depth"] == 3 and report["root_members"] == 1
@@ -0,0 +1,121 @@
+"""
+Streaming List Validation (TC-13.3-02)
+Tests incremental tokenization, dedup, truncated trailing items, pagination and scaling
+"""
+
+import time
+import tracemalloc
+
+import pytest
+
+from validators.gazetteer import load_gazetteer
+from validators.list_stream import StreamingListValidator, validate_list_field
+
+
+def synthetic_locations(n: int) -> str:
+    """n ';'-separated office entries, every fourth one a repeat"""
+    entries = (i - 3 if i % 4 == 3 else i for i in range(n))
+    return "; ".join(f"Office {j}, Country {j % 97}" for j in entries)
+
+
+def test_counts_match_naive_split(company_df):
+    """Item and distinct counts equal a materialized split of every master row"""
+    for value in company_df["office_locations"].dropna():
+        separator = ";" if ";" in value else ","
+        items = [item.strip() for item in value.split(separator) if item.strip()]
+        
+        report = validate_list_field(value, chunk_size=7)
+        
+        assert report["separator"] == separator
+        assert report["item_count"] == len(items)
+        assert report["distinct_count"] == len({item.casefold() for item in items})
+        assert report["last_item"] == items[-1]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 65536])
+def test_chunking_does_not_change_result(chunk_size):
+    text = synthetic_locations(300) + "; Tok..."
+    
+    assert validate_list_field(text, chunk_size=chunk_size) == validate_list_field(text)
+
+
+def test_duplicates_found_by_position():
+    report = validate_list_field("Pune; London; pune ; Tokyo; LONDON")
+    
+    assert report["item_count"] == 5 and report["distinct_count"] == 3
+    assert report["duplicate_positions"] == [2, 4]
+
+
+def test_duplicates_by_canonical_place():
+    """With the gazetteer key, spellings of the same place are duplicates"""
+    value = "Bengaluru, India; Bangalore; Mumbai; Bombay, Maharashtra; London"
+    
+    assert validate_list_field(value)["distinct_count"] == 5
+    report = validate_list_field(value, key=load_gazetteer().canonical_key)
+    assert report["distinct_count"] == 3 and report["duplicate_positions"] == [1, 3]
+
+
+@pytest.mark.parametrize("value, reason", [
+    ("New York; London; Tok...", "ends with '...'"),
+    ("New York; London; Tokyo,", "ends with 'yo,'"),
+    ("New York; London; Tokyo (Shibuya", "unclosed bracket"),
+])
+def test_truncated_trailing_item(value, reason):
+    report = validate_list_field(value)
+    
+    assert report["truncated_trailing_item"]
+    assert report["truncation_reason"] == reason
+
+
+def test_trailing_separator_and_empties():
+    report = validate_list_field("New York;; London; Tokyo;")
+    
+    assert report["item_count"] == 3
+    assert report["empty_count"] == 2
+    assert report["ends_with_empty_item"] and not report["truncated_trailing_item"]
+
+
+def test_pagination_uses_distinct_count():
+    """Repeats do not push a list over the pagination threshold"""
+    validator = StreamingListValidator(pagination_threshold=50)
+    validator.feed_items([f"Office {i % 40}" for i in range(200)])
+    report = validator.close()
+    
+    assert report["item_count"] == 200 and report["distinct_count"] == 40
+    assert not report["pagination_required"]
+    assert validate_list_field(synthetic_locations(200), pagination_threshold=50)["pagination_required"]
+
+
+def _measure(n: int) -> tuple:
+    text = synthetic_locations(n)
+    start = time.perf_counter()
+    report = validate_list_field(text)
+    elapsed = time.perf_counter() - start
+    
+    tracemalloc.start()
+    validate_list_field(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return report, elapsed, peak, len(text)
+
+
+@pytest.mark.parametrize("n", [100, 10_000])
+def test_list_validation_memory(n):
+    """Test 13.3.02: every entry is counted, and memory is bounded by a few bytes per entry"""
+    report, _, peak, text_bytes = _measure(n)
+    
+    assert report["item_count"] == n
+    assert report["distinct_count"] == n - n // 4
+    assert peak < 3 * text_bytes + 1_000_000
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("n", [10_000, 1_000_000])
+def test_list_validation_benchmark(n):
+    """Benchmark 13.3.02: per-entry cost does not grow with list size (linear overall)"""
+    report, elapsed, peak, text_bytes = _measure(n)
+    _, small_elapsed, _, _ = _measure(n // 10)
+    
+    assert report["item_count"] == n
+    assert peak < 3 * text_bytes + 1_000_000
+    assert elapsed / n < 3 * small_elapsed / (n // 10)
@@ -0,0 +1,81 @@
+"""
+Concurrent Load Driver (TC-13.2)
+Tests latency histograms and open/closed-loop load generation against stub backends
+"""
+
+import pytest
+
+from validators.load_driver import AsyncStubBackend, LatencyHistogram, LoadDriver, run
+from validators.profile_generator import LatencyModel, LocalStubGenerator
+
+COMPANIES = [
+    {"company_id": i, "name": f"Company {i}", "overview_text": "Overview. " * (10 * (i % 5 + 1)),
+     "kind": "Public" if i % 2 else "Private"}
+    for i in range(20)
+]
+
+
+def labels(company):
+    return {"company_type": company["kind"], "company_stage": "Enterprise"}
+
+
+def test_histogram_percentiles_within_precision():
+    """Percentiles land within the histogram's relative precision"""
+    histogram = LatencyHistogram(precision=0.01)
+    for ms in range(1, 1001):
+        histogram.record(float(ms))
+    
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(500, rel=0.02)
+    assert histogram.percentile(99) == pytest.approx(990, rel=0.02)
+    assert histogram.percentile(100) == 1000
+    assert histogram.mean_ms == pytest.approx(500.5)
+
+
+def test_histogram_merge():
+    """Merged histograms equal a histogram of all samples"""
+    left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for ms in range(1, 200):
+        (left if ms % 2 else right).record(ms)
+        combined.record(ms)
+    left.merge(right)
+    
+    assert left.summary() == combined.summary()
+
+
+def test_closed_loop_groups_by_label():
+    """Closed loop completes every request and buckets latency per company type and stage"""
+    stub = LocalStubGenerator(LatencyModel(tail_spike_probability=0), seed=3)
+    driver = LoadDriver(AsyncStubBackend(stub, capacity=4, time_scale=0.001), COMPANIES, labels,
+                        time_scale=0.001)
+    
+    report = run(driver.closed_loop(concurrency=4, n_requests=40))
+    
+    assert report["completed"] == 40 and report["errors"] == 0
+    assert set(report["company_type"]) == {"Public", "Private"}
+    assert report["company_stage"]["Enterprise"]["count"] == 40
+    assert report["overall"]["p99_ms"] >= report["overall"]["p50_ms"] > 0
+
+
+def test_open_loop_with_synchronous_generator():
+    """Open loop drives a plain ProfileGenerator on a thread pool"""
+    stub = LocalStubGenerator(LatencyModel(tail_spike_probability=0), seed=3, sleep=True, time_scale=0.001)
+    driver = LoadDriver(stub, COMPANIES, labels, time_scale=0.001)
+    
+    report = run(driver.open_loop(rate_per_s=5, n_requests=30))
+    
+    assert report["mode"] == "open_loop" and report["offered_rate_per_s"] == 5
+    assert report["completed"] == 30
+    assert report["throughput_per_s"] > 0
+
+
+def test_open_loop_sweep_reports_saturation():
+    """Offered load beyond capacity inflates latency and marks the previous rate as saturation point"""
+    stub = LocalStubGenerator(LatencyModel(tail_spike_probability=0), seed=3)
+    driver = LoadDriver(AsyncStubBackend(stub, capacity=2, time_scale=0.002), COMPANIES, labels,
+                        time_scale=0.002)
+    
+    sweep = run(driver.sweep("open_loop", [0.1, 0.2, 5.0], n_requests=40))
+    
+    assert len(sweep["reports"]) == 3
+    assert sweep["saturation_point"] == 0.2
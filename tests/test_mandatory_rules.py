@@ -0,0 +1,122 @@
+"""
+Null-reason Matrix (TC-14.3)
+Tests reason classification, source-failure overrides, histograms, mandatory
+failures and snapshot-named serialization
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validators.mandatory_rules import (
+    REASON, REASONS, NullReasonMatrix, classify_field, classify_null_reason, load_mandatory_rules, validate_mandatory,
+)
+
+FRAME = pd.DataFrame({
+    "name": ["Acme", "Globex", None, "Initech"],
+    "ceo_name": ["A. Smith", "Not Disclosed", "", "Not found"],
+    "key_investors": ["N/A", None, "Unknown", "Sequoia"],
+    "burn_rate": ["$1M", "NA", "Confidential", None],
+})
+
+
+@pytest.mark.parametrize("value, reason", [
+    ("Acme", "PRESENT"), (None, "MISSING"), (np.nan, "MISSING"), ("  ", "MISSING"), ("null", "MISSING"),
+    ("Not Disclosed", "NOT_DISCLOSED"), ("Unknown", "NOT_DISCLOSED"), ("N/A", "NOT_APPLICABLE"),
+    ("Not found", "SOURCE_FAILURE"), ("#N/A", "SOURCE_FAILURE"), (0, "PRESENT"),
+])
+def test_classify_null_reason(value, reason):
+    assert REASONS[classify_null_reason(value)] == reason
+
+
+def test_matrix_codes_and_histogram():
+    matrix = NullReasonMatrix.build(FRAME)
+
+    assert matrix.codes.dtype == np.uint8 and matrix.codes.flags.f_contiguous
+    assert matrix.reasons("ceo_name").tolist() == ["PRESENT", "NOT_DISCLOSED", "MISSING", "SOURCE_FAILURE"]
+    histogram = matrix.histogram()
+    assert histogram.loc["burn_rate"].to_dict() == {
+        "PRESENT": 1, "MISSING": 1, "NOT_DISCLOSED": 1, "NOT_APPLICABLE": 1, "SOURCE_FAILURE": 0}
+    assert histogram.to_numpy().sum() == FRAME.size
+
+
+def test_source_metadata_marks_failed_fetches():
+    per_row = NullReasonMatrix.build(FRAME, source_failed=[False, True, False, False])
+    assert per_row.reasons("key_investors").tolist()[:2] == ["NOT_APPLICABLE", "SOURCE_FAILURE"]
+    assert per_row.reasons("name")[1] == "PRESENT"  # values that were fetched stay present
+
+    per_cell = NullReasonMatrix.build(FRAME, source_failed={"burn_rate": [False, False, True, True]})
+    assert per_cell.reasons("burn_rate").tolist() == ["PRESENT", "NOT_APPLICABLE", "SOURCE_FAILURE", "SOURCE_FAILURE"]
+
+
+def test_mandatory_failures_per_company():
+    rules = load_mandatory_rules()
+    matrix = NullReasonMatrix.build(FRAME)
+
+    failures = matrix.mandatory_failures(rules["mandatory_columns"])
+    assert list(failures.columns) == ["name", "ceo_name"]
+    assert matrix.failing_companies(rules["mandatory_columns"]).tolist() == [1, 2, 3]
+    for position, row in FRAME.iterrows():
+        expected = not failures.loc[position].any()
+        assert all(validate_mandatory(field, row[field]) for field in FRAME.columns) == expected
+
+
+def test_optional_nulls_flagged_as_not_disclosed():
+    """optional_null_behavior FLAG_AS_NOT_DISCLOSED: a missing optional value is reported as not disclosed"""
+    rules = load_mandatory_rules()
+    flagged = NullReasonMatrix.build(FRAME).flag_optional(rules)
+
+    assert rules["optional_null_behavior"] == "FLAG_AS_NOT_DISCLOSED"
+    assert flagged.reasons("burn_rate").tolist() == ["PRESENT", "NOT_APPLICABLE", "NOT_DISCLOSED", "NOT_DISCLOSED"]
+    assert flagged.reasons("name").tolist() == ["PRESENT", "PRESENT", "MISSING", "PRESENT"]
+    assert classify_field("Key Investors / Backers", None) == REASON["NOT_DISCLOSED"]
+    assert classify_field("CEO Name", "") == REASON["MISSING"]
+    assert NullReasonMatrix.build(FRAME).flag_optional({**rules, "optional_null_behavior": "KEEP"}).reasons(
+        "burn_rate").tolist()[-1] == "MISSING"
+
+
+def test_validate_mandatory_accepts_display_names():
+    assert not validate_mandatory("CEO Name", "Not Disclosed")
+    assert validate_mandatory("Key Investors / Backers", None)
+
+
+def test_master_null_reasons(company_df):
+    matrix = NullReasonMatrix.build(company_df)
+    rules = load_mandatory_rules()
+    histogram = matrix.histogram()
+
+    assert histogram.to_numpy().sum() == company_df.size
+    assert histogram["SOURCE_FAILURE"].sum() >= 2  # "Not found" placeholders
+    failing = matrix.failing_companies(rules["mandatory_columns"])
+    # Blank trailing rows are not companies; the rest are real gaps (website, profitability status)
+    assert matrix.blank_rows().sum() == 16 and not set(range(116, 132)) & set(failing)
+    assert failing.tolist() == [54, 78, 79, 84, 103, 112, 113]
+    for position in failing:
+        row = company_df.loc[position]
+        assert not all(validate_mandatory(field, row[field]) for field in company_df.columns)
+
+
+def test_saved_next_to_snapshot(company_df, tmp_path):
+    first = NullReasonMatrix.for_snapshot(company_df, str(tmp_path))
+    path = first.cache_path(str(tmp_path))
+    assert path.endswith(f"null_reasons_{first.snapshot.hexdigest()}.npz")
+
+    again = NullReasonMatrix.for_snapshot(company_df, str(tmp_path))
+    np.testing.assert_array_equal(again.codes, first.codes)
+    with pytest.raises(ValueError):
+        NullReasonMatrix.load(path, company_df.iloc[:, :10], first.snapshot)
+
+
+def test_null_reason_benchmark(company_df, scaled_master, scaled_rows, stopwatch):
+    """One byte per cell: 165 columns x n rows classified once per distinct value"""
+    with stopwatch():
+        matrix = NullReasonMatrix.build(scaled_master)
+        histogram = matrix.histogram()
+
+    master = NullReasonMatrix.build(company_df)
+    assert matrix.codes.nbytes == scaled_master.size
+    np.testing.assert_array_equal(matrix.codes, master.codes[scaled_rows])
+    # Each reason count is the master row counts weighted by how often the sample repeats each row
+    repeats = np.bincount(scaled_rows, minlength=len(company_df))
+    for reason, code in REASON.items():
+        np.testing.assert_array_equal(histogram[reason].to_numpy(), repeats @ (master.codes == code))
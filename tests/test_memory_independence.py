@@ -7,33 +7,78 @@ Applicable to: All Parameters
 
 import pytest
 import pandas as pd
+import tracemalloc
+from collections import Counter
 from copy import deepcopy
 
+from validators.company_record import CompanyRecord
+from validators.fingerprint import DatasetFingerprint
+from validators.gazetteer import Gazetteer, load_gazetteer, normalize_text
+
+
+# Columns whose places are resolved through the gazetteer when deciding what is "common"
+LOCATION_COLUMNS = ["office_locations", "headquarters_address", "operating_countries"]
+
+# A place or value named by at least this share of master companies is not evidence of leakage
+COMMON_VALUE_MIN_SHARE = 0.05
+
 
 class DataContaminationDetector:
-    """Detects potential data contamination between requests"""
-    
-    def __init__(self):
+    """Detects potential data contamination between requests.
+
+    Places are compared as gazetteer ids (so "Bengaluru" and "Bangalore, India"
+    match, "Palo Alto" and "Alto Networks" do not); other values as whole
+    normalized tokens. Ids and values named by many master companies are common
+    and never count as leakage.
+    """
+    
+    def __init__(self, gazetteer: Gazetteer = None, common_ids: frozenset = frozenset(),
+                 common_values: frozenset = frozenset()):
         self.processed_companies = {}
-        self.field_signatures = {}
+        self.gazetteer = gazetteer
+        self.common_ids = frozenset(common_ids)
+        self.common_values = frozenset(common_values)
+    
+    @classmethod
+    def from_master(cls, df: pd.DataFrame, gazetteer: Gazetteer,
+                    min_share: float = COMMON_VALUE_MIN_SHARE) -> "DataContaminationDetector":
+        """Common ids and values are those named by at least min_share of the master's companies"""
+        min_rows = max(2, min_share * len(df))
+        id_counts = gazetteer.id_frequency(df, [c for c in LOCATION_COLUMNS if c in df.columns])
+        value_counts = Counter()
+        for column in df.columns:
+            values = df[column].dropna().astype(str).map(normalize_text)
+            value_counts.update(values[values != ""].unique())
+        return cls(
+            gazetteer,
+            common_ids={place_id for place_id, count in id_counts.items() if count >= min_rows},
+            common_values={value for value, count in value_counts.items() if count >= min_rows},
+        )
     
     def register_company(self, company_id: int, company_data: dict):
-        """Register a processed company"""
-        self.processed_companies[company_id] = deepcopy(company_data)
-        
-        # Create signature of unique values
-        self.field_signatures[company_id] = {
-            k: str(v)[:50] for k, v in company_data.items()
-        }
+        """Register a processed company (by reference: records are immutable, no deep copy)"""
+        self.processed_companies[company_id] = CompanyRecord.of(company_data)
+    
+    def signature(self, company_id: int) -> CompanyRecord:
+        """Signature of unique values, derived on demand and sharing the record's field schema"""
+        return self.processed_companies[company_id].map_values(
+            lambda v: "" if pd.api.types.is_scalar(v) and pd.isna(v) else str(v)[:50])
+    
+    def _place_ids(self, value: str, specific: bool = False) -> tuple:
+        if self.gazetteer is None:
+            return ()
+        ids = self.gazetteer.resolve(value)
+        return self.gazetteer.most_specific(ids) if specific else ids
     
     def check_contamination(self, prev_company_id: int, curr_company_id: int, 
                            curr_company_data: dict) -> (bool, list):
         """Check if current company has data from previous company"""
-        if prev_company_id not in self.field_signatures:
+        if prev_company_id not in self.processed_companies:
             return True, []  # No previous data to contaminate with
         
         contamination_found = []
-        prev_signature = self.field_signatures[prev_company_id]
+        prev_signature = self.signature(prev_company_id)
+        prev_ids = {field: self._place_ids(value, specific=True) for field, value in prev_signature.items()}
         
         # Check if any field from prev appears in current
         for field_name, curr_value in curr_company_data.items():
@@ -41,43 +86,64 @@ class DataContaminationDetector:
                 continue
             
             curr_str = str(curr_value)[:100]
+            curr_tokens = f" {normalize_text(curr_str)} "
+            curr_ids = set()
+            for place_id in self._place_ids(curr_str):
+                curr_ids.add(place_id)
+                curr_ids.update(self.gazetteer.ancestors(place_id))
             
             for prev_field, prev_value in prev_signature.items():
-                # Check for exact or partial match
-                if prev_value and prev_value in curr_str:
-                    # Skip if it's a common field value (e.g., country names)
-                    common_values = ["United States", "India", "Public", "Private", "Tech"]
-                    if not any(common in prev_value for common in common_values):
+                if not prev_value:
+                    continue
+                if prev_ids[prev_field]:
+                    # Location: the same specific place, unless many companies name it
+                    shared = [i for i in prev_ids[prev_field] if i in curr_ids and i not in self.common_ids]
+                    if shared:
                         contamination_found.append({
                             "field": field_name,
                             "prev_field": prev_field,
                             "prev_value": prev_value,
-                            "curr_value": curr_str
+                            "curr_value": curr_str,
+                            "place_ids": shared
                         })
+                    continue
+                # Other values: whole-token match, skipping values common across the master
+                prev_norm = normalize_text(prev_value)
+                if prev_norm and f" {prev_norm} " in curr_tokens and prev_norm not in self.common_values:
+                    contamination_found.append({
+                        "field": field_name,
+                        "prev_field": prev_field,
+                        "prev_value": prev_value,
+                        "curr_value": curr_str
+                    })
         
         is_clean = len(contamination_found) == 0
         return is_clean, contamination_found
 
 
 @pytest.fixture(scope="session")
-def contamination_detector():
+def gazetteer():
+    return load_gazetteer()
+
+
+@pytest.fixture(scope="session")
+def contamination_detector(company_df, gazetteer):
     """Session-scoped contamination detector"""
-    return DataContaminationDetector()
+    return DataContaminationDetector.from_master(company_df, gazetteer)
 
 
 @pytest.mark.parametrize("company_pair_idx", range(0, 50, 10))  # Test sequential pairs
-def test_no_data_contamination_sequential(company_pair_idx, contamination_detector):
+def test_no_data_contamination_sequential(company_pair_idx, contamination_detector, company_store):
     """Test 13.4.1: No data contamination between sequential company requests"""
-    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
-    if company_pair_idx + 1 >= len(df):
+    if company_pair_idx + 1 >= len(company_store):
         pytest.skip("Insufficient companies for pair test")
     
     # Process two sequential companies
     companies_data = []
     
     for idx in [company_pair_idx, company_pair_idx + 1]:
-        row = df.iloc[idx]
+        row = company_store[idx]
         company_data = {
             "name": row.get("name"),
             "industry": row.get("focus_sectors"),
@@ -107,6 +173,7 @@ def test_memory_isolation_same_company_multiple_reads():
     if len(df) == 0:
         pytest.skip("No companies available")
     
+    baseline_fingerprint = DatasetFingerprint.of(df)
     row = df.iloc[0]
     
     # Read same company multiple times
@@ -129,6 +196,10 @@ def test_memory_isolation_same_company_multiple_reads():
         # Especially, names should match exactly
         assert first_read["name"] == subsequent_read["name"], \
             f"Company name changed between reads (memory corruption)"
+    
+    post_read_fingerprint = DatasetFingerprint.of(df)
+    assert post_read_fingerprint == baseline_fingerprint, \
+        f"Dataset changed during repeated reads: {baseline_fingerprint.diff(post_read_fingerprint)}"
 
 
 def test_batch_processing_independence():
@@ -140,6 +211,7 @@ def test_batch_processing_independence():
     
     # Get baseline data for company 0
     baseline = df.iloc[0].to_dict()
+    baseline_fingerprint = DatasetFingerprint.of(df)
     
     # Process batch of companies
     batch = []
@@ -155,6 +227,11 @@ def test_batch_processing_independence():
         "Company name changed after batch processing"
     assert baseline["overview_text"] == post_batch["overview_text"], \
         "Company overview changed after batch processing"
+    
+    # Whole-dataset check: one root comparison, localized to cells on mismatch
+    post_batch_fingerprint = DatasetFingerprint.of(df)
+    assert post_batch_fingerprint == baseline_fingerprint, \
+        f"Dataset changed after batch processing: {baseline_fingerprint.diff(post_batch_fingerprint)}"
 
 
 def test_no_shared_state_between_companies():
@@ -201,6 +278,7 @@ def test_large_batch_processing_isolation(batch_size):
     # Store baseline for first company
     first_company_baseline = df.iloc[0].get("name")
     last_company_baseline = df.iloc[batch_size - 1].get("name")
+    baseline_fingerprint = DatasetFingerprint.of(df)
     
     # Process batch
     batch = []
@@ -216,6 +294,10 @@ def test_large_batch_processing_isolation(batch_size):
         "First company baseline changed after batch processing"
     assert df.iloc[batch_size - 1].get("name") == last_company_baseline, \
         "Last company baseline changed after batch processing"
+    
+    post_batch_fingerprint = DatasetFingerprint.of(df)
+    assert post_batch_fingerprint == baseline_fingerprint, \
+        f"Dataset changed after batch of {batch_size}: {baseline_fingerprint.diff(post_batch_fingerprint)}"
 
 
 def test_field_level_isolation():
@@ -254,6 +336,8 @@ def test_immutability_verification(company_idx):
     if company_idx >= len(df):
         pytest.skip(f"Company index {company_idx} out of range")
     
+    baseline_fingerprint = DatasetFingerprint.of(df)
+    
     # Read company data three times
     reads = []
     for _ in range(3):
@@ -270,3 +354,120 @@ def test_immutability_verification(company_idx):
     
     assert read_1 == read_2, f"Read 1 and Read 2 differ for company {company_idx}"
     assert read_2 == read_3, f"Read 2 and Read 3 differ for company {company_idx}"
+    
+    post_read_fingerprint = DatasetFingerprint.of(df)
+    assert post_read_fingerprint == baseline_fingerprint, \
+        f"Dataset changed while reading company {company_idx}: {baseline_fingerprint.diff(post_read_fingerprint)}"
+
+
+def test_registered_company_isolated_from_caller():
+    """Test 13.4.8: Registered records cannot be changed through the caller's dict or each other"""
+    detector = DataContaminationDetector()
+    company_data = {"name": "Acme", "offices": ["Austin", "Pune"], "revenue": "$2B"}
+    detector.register_company(0, company_data)
+    detector.register_company(1, detector.processed_companies[0].set("name", "Beta"))
+    
+    company_data["name"] = "MODIFIED"
+    company_data["offices"].append("MODIFIED")
+    
+    first, second = detector.processed_companies[0], detector.processed_companies[1]
+    assert first["name"] == "Acme" and first["offices"] == ("Austin", "Pune"), \
+        "Caller mutation leaked into registered company"
+    assert second["name"] == "Beta" and first["name"] == "Acme", \
+        "Copy-on-write update affected the original record"
+    assert second["offices"] is first["offices"], \
+        "Unchanged fields should be shared by reference, not copied"
+    with pytest.raises(TypeError):
+        first["name"] = "MODIFIED"
+
+
+def _build_companies(df, n_companies):
+    """n_companies detector inputs cycling over the master's rows"""
+    base = [
+        {
+            "name": f"{row.get('name')} #{i}",
+            "industry": row.get("focus_sectors"),
+            "revenue": row.get("annual_revenue"),
+            "employees": row.get("employee_size"),
+            "headquarters": row.get("headquarters_address")
+        }
+        for i, (_, row) in enumerate(df.iterrows())
+    ]
+    return [dict(base[i % len(base)], name=f"Company {i}") for i in range(n_companies)]
+
+
+def _traced_peak(register, companies):
+    tracemalloc.start()
+    try:
+        registered = register(companies)  # keep alive so "current" is the retained size
+        current, peak = tracemalloc.get_traced_memory()
+        del registered
+    finally:
+        tracemalloc.stop()
+    return current, peak
+
+
+def _register_with_deepcopy(companies):
+    """Previous detector behavior: deep copy plus a separate signature dict per company"""
+    processed, signatures = {}, {}
+    for company_id, company_data in enumerate(companies):
+        processed[company_id] = deepcopy(company_data)
+        signatures[company_id] = {k: str(v)[:50] for k, v in company_data.items()}
+    return processed, signatures
+
+
+def _register_with_records(companies):
+    detector = DataContaminationDetector()
+    for company_id, company_data in enumerate(companies):
+        detector.register_company(company_id, company_data)
+    return detector
+
+
+@pytest.mark.parametrize("n_companies", [
+    2_000,
+    pytest.param(100_000, marks=pytest.mark.benchmark),
+])
+def test_detector_memory_vs_deepcopy(n_companies):
+    """Test 13.4.9: Reference-based registration retains less memory than deep copies"""
+    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
+    companies = _build_companies(df, n_companies)
+    
+    deepcopy_current, deepcopy_peak = _traced_peak(_register_with_deepcopy, companies)
+    record_current, record_peak = _traced_peak(_register_with_records, companies)
+    
+    assert record_current < deepcopy_current, \
+        f"Immutable records ({record_current} B) should retain less memory than deep copies ({deepcopy_current} B)"
+
+
+def test_location_leakage_compared_by_place_id(gazetteer):
+    """Test 13.4.10: Leaked places are found through aliases; common places and null fields are ignored"""
+    detector = DataContaminationDetector(gazetteer, common_ids={"IN:bangalore", "IN-KA", "IN", "X-ASIA"})
+    detector.register_company(0, {"name": "Acme Robotics", "headquarters": "Palo Alto, California, USA",
+                                  "revenue": float("nan")})
+    detector.register_company(1, {"name": "Beta Labs", "headquarters": "Bengaluru, Karnataka, India"})
+    
+    is_clean, contamination = detector.check_contamination(
+        0, 2, {"name": "Gamma", "overview": "Gamma has its main office in Palo Alto, CA."})
+    assert not is_clean and contamination[0]["place_ids"] == ["US:palo_alto"], \
+        f"Palo Alto under another spelling should be reported as leaked: {contamination}"
+    
+    is_clean, contamination = detector.check_contamination(
+        0, 2, {"name": "Gamma", "overview": "Alto Networks partners with Financial firms."})
+    assert is_clean, f"Partial names and a null revenue must not count as leakage: {contamination}"
+    
+    is_clean, contamination = detector.check_contamination(
+        1, 2, {"name": "Gamma", "headquarters": "Bangalore, India"})
+    assert is_clean, f"A place shared by many master companies is not leakage: {contamination}"
+
+
+def test_common_ids_derived_from_master(company_df, contamination_detector):
+    """Test 13.4.11: The common-value exclusion comes from master id frequencies, not a fixed list"""
+    min_rows = COMMON_VALUE_MIN_SHARE * len(company_df)
+    frequency = contamination_detector.gazetteer.id_frequency(company_df, LOCATION_COLUMNS)
+    
+    assert {"US", "IN"} <= contamination_detector.common_ids, \
+        "Countries named by most companies should be common"
+    assert all(frequency[place_id] >= min_rows for place_id in contamination_detector.common_ids)
+    rare = [place_id for place_id, count in frequency.items() if count < min_rows]
+    assert rare and not contamination_detector.common_ids.intersection(rare), \
+        "Places named by few companies must stay distinguishing"
@@ -9,6 +9,14 @@ import pytest
 import pandas as pd
 import numpy as np
 
+from validators.constraint_engine import ConstraintEngine
+from validators.contact_fields import ContactFieldValidator
+from validators.instrumentation import instrument
+from validators.mandatory_rules import REASONS, classify_null_reason
+from validators.null_tokens import NOT_DISCLOSED_TOKENS, NULL_TOKENS
+from validators.numeric_features import STATUS, parse_numeric_values
+from validators.text_cache import NormalizedTextCache
+
 
 class NullDataHandler:
     """Handles and validates null/NA data gracefully"""
@@ -34,20 +42,34 @@ class NullDataHandler:
         "annual_revenue", "profitability_status", "burn_rate", "runway_months"
     ]
     
+    # TC-14.1 placeholders: a subset of the shared vocabulary; "-", "confidential" or a failed
+    # lookup ("Not Found") are not values the record may carry here
+    NULL_TOKENS = frozenset([
+        "", "na", "n/a", "null", "none", "unknown", "not available", "not applicable", "not disclosed", "undisclosed"
+    ])
+    
     @staticmethod
-    def is_null_value(value):
-        """Check if value is null/NA/None"""
+    @instrument(rule_id="TC-14.1", violations=lambda result: 0)
+    def is_null_value(value, normalized: str = None):
+        """Check if value is null/NA/None (normalized: pre-lowered text from NormalizedTextCache)"""
         if pd.isna(value):
             return True
         if value is None:
             return True
         if isinstance(value, str):
-            value_lower = value.lower().strip()
-            if value_lower in ["", "na", "n/a", "null", "none", "unknown", "not available", "not applicable", "not disclosed", "undisclosed"]:
+            value_lower = value.lower().strip() if normalized is None else normalized
+            if value_lower in NullDataHandler.NULL_TOKENS:
                 return True
         return False
     
     @staticmethod
+    @instrument(rule_id="TC-14.1", rows=len, violations=lambda result: 0)
+    def null_mask(cache: NormalizedTextCache, column: str) -> pd.Series:
+        """Vectorized is_null_value over a whole column using the shared text cache"""
+        return cache.df[column].isna() | cache.lower(column).isin(NullDataHandler.NULL_TOKENS)
+    
+    @staticmethod
+    @instrument(rule_id="TC-14.1-01")
     def validate_required_fields(company_name: str, row: pd.Series) -> (bool, list):
         """Validate that required fields are not null"""
         issues = []
@@ -60,6 +82,7 @@ class NullDataHandler:
         return len(issues) == 0, issues
     
     @staticmethod
+    @instrument(rule_id="TC-14.1-02")
     def validate_null_field_consistency(row: pd.Series) -> (bool, list):
         """Validate that null fields are handled consistently"""
         issues = []
@@ -108,14 +131,13 @@ class NullDataHandler:
 
 
 @pytest.mark.parametrize("company_idx", range(116))
-def test_required_fields_never_null(company_idx):
+def test_required_fields_never_null(company_idx, company_store):
     """Test 14.1.1: Required fields are never null"""
-    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
-    if company_idx >= len(df):
+    if company_idx >= len(company_store):
         pytest.skip(f"Company index {company_idx} out of range")
     
-    row = df.iloc[company_idx]
+    row = company_store[company_idx]
     company_name = row.get("name", f"Company {company_idx}")
     
     is_valid, issues = NullDataHandler.validate_required_fields(company_name, row)
@@ -125,14 +147,13 @@ def test_required_fields_never_null(company_idx):
 
 
 @pytest.mark.parametrize("company_idx", range(116))
-def test_graceful_null_handling_financial_data(company_idx):
+def test_graceful_null_handling_financial_data(company_idx, company_store):
     """Test 14.1.2: Financial data null values are handled gracefully"""
-    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
-    if company_idx >= len(df):
+    if company_idx >= len(company_store):
         pytest.skip(f"Company index {company_idx} out of range")
     
-    row = df.iloc[company_idx]
+    row = company_store[company_idx]
     company_name = row.get("name", f"Company {company_idx}")
     nature = row.get("nature_of_company", "")
     
@@ -160,14 +181,13 @@ def test_graceful_null_handling_financial_data(company_idx):
 
 
 @pytest.mark.parametrize("company_idx", range(116))
-def test_undisclosed_data_properly_handled(company_idx):
+def test_undisclosed_data_properly_handled(company_idx, company_store):
     """Test 14.1.3: Undisclosed data (like private company financials) is properly handled"""
-    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
-    if company_idx >= len(df):
+    if company_idx >= len(company_store):
         pytest.skip(f"Company index {company_idx} out of range")
     
-    row = df.iloc[company_idx]
+    row = company_store[company_idx]
     company_name = row.get("name", f"Company {company_idx}")
     nature = row.get("nature_of_company", "")
     
@@ -196,14 +216,13 @@ def test_undisclosed_data_properly_handled(company_idx):
 
 
 @pytest.mark.parametrize("company_idx", range(116))
-def test_null_consistency_across_fields(company_idx):
+def test_null_consistency_across_fields(company_idx, company_store):
     """Test 14.1.4: Null values are consistent across related fields"""
-    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
-    if company_idx >= len(df):
+    if company_idx >= len(company_store):
         pytest.skip(f"Company index {company_idx} out of range")
     
-    row = df.iloc[company_idx]
+    row = company_store[company_idx]
     company_name = row.get("name", f"Company {company_idx}")
     
     is_valid, issues = NullDataHandler.validate_null_field_consistency(row)
@@ -217,19 +236,18 @@ def test_null_consistency_across_fields(company_idx):
 
 
 @pytest.mark.parametrize("company_idx", range(0, 116, 20))
-def test_null_values_don_t_cause_errors(company_idx):
+def test_null_values_don_t_cause_errors(company_idx, company_store):
     """Test 14.1.5: Null values don't cause processing errors"""
-    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
-    if company_idx >= len(df):
+    if company_idx >= len(company_store):
         pytest.skip(f"Company index {company_idx} out of range")
     
-    row = df.iloc[company_idx]
+    row = company_store[company_idx]
     company_name = row.get("name", f"Company {company_idx}")
     
     # Try to process all fields without errors
     try:
-        for field in df.columns:
+        for field in company_store.index:
             value = row.get(field)
             
             # Should handle null gracefully
@@ -331,14 +349,13 @@ def test_na_value_normalization():
 
 
 @pytest.mark.parametrize("company_idx", range(0, 116, 30))
-def test_readonly_behavior_with_null_fields(company_idx):
+def test_readonly_behavior_with_null_fields(company_idx, company_store):
     """Test 14.1.9: Attempting to modify null fields doesn't cause issues"""
-    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
-    if company_idx >= len(df):
+    if company_idx >= len(company_store):
         pytest.skip(f"Company index {company_idx} out of range")
     
-    row = df.iloc[company_idx]
+    row = company_store[company_idx]
     
     # Create a copy of data
     company_data = row.to_dict()
@@ -352,3 +369,54 @@ def test_readonly_behavior_with_null_fields(company_idx):
             # Should not affect original
             assert NullDataHandler.is_null_value(row.get(field)), \
                 f"Modifying copy affected original for {field}"
+
+
+def test_null_mask_matches_per_value_check(text_cache):
+    """Test 14.1.10: Vectorized null mask over the shared text cache agrees with is_null_value"""
+    for field in NullDataHandler.NULLABLE_FIELDS + NullDataHandler.REQUIRED_FIELDS:
+        if field not in text_cache.df.columns:
+            continue
+        
+        mask = NullDataHandler.null_mask(text_cache, field)
+        expected = [NullDataHandler.is_null_value(value) for value in text_cache.df[field]]
+        
+        assert mask.tolist() == expected, f"Null mask differs from per-value check for {field}"
+
+
+def test_row_view_validation_matches_series(company_df, company_store):
+    """Test 14.1.11: Required-field and consistency checks give identical results on RowView and Series"""
+    for company_idx, view in enumerate(company_store.rows()):
+        row = company_df.iloc[company_idx]
+        company_name = row.get("name", f"Company {company_idx}")
+        
+        assert NullDataHandler.validate_required_fields(company_name, view) == \
+            NullDataHandler.validate_required_fields(company_name, row), \
+            f"{company_name}: required-field result differs on RowView"
+        assert NullDataHandler.validate_null_field_consistency(view) == \
+            NullDataHandler.validate_null_field_consistency(row), \
+            f"{company_name}: consistency result differs on RowView"
+
+
+def test_declarative_consistency_matches_row_check(company_df, company_store):
+    """Test 14.1.12: Constraint CF-01 (rules/cross_field_constraints.json) flags the rows validate_null_field_consistency does"""
+    report = ConstraintEngine.from_rules().evaluate(company_df)
+    
+    expected = [
+        row.name for row in company_store.rows()
+        if not NullDataHandler.validate_null_field_consistency(row)[0]
+    ]
+    assert report["constraints"]["CF-01"]["rows"] == expected
+
+
+def test_validators_share_null_vocabulary():
+    """Test 14.1.13: Every placeholder token reads as a null to the contact, numeric and null-reason validators"""
+    assert NullDataHandler.NULL_TOKENS < NULL_TOKENS
+    tokens = sorted(NULL_TOKENS)
+    contact = ContactFieldValidator().validate_column(pd.Series([t.upper() for t in tokens], dtype=object), "website_url")
+    numeric = parse_numeric_values(pd.Series(tokens, dtype=object))["status"]
+    
+    assert list(contact) == ["NULL"] * len(tokens)
+    assert set(numeric) <= {STATUS["missing"], STATUS["undisclosed"]}
+    assert all((s == STATUS["undisclosed"]) == (t in NOT_DISCLOSED_TOKENS) for t, s in zip(tokens, numeric))
+    assert REASONS[classify_null_reason(" N/A ")] == "NOT_APPLICABLE"
+    assert all(REASONS[classify_null_reason(t)] != "PRESENT" for t in tokens)
@@ -0,0 +1,109 @@
+"""
+Parsed Numeric Feature Store
+Tests cell parsing (ranges, bounds, magnitudes, currencies, status codes) and
+snapshot-keyed caching of parsed features in memory and on disk
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validators.constraint_engine import ConstraintEngine
+from validators.numeric_features import (
+    NUMERIC_COLUMNS, STATUS, NumericFeatureStore, feature_store_for, parse_numeric_text, parse_numeric_values,
+)
+
+
+@pytest.mark.parametrize("text, value, lower, upper, status", [
+    ("$2.3B", 2.3e9, 2.3e9, 2.3e9, "exact"),
+    ("1001-5000", 3000.5, 1001.0, 5000.0, "range"),
+    ("$45–55 billion", 50e9, 45e9, 55e9, "range"),
+    ("500+", 500.0, 500.0, np.nan, "lower_bound"),
+    ("Over $10M", 10e6, 10e6, np.nan, "lower_bound"),
+    ("<5%", 5.0, np.nan, 5.0, "upper_bound"),
+    ("~$5M/month", 5e6, 5e6, 5e6, "approximate"),
+    ("FY2024: $5M", 5e6, 5e6, 5e6, "exact"),
+    ("₹508 crore", 508e7 * 0.012, 508e7 * 0.012, 508e7 * 0.012, "exact"),
+    ("Net Loss of ₹782 Crore", -782e7 * 0.012, -782e7 * 0.012, -782e7 * 0.012, "exact"),
+    ("Undisclosed", np.nan, np.nan, np.nan, "undisclosed"),
+    ("Not publicly disclosed", np.nan, np.nan, np.nan, "undisclosed"),
+    ("Unknown", np.nan, np.nan, np.nan, "undisclosed"),
+    ("N/A", np.nan, np.nan, np.nan, "missing"),
+    ("Medium", np.nan, np.nan, np.nan, "qualitative"),
+])
+def test_parse_numeric_text(text, value, lower, upper, status):
+    parsed = dict(zip(("value", "lower", "upper", "currency", "percent", "period", "status"), parse_numeric_text(text)))
+
+    assert parsed["value"] == pytest.approx(value, nan_ok=True)
+    assert parsed["lower"] == pytest.approx(lower, nan_ok=True)
+    assert parsed["upper"] == pytest.approx(upper, nan_ok=True)
+    assert parsed["status"] == STATUS[status]
+
+
+def test_currency_percent_and_period_flags():
+    frame = parse_numeric_values(pd.Series(["~$5M/month", "€2B annually", "<5%", None]))
+
+    assert frame["currency"].tolist() == ["USD", "EUR", "", ""]
+    assert frame["percent"].tolist() == [False, False, True, False]
+    assert frame["period"].tolist() == ["month", "year", "", ""]
+    assert frame["status"].iloc[3] == STATUS["missing"]
+
+
+def test_master_columns_are_parsed(company_df):
+    store = NumericFeatureStore.build(company_df)
+    counts = store.status_counts()
+
+    assert store.columns == [column for column in NUMERIC_COLUMNS if column in company_df.columns]
+    for column in store.columns:
+        assert sum(counts[column].values()) == len(company_df)
+        assert store.value(column).dtype == np.float64
+        # Every row with a number has a finite value, and bounds bracket it
+        has_number = store.status(column) <= STATUS["approximate"]
+        assert np.isfinite(store.value(column)[has_number]).all()
+        lower, upper, value = store.lower(column), store.upper(column), store.value(column)
+        assert not (lower > value).any() and not (upper < value).any()
+
+
+def test_store_is_reused_until_the_snapshot_changes(company_df):
+    frame = company_df.copy()
+    first = feature_store_for(frame)
+
+    assert feature_store_for(frame.copy()) is first
+    frame.loc[frame.index[0], "annual_revenue"] = "$999B"
+    edited = feature_store_for(frame)
+    assert edited is not first
+    assert edited.snapshot.root != first.snapshot.root
+    assert edited.value("annual_revenue")[0] == pytest.approx(999e9)
+
+
+def test_disk_cache_round_trip(company_df, tmp_path):
+    built = NumericFeatureStore.build(company_df)
+    path = built.save(str(tmp_path))
+    loaded = NumericFeatureStore.load(path, company_df, built.snapshot)
+
+    for column in built.columns:
+        pd.testing.assert_frame_equal(loaded[column], built[column], check_categorical=False, check_dtype=False)
+    assert feature_store_for(company_df, cache_dir=str(tmp_path)).cache_path(str(tmp_path)) == path
+
+
+def test_constraint_engine_reads_store(company_df):
+    engine = ConstraintEngine.from_rules()
+    store = feature_store_for(company_df)
+
+    with_store = engine.evaluate(company_df, feature_store=store)["constraints"]
+    without = engine.evaluate(company_df)["constraints"]
+    assert {cid: r["rows"] for cid, r in with_store.items()} == {cid: r["rows"] for cid, r in without.items()}
+
+
+def test_feature_store_benchmark(company_df, scaled_master, scaled_rows, stopwatch):
+    """Parse cost scales with distinct values; a second request for the same snapshot is a cache hit"""
+    with stopwatch("build_seconds"):
+        store = feature_store_for(scaled_master)
+    with stopwatch("cached_seconds"):
+        again = feature_store_for(scaled_master)
+
+    master = feature_store_for(company_df)
+    assert again is store
+    for column in NUMERIC_COLUMNS:
+        np.testing.assert_array_equal(store.value(column), master.value(column)[scaled_rows])
+        np.testing.assert_array_equal(store.status(column), master.status(column)[scaled_rows])
@@ -0,0 +1,86 @@
+"""
+Budget-aware Profile Compaction (TC-13.3-05)
+Tests sentence splitting, knapsack selection by priority and budget adherence
+"""
+
+import json
+
+import pytest
+
+from validators.profile_compactor import ProfileCompactor, _upper_hull, split_sentences
+from validators.token_counter import TokenCounter
+
+PROFILE = """
+COMPANY IDENTITY
+Legal Name: Acme Corp
+Headquarters: Pune, India
+
+BUSINESS OVERVIEW
+Acme builds rockets. It also builds engines for other launch providers. Founded in 1999, it employs 5,000 people.
+
+HISTORY
+Acme started in a garage. It moved to Pune in 2005. It went public in 2015.
+
+RECENT NEWS
+Acme raised $2.3B. A new plant opens next year.
+"""
+
+
+@pytest.fixture(scope="module")
+def compactor():
+    with open("rules/token_limit_rules.json") as f:
+        return ProfileCompactor.from_rules(json.load(f))
+
+
+def test_split_sentences():
+    assert split_sentences("One. Two! Three? four") == ["One.", "Two!", "Three? four"]
+    assert split_sentences("Revenue of $2.3B in 2024.") == ["Revenue of $2.3B in 2024."]
+
+
+def test_upper_hull_merges_denser_followers():
+    """A cheap, valuable step after an expensive one is merged into a single segment"""
+    hull = _upper_hull([(10, 1.0, [0]), (1, 0.9, [1]), (5, 0.1, [2])])
+    
+    assert [segment[2] for segment in hull] == [[0, 1], [2]]
+
+
+def test_zero_budget_keeps_mandatory_skeleton(compactor):
+    """Mandatory headers and field lines survive any budget"""
+    compacted = compactor.compact(PROFILE, 0)
+    
+    assert "COMPANY IDENTITY" in compacted["text"] and "Legal Name: Acme Corp" in compacted["text"]
+    assert "business_overview" in compacted["summarized"]
+    assert set(compacted["dropped"]) == {"HISTORY", "RECENT NEWS"}
+    assert not compacted["fits"]
+
+
+def test_mandatory_sections_win_over_optional(compactor):
+    """With room for a little prose, mandatory sections get it first"""
+    floor = compactor.compact(PROFILE, 0)["tokens"]
+    compacted = compactor.compact(PROFILE, floor + 12)
+    
+    assert compacted["sections"]["business_overview"].startswith("Acme builds rockets.")
+    assert "HISTORY" in compacted["dropped"]
+
+
+def test_every_budget_is_respected(compactor):
+    """Output never exceeds any feasible budget; a generous budget loses nothing"""
+    floor = compactor.compact(PROFILE, 0)["tokens"]
+    full = TokenCounter().count(PROFILE)
+    
+    for budget in range(floor, full + 20):
+        assert compactor.compact(PROFILE, budget)["fits"], budget
+    
+    compacted = compactor.compact(PROFILE, full + 40)
+    assert compacted["summarized"] == [] and compacted["dropped"] == []
+
+
+def test_untitled_preamble_has_no_header_line(compactor):
+    """Text before the first header is kept without a header line, and is named "preamble" when dropped"""
+    profile = "Acme Corp, Pune. Rocket maker since 1999.\n" + PROFILE
+    kept = compactor.compact(profile, TokenCounter().count(profile) + 50)
+    dropped = compactor.compact(profile, 0)
+    
+    assert kept["text"].startswith("Acme Corp, Pune.") and kept["sections"]["preamble"].startswith("Acme Corp")
+    assert "preamble" in dropped["dropped"]
+    assert dropped["text"].endswith("Omitted sections: preamble, HISTORY, RECENT NEWS.")
@@ -0,0 +1,77 @@
+"""
+Profile Generator Interface and Latency Stub (TC-13.2)
+Tests the stub models latency from company size and type, and the HTTP stub speaks the generator protocol
+"""
+
+import json
+import pytest
+
+from validators.profile_generator import (
+    HttpProfileGenerator, LatencyModel, LocalStubGenerator, StubProfileServer, build_profile
+)
+
+
+def load_performance_rules():
+    with open("rules/performance_rules.json", "r") as f:
+        return json.load(f)
+
+
+SMALL = {"company_id": 1, "name": "Tiny", "overview_text": "Small startup."}
+LARGE = dict(SMALL, company_id=2, name="Huge", overview_text="Long narrative. " * 400,
+             office_locations="; ".join(f"City {i}" for i in range(200)))
+
+
+def test_latency_grows_with_input_size_and_type():
+    """Larger inputs and heavier company types take longer"""
+    model = LatencyModel(company_type_multipliers={"Public": 1.5})
+    
+    assert model.expected_ms(LARGE) > model.expected_ms(SMALL)
+    assert model.expected_ms(SMALL, "Public") == pytest.approx(1.5 * model.expected_ms(SMALL))
+
+
+def test_jitter_and_spikes_bounded_and_seeded():
+    """Draws stay within jitter (or jitter x spike) and repeat for the same seed"""
+    model = LatencyModel(jitter_percent=10, tail_spike_probability=0.2, tail_spike_multiplier=4.0)
+    expected = model.expected_ms(SMALL)
+    
+    first = [LocalStubGenerator(model, seed=7).generate(SMALL)["latency_ms"] for _ in range(3)]
+    stub = LocalStubGenerator(model, seed=7)
+    draws = [stub.generate(SMALL)["latency_ms"] for _ in range(500)]
+    
+    assert first == [draws[0]] * 3
+    assert all(0.9 * expected <= d <= 1.1 * expected * 4.0 for d in draws)
+    assert any(d > 1.1 * expected for d in draws), "Tail spikes never triggered"
+    assert len(set(draws)) > 1, "Repeated requests should jitter"
+
+
+def test_stub_built_from_performance_rules():
+    """Latency model parameters come from rules/performance_rules.json"""
+    rules = load_performance_rules()
+    stub = LocalStubGenerator.from_rules(rules)
+    config = rules["profile_generation"]["latency_model"]
+    
+    assert stub.seed == config["seed"]
+    assert stub.model.base_ms == config["base_ms"]
+    result = stub.generate(SMALL)
+    assert result["success"] and result["profile"] == build_profile(SMALL)
+
+
+def test_http_stub_round_trip():
+    """The HTTP client works against the local stub server with scaled-down sleeps"""
+    stub = LocalStubGenerator(LatencyModel(tail_spike_probability=0), seed=1)
+    
+    with StubProfileServer(stub, time_scale=0.001) as server:
+        client = HttpProfileGenerator(server.url, timeout=10)
+        result = client.generate(LARGE)
+    
+    assert result["success"], result.get("error")
+    assert result["profile"]["name"] == "Huge"
+    assert result["latency_ms"] > 0
+
+
+def test_http_generator_reports_failures():
+    """Unreachable backends surface as unsuccessful results, not exceptions"""
+    result = HttpProfileGenerator("http://127.0.0.1:9/generate", timeout=1).generate(SMALL)
+    
+    assert not result["success"]
+    assert "error" in result
@@ -11,6 +11,11 @@ import time
 import json
 from typing import Dict, Callable
 
+from validators.instrumentation import instrument
+from validators.load_driver import AsyncStubBackend, LoadDriver, load_companies, run
+from validators.numeric_features import parse_numeric_text
+from validators.profile_generator import LocalStubGenerator, ProfileGenerator
+
 
 # Load performance rules
 def load_performance_rules():
@@ -70,6 +75,7 @@ class PerformanceValidator:
         self.stage_thresholds = rules.get("company_stage_thresholds", {})
         self.benchmarks = rules.get("performance_benchmarks", {})
     
+    @instrument()
     def validate_sla(self, test_id: str, processing_time_ms: float) -> tuple:
         """Validate against SLA for specific test case"""
         sla_config = self.slas.get(test_id, {})
@@ -83,12 +89,14 @@ class PerformanceValidator:
         passed = processing_time_ms <= max_allowed
         
         return passed, {
+            "test_id": test_id,
             "expected_ms": expected_sla,
             "max_allowed_ms": max_allowed,
             "actual_ms": processing_time_ms,
             "variance_percent": ((processing_time_ms - expected_sla) / expected_sla * 100)
         }
     
+    @instrument(rule_id="TC-13.2-TYPE")
     def validate_company_type(self, company_type: str, processing_time_ms: float) -> tuple:
         """Validate against company type thresholds"""
         threshold = self.company_thresholds.get(company_type, {})
@@ -105,6 +113,7 @@ class PerformanceValidator:
             "actual_ms": processing_time_ms
         }
     
+    @instrument(rule_id="TC-13.2-STAGE")
     def validate_company_stage(self, company_stage: str, processing_time_ms: float) -> tuple:
         """Validate against company stage thresholds"""
         threshold = self.stage_thresholds.get(company_stage, {})
@@ -121,6 +130,8 @@ class PerformanceValidator:
             "actual_ms": processing_time_ms
         }
     
+    @instrument(rule_id="TC-13.2-CONSISTENCY", rows=lambda result: len(result[1]["timings_ms"])
+                if isinstance(result[1], dict) else 0)
     def validate_consistency(self, timings: list) -> tuple:
         """Validate variance in repeated runs"""
         if len(timings) < 2:
@@ -157,12 +168,12 @@ class PerformanceValidator:
             }
 
 
-def extract_company_type(nature_of_company):
+def extract_company_type(nature_of_company, normalized: str = None):
     """Extract company classification"""
     if pd.isna(nature_of_company):
         return "Unknown"
     
-    nature_str = str(nature_of_company).lower()
+    nature_str = str(nature_of_company).lower() if normalized is None else normalized
     
     if "public" in nature_str:
         if "subsidiary" in nature_str:
@@ -187,7 +198,8 @@ def extract_company_stage(nature_of_company, annual_revenue=None):
     
     if pd.notna(annual_revenue):
         try:
-            revenue = float(annual_revenue) if isinstance(annual_revenue, (int, float)) else 0
+            revenue = float(annual_revenue) if isinstance(annual_revenue, (int, float)) \
+                else parse_numeric_text(str(annual_revenue))[0]
             if revenue > 1000000000:  # > $1B
                 return "Enterprise"
             elif revenue > 100000000:  # > $100M
@@ -207,8 +219,8 @@ class CompanyDataProcessor:
     """Processes company data and measures performance"""
     
     @staticmethod
-    def process_company_record(row: pd.Series) -> Dict:
-        """Process a single company record and measure time"""
+    def process_company_record(row: pd.Series, generator: ProfileGenerator = None) -> Dict:
+        """Process a single company record and measure time (profile generation latency when a generator is given)"""
         start_time = time.time()
         
         try:
@@ -225,6 +237,12 @@ class CompanyDataProcessor:
             }
             
             elapsed_time = time.time() - start_time
+            if generator is not None:
+                generated = generator.generate(row)
+                if not generated["success"]:
+                    raise RuntimeError(generated.get("error", "Profile generation failed"))
+                company_data["profile"] = generated["profile"]
+                elapsed_time = generated["latency_ms"] / 1000
             return {
                 "data": company_data,
                 "processing_time": elapsed_time,
@@ -239,18 +257,26 @@ class CompanyDataProcessor:
             }
 
 
+@pytest.fixture(scope="session")
+def profile_generator(performance_rules):
+    """Local latency-modeling stub standing in for the LLM-backed profile generator"""
+    return LocalStubGenerator.from_rules(
+        performance_rules,
+        type_of=lambda company: extract_company_type(company.get("nature_of_company"))
+    )
+
+
 @pytest.mark.parametrize("company_idx", range(0, 116, 10))  # Every 10th company for speed
-def test_response_time_public_vs_private(company_idx, performance_metrics, performance_rules):
+def test_response_time_public_vs_private(company_idx, performance_metrics, performance_rules, profile_generator, company_store):
     """Test 13.2.3: Compare response time between public and private companies of similar size"""
-    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
-    if company_idx >= len(df):
+    if company_idx >= len(company_store):
         pytest.skip(f"Company index {company_idx} out of range")
     
-    row = df.iloc[company_idx]
+    row = company_store[company_idx]
     company_type = extract_company_type(row.get("nature_of_company"))
     
-    result = CompanyDataProcessor.process_company_record(row)
+    result = CompanyDataProcessor.process_company_record(row, profile_generator)
     
     assert result["success"], f"Failed to process company: {result.get('error')}"
     
@@ -269,17 +295,16 @@ def test_response_time_public_vs_private(company_idx, performance_metrics, perfo
 
 
 @pytest.mark.parametrize("company_idx", range(0, 116, 10))
-def test_response_time_startup_vs_enterprise(company_idx, performance_metrics, performance_rules):
+def test_response_time_startup_vs_enterprise(company_idx, performance_metrics, performance_rules, profile_generator, company_store):
     """Test 13.2.2: Measure response time for a startup company profile vs large enterprises"""
-    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
-    if company_idx >= len(df):
+    if company_idx >= len(company_store):
         pytest.skip(f"Company index {company_idx} out of range")
     
-    row = df.iloc[company_idx]
+    row = company_store[company_idx]
     company_stage = extract_company_stage(row.get("nature_of_company"), row.get("annual_revenue"))
     
-    result = CompanyDataProcessor.process_company_record(row)
+    result = CompanyDataProcessor.process_company_record(row, profile_generator)
     
     assert result["success"], f"Failed to process company: {result.get('error')}"
     
@@ -295,7 +320,7 @@ def test_response_time_startup_vs_enterprise(company_idx, performance_metrics, p
     assert stage_passed, f"Processing time {processing_time_ms:.2f}ms exceeds threshold for {company_stage}: {stage_info}"
 
 
-def test_response_time_by_data_volume(performance_metrics, performance_rules):
+def test_response_time_by_data_volume(performance_metrics, performance_rules, profile_generator):
     """Test 13.2.04: Detect performance regression when entity complexity increases"""
     df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
@@ -310,7 +335,7 @@ def test_response_time_by_data_volume(performance_metrics, performance_rules):
     for dataset, label in [(short_desc, "short_description"), (medium_desc, "medium_description"), (long_desc, "long_description")]:
         if len(dataset) > 0:
             for idx, row in dataset.head(3).iterrows():
-                result = CompanyDataProcessor.process_company_record(row)
+                result = CompanyDataProcessor.process_company_record(row, profile_generator)
                 assert result["success"], f"Failed to process: {result.get('error')}"
                 
                 processing_time_ms = result["processing_time"] * 1000
@@ -324,7 +349,7 @@ def test_response_time_by_data_volume(performance_metrics, performance_rules):
                         f"Processing time {processing_time_ms:.2f}ms for {label} outside range [{min_ms}, {max_ms}]"
 
 
-def test_response_time_consistency(performance_rules):
+def test_response_time_consistency(performance_rules, profile_generator):
     """Test 13.2.05: Validate consistency of response time across repeated runs"""
     df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
@@ -336,7 +361,7 @@ def test_response_time_consistency(performance_rules):
     
     # Process same company 5 times
     for _ in range(5):
-        result = CompanyDataProcessor.process_company_record(row)
+        result = CompanyDataProcessor.process_company_record(row, profile_generator)
         assert result["success"], "Processing failed"
         timings.append(result["processing_time"] * 1000)  # Convert to ms
     
@@ -349,7 +374,7 @@ def test_response_time_consistency(performance_rules):
 
 
 @pytest.mark.benchmark
-def test_batch_processing_performance_summary(performance_metrics, performance_rules):
+def test_batch_processing_performance_summary(performance_metrics, performance_rules, profile_generator):
     """Test 13.2.01: Measure response time for Fortune 500 company profiles (high complexity)"""
     df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
@@ -360,7 +385,7 @@ def test_batch_processing_performance_summary(performance_metrics, performance_r
     benchmarks = performance_rules.get("performance_benchmarks", {})
     
     for idx, row in sample.iterrows():
-        result = CompanyDataProcessor.process_company_record(row)
+        result = CompanyDataProcessor.process_company_record(row, profile_generator)
         company_type = result["data"].get("type") if result["success"] else "Unknown"
         processing_time_ms = result["processing_time"] * 1000
         performance_metrics.record_time(f"batch_{company_type}", processing_time_ms)
@@ -391,3 +416,61 @@ def test_batch_processing_performance_summary(performance_metrics, performance_r
                 print(f"{key:30} -> Avg: {avg:7.2f}ms, Max: {max_val:7.2f}ms, Count: {count}")
     
     print("=" * 80)
+
+
+def test_row_view_processing_matches_series(company_df, company_store):
+    """Test 13.2.06: Processing through a zero-copy RowView yields the same record as df.iloc"""
+    for company_idx in range(len(company_store)):
+        from_series = CompanyDataProcessor.process_company_record(company_df.iloc[company_idx])
+        from_view = CompanyDataProcessor.process_company_record(company_store.row(company_idx))
+        
+        assert from_view["success"], f"Failed to process company {company_idx}: {from_view.get('error')}"
+        assert pd.Series(from_view["data"]).equals(pd.Series(from_series["data"])), \
+            f"RowView record differs from Series record for company {company_idx}"
+
+
+def company_load_labels(company) -> Dict:
+    """company_type / company_stage labels used to bucket load-test latencies"""
+    nature = company.get("nature_of_company")
+    return {
+        "company_type": extract_company_type(nature),
+        "company_stage": extract_company_stage(nature, company.get("annual_revenue"))
+    }
+
+
+def test_concurrent_load_within_type_and_stage_thresholds(performance_rules):
+    """Test 13.2.07: Under concurrent closed-loop load, p99 per company type and stage stays within thresholds"""
+    stub = LocalStubGenerator.from_rules(
+        performance_rules,
+        type_of=lambda company: extract_company_type(company.get("nature_of_company"))
+    )
+    time_scale = 0.005
+    driver = LoadDriver(AsyncStubBackend(stub, capacity=8, time_scale=time_scale),
+                        load_companies(), company_load_labels, time_scale=time_scale)
+    
+    report = run(driver.closed_loop(concurrency=4, n_requests=len(driver.companies)))
+    
+    assert report["errors"] == 0, f"{report['errors']} requests failed under load"
+    assert report["throughput_per_s"] > 0
+    
+    validator = PerformanceValidator(performance_rules)
+    for company_type, summary in report["company_type"].items():
+        passed, info = validator.validate_company_type(company_type, summary["p99_ms"])
+        assert passed, f"p99 {summary['p99_ms']:.0f}ms for {company_type} under load: {info}"
+    for company_stage, summary in report["company_stage"].items():
+        passed, info = validator.validate_company_stage(company_stage, summary["p99_ms"])
+        assert passed, f"p99 {summary['p99_ms']:.0f}ms for {company_stage} under load: {info}"
+
+
+def test_saturation_point_detected(performance_rules):
+    """Test 13.2.08: A closed-loop concurrency sweep finds the backend's capacity as the saturation point"""
+    stub = LocalStubGenerator.from_rules(performance_rules)
+    time_scale = 0.002
+    driver = LoadDriver(AsyncStubBackend(stub, capacity=4, time_scale=time_scale),
+                        load_companies(), company_load_labels, time_scale=time_scale)
+    
+    sweep = run(driver.sweep("closed_loop", [1, 2, 4, 8, 16], n_requests=48))
+    
+    assert sweep["saturation_point"] == 4, \
+        f"Expected saturation at backend capacity 4, got {sweep['saturation_point']}: " \
+        f"{[(r['concurrency'], round(r['throughput_per_s'], 2)) for r in sweep['reports']]}"
@@ -8,42 +8,43 @@ import pytest
 import pandas as pd
 import json
 
+from validators.instrumentation import instrument
+from validators.numeric_features import parse_numeric_text
+from validators.text_cache import NormalizedTextCache
 
-def classify_burn_rate_risk(burn_rate_value):
+
+@instrument(rule_id="TC-12.5-01")
+def classify_burn_rate_risk(burn_rate_value, normalized: str = None):
     """Classify burn rate into risk levels"""
     if pd.isna(burn_rate_value) or burn_rate_value == "NA":
         return "Low"  # Not applicable means cash-flow positive
     
-    value_str = str(burn_rate_value).lower()
+    value_str = str(burn_rate_value).lower() if normalized is None else normalized
     
     if "not applicable" in value_str or "cash-flow positive" in value_str or "profitable" in value_str:
         return "Low"
     elif "zero" in value_str or "0" in value_str:
         return "Low"
     elif "$" in value_str:
-        # Extract amount if possible
-        try:
-            parts = value_str.split("$")
-            if len(parts) > 1:
-                amount_str = parts[1].split()[0].replace("m", "").replace("k", "")
-                amount = float(amount_str)
-                if amount < 1:  # Less than $1M/month
-                    return "Low"
-                elif amount < 5:  # Less than $5M/month
-                    return "Medium"
-                else:
-                    return "High"
-        except:
+        value, _, _, _, _, period, _ = parse_numeric_text(value_str)
+        if pd.isna(value):
+            return "Medium"
+        monthly = value / 12 if period == "year" else value
+        if monthly < 1_000_000:  # Less than $1M/month
+            return "Low"
+        elif monthly < 5_000_000:  # Less than $5M/month
             return "Medium"
+        return "High"
     return "Medium"
 
 
-def classify_customer_concentration_risk(concentration_value):
+@instrument(rule_id="TC-12.5-02")
+def classify_customer_concentration_risk(concentration_value, normalized: str = None):
     """Classify customer concentration into risk levels"""
     if pd.isna(concentration_value) or concentration_value == "NA":
         return "Low"
     
-    value_str = str(concentration_value).lower()
+    value_str = str(concentration_value).lower() if normalized is None else normalized
     
     if "yes" in value_str and ("top" in value_str or "%" in value_str):
         # Extract percentage if available
@@ -69,12 +70,13 @@ def classify_customer_concentration_risk(concentration_value):
     return "Medium"
 
 
-def classify_geopolitical_risk(geo_value):
+@instrument(rule_id="TC-12.5-03")
+def classify_geopolitical_risk(geo_value, normalized: str = None):
     """Classify geopolitical risk into levels"""
     if pd.isna(geo_value) or geo_value == "NA":
         return "Low"
     
-    value_str = str(geo_value).lower()
+    value_str = str(geo_value).lower() if normalized is None else normalized
     risk_count = len([x for x in value_str.split(";") if x.strip()])
     
     if risk_count >= 3:
@@ -85,15 +87,22 @@ def classify_geopolitical_risk(geo_value):
         return "Low"
 
 
+def classify_column(classifier, cache: NormalizedTextCache, column: str) -> list:
+    """Apply a risk classifier to a whole column, reusing the cache's lower-cased text"""
+    return [
+        classifier(raw, normalized)
+        for raw, normalized in zip(cache.df[column], cache.lower(column))
+    ]
+
+
 @pytest.mark.parametrize("company_idx", range(116))
-def test_burn_rate_risk_classification(company_idx):
+def test_burn_rate_risk_classification(company_idx, company_store):
     """Test 12.5.1: Appropriate burn rate risk assignment"""
-    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
-    if company_idx >= len(df):
+    if company_idx >= len(company_store):
         pytest.skip(f"Company index {company_idx} out of range")
     
-    row = df.iloc[company_idx]
+    row = company_store[company_idx]
     burn_rate = row.get("burn_rate", "NA")
     company_name = row.get("name", f"Company {company_idx}")
     
@@ -112,14 +121,13 @@ def test_burn_rate_risk_classification(company_idx):
 
 
 @pytest.mark.parametrize("company_idx", range(116))
-def test_customer_concentration_risk_classification(company_idx):
+def test_customer_concentration_risk_classification(company_idx, company_store):
     """Test 12.5.2: Appropriate customer concentration risk assignment"""
-    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
-    if company_idx >= len(df):
+    if company_idx >= len(company_store):
         pytest.skip(f"Company index {company_idx} out of range")
     
-    row = df.iloc[company_idx]
+    row = company_store[company_idx]
     concentration = row.get("customer_concentration_risk", "NA")
     company_name = row.get("name", f"Company {company_idx}")
     
@@ -138,14 +146,13 @@ def test_customer_concentration_risk_classification(company_idx):
 
 
 @pytest.mark.parametrize("company_idx", range(116))
-def test_geopolitical_risk_classification(company_idx):
+def test_geopolitical_risk_classification(company_idx, company_store):
     """Test 12.5.3: Appropriate geopolitical risk level assignment"""
-    df = pd.read_csv("data/Company Master(Flat Companies Data).csv")
     
-    if company_idx >= len(df):
+    if company_idx >= len(company_store):
         pytest.skip(f"Company index {company_idx} out of range")
     
-    row = df.iloc[company_idx]
+    row = company_store[company_idx]
     geo_risks = row.get("geopolitical_risks", "NA")
     company_name = row.get("name", f"Company {company_idx}")
     
@@ -179,3 +186,16 @@ def test_risk_classification_consistency():
             if pd.notna(burn_rate) and "cash-flow positive" in str(burn_rate).lower():
                 assert risk == "Low", \
                     f"Public profitable company should have Low burn rate risk"
+
+
+@pytest.mark.parametrize("classifier, column", [
+    (classify_burn_rate_risk, "burn_rate"),
+    (classify_customer_concentration_risk, "customer_concentration_risk"),
+    (classify_geopolitical_risk, "geopolitical_risks"),
+])
+def test_column_classification_matches_per_row(classifier, column, text_cache):
+    """Test 12.5.5: Column-wise classification over the shared text cache matches per-row results"""
+    expected = [classifier(value) for value in text_cache.df[column]]
+    
+    assert classify_column(classifier, text_cache, column) == expected, \
+        f"Cached classification of {column} differs from per-row classification"
@@ -0,0 +1,82 @@
+"""
+Zero-Copy Row Views
+Tests RowView mirrors the pd.Series access patterns validators rely on
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from validators.row_view import ColumnStore, RowView
+
+
+def make_store():
+    df = pd.DataFrame({
+        "name": ["Acme", "Beta", "Gamma"],
+        "office_count": [3, np.nan, 12],
+        "get": ["a", "b", "c"],
+    })
+    return df, ColumnStore(df)
+
+
+def test_access_matches_series():
+    """get, [], in, index and to_dict agree with df.iloc"""
+    df, store = make_store()
+    
+    for idx in range(len(df)):
+        row, view = df.iloc[idx], store.row(idx)
+        assert view.get("name") == row.get("name")
+        assert view["name"] == row["name"]
+        assert view.get("missing", "default") == row.get("missing", "default")
+        assert ("office_count" in view.index) == ("office_count" in row.index)
+        assert pd.Series(view.to_dict()).equals(pd.Series(row.to_dict()))
+
+
+def test_attribute_access():
+    """Columns are reachable as attributes; methods and .name (the row label) keep priority over columns"""
+    df, store = make_store()
+    view = store.row(1)
+    
+    assert view.name == df.iloc[1].name == 1
+    assert view["name"] == "Beta"
+    assert np.isnan(view.office_count)
+    assert callable(view.get)
+    assert view["get"] == "b"
+    with pytest.raises(AttributeError):
+        view.not_a_column
+
+
+def test_iteration_and_label_match_series():
+    """Iterating yields the values in column order; .name is the row label of a non-default index"""
+    df, _ = make_store()
+    df.index = ["a", "b", "c"]
+    store = ColumnStore(df)
+    
+    for idx in range(len(df)):
+        row, view = df.iloc[idx], store.row(idx)
+        assert view.name == row.name
+        assert len(view) == len(row)
+        assert [v for v in view if v == v] == [v for v in row if v == v]
+
+
+def test_positions_and_bounds():
+    """Negative positions resolve like iloc; out-of-range positions raise"""
+    _, store = make_store()
+    
+    assert store.row(-1).get("name") == "Gamma"
+    assert [view.get("name") for view in store.rows()] == ["Acme", "Beta", "Gamma"]
+    with pytest.raises(IndexError):
+        store.row(3)
+    with pytest.raises(KeyError):
+        store.row(0)["missing"]
+
+
+def test_views_share_column_storage():
+    """Row views hold no per-row copy of the data"""
+    _, store = make_store()
+    first, second = store.row(0), store.row(1)
+    
+    assert isinstance(first, RowView)
+    assert not hasattr(first, "__dict__")
+    assert first.index is second.index
+    assert store.column("name") is store.arrays[store.positions["name"]]
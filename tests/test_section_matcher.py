@@ -0,0 +1,70 @@
+"""
+Multi-pattern Section Detection (TC-13.3-05/06)
+Tests the Aho-Corasick matcher and the rule-driven section detector
+"""
+
+import json
+import random
+
+import pytest
+
+from validators.section_matcher import AhoCorasick, SectionDetector
+
+
+def _naive_matches(patterns, text):
+    lowered = text.lower()
+    return sorted(
+        (start, start + len(pattern), pattern_id)
+        for pattern_id, pattern in enumerate(patterns)
+        for start in range(len(text))
+        if lowered.startswith(pattern.lower(), start)
+    )
+
+
+def test_matches_equal_naive_search():
+    """Every overlapping match is found, as a per-pattern search would"""
+    patterns = ["he", "she", "his", "hers", "a", "aa", "ab", "bab"]
+    matcher = AhoCorasick(patterns)
+    rng = random.Random(7)
+    
+    for _ in range(200):
+        text = "".join(rng.choice("abhesrAB ") for _ in range(50))
+        assert sorted(matcher.findall(text)) == _naive_matches(patterns, text)
+
+
+def test_case_folding_keeps_offsets():
+    """Offsets refer to the original text even when lower-casing changes length"""
+    matcher = AhoCorasick(["overview"])
+    text = "İstanbul OVERVIEW"
+    
+    [(start, end, _)] = matcher.findall(text)
+    assert text[start:end] == "OVERVIEW"
+
+
+def test_case_sensitive_mode():
+    matcher = AhoCorasick(["Name"], ignore_case=False)
+    
+    assert len(matcher.findall("name Name NAME")) == 1
+
+
+def test_empty_pattern_rejected():
+    with pytest.raises(ValueError):
+        AhoCorasick(["ok", ""])
+
+
+def test_detector_from_rules():
+    """Headers, degradation markers and TC-14.3 field labels come from the rule files"""
+    with open("rules/token_limit_rules.json") as f:
+        token_rules = json.load(f)
+    with open("rules/test_tc_14_3.json") as f:
+        field_rules = json.load(f)
+    detector = SectionDetector.from_rules(token_rules, field_rules)
+    
+    output = "COMPANY IDENTITY\nCompany Name: Acme\n[Summary] condensed text\nOPERATIONAL DETAILS\nOffices: Pune\n"
+    scan = detector.scan(output)
+    
+    assert [s["section"] for s in scan["sections"]] == ["company_identity", "operational_details"]
+    assert scan["order_valid"]
+    assert scan["sections"][1]["end"] == len(output)
+    assert scan["degradation"]["summarization"] == output.index("[Summary]")
+    assert "Company Name" in scan["fields"]
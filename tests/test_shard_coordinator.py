@@ -0,0 +1,134 @@
+"""
+Sharded Validation
+Tests hash partitioning, coordinator/worker round trips over TCP, deterministic
+merges, retries of failed shards and the cross-shard duplicate and shared
+identity value checks built from signatures
+"""
+
+import json
+import multiprocessing
+import socket
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from validators.entity_resolution import find_duplicate_companies
+from validators.shard_coordinator import (
+    ShardCoordinator, ShardWorker, identity_signatures, merge_shard_results, serve_worker, shard_of,
+    validate_shard
+)
+from validators.validation_suite import ValidationSuite, company_keys, summarize
+
+MASTER_CSV = "data/Company Master(Flat Companies Data).csv"
+
+
+@pytest.fixture(scope="module")
+def workers():
+    started = [ShardWorker().start() for _ in range(3)]
+    yield [worker.address for worker in started]
+    for worker in started:
+        worker.stop()
+
+
+@pytest.fixture(scope="module")
+def master():
+    df = pd.read_csv(MASTER_CSV)
+    return df, company_keys(df)
+
+
+def dead_address():
+    """An address nothing listens on"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()
+
+
+def test_shard_of_is_stable_and_balanced():
+    keys = list(range(1, 100_001)) + [f"row-{i}" for i in range(100)]
+    shards = shard_of(keys, 8)
+
+    assert (shards == shard_of(keys, 8)).all()
+    assert set(shards.tolist()) == set(range(8))
+    assert np.bincount(shards).min() > 0.9 * len(keys) / 8
+
+
+def test_merged_results_match_single_process_run(workers, master):
+    df, keys = master
+    report = ShardCoordinator(workers, n_shards=5).run(MASTER_CSV)
+
+    assert report["rows"] == len(df)
+    assert sum(shard["rows"] for shard in report["shards"]) == len(df)
+    assert report["results"] == json.loads(json.dumps(summarize(ValidationSuite().run(df), keys)))
+    assert report["duplicates"] == [[keys[i] for i in c] for c in find_duplicate_companies(df)["clusters"]]
+
+
+def test_merge_is_deterministic(workers, master):
+    df, keys = master
+    three = ShardCoordinator(workers, n_shards=3).run(MASTER_CSV, max_rows=2)
+    seven = ShardCoordinator(list(reversed(workers)), n_shards=7).run(MASTER_CSV, max_rows=2)
+    shards = [validate_shard(MASTER_CSV, shard, 4, max_rows=2) for shard in range(4)]
+    for shard in shards:
+        shard.update(worker=["local", 0], attempts=1, errors=[])
+    shuffled = merge_shard_results(shards[::-1], max_rows=2)
+
+    expected = json.loads(json.dumps(summarize(ValidationSuite().run(df), keys, max_rows=2)))
+    for report in (three, seven, shuffled):
+        assert report["results"] == expected
+        assert report["duplicates"] == three["duplicates"]
+        assert report["shared_identity_values"] == three["shared_identity_values"]
+
+
+def test_failed_shards_are_retried_on_other_workers(workers):
+    report = ShardCoordinator([dead_address()] + workers, n_shards=4).run(MASTER_CSV)
+
+    retried = [shard for shard in report["shards"] if shard["attempts"] > 1]
+    assert retried, "No shard was routed to the dead worker"
+    assert all(len(shard["errors"]) == shard["attempts"] - 1 for shard in report["shards"])
+    assert report["rows"] == 132
+
+
+def test_shard_failing_everywhere_raises(workers, tmp_path):
+    with pytest.raises(RuntimeError, match="failed after 2 attempts"):
+        ShardCoordinator(workers, max_attempts=2).run(str(tmp_path / "missing.csv"))
+
+
+def test_identity_values_shared_across_shards():
+    df = pd.DataFrame({
+        "company_id": [1, 2, 3, 4, 5, 6],
+        "name": ["Acme", "Zenith", "Northwind", "Contoso", "Fabrikam", "Initech"],
+        "website_url": ["https://acme.com", "https://zenith.io", "https://ACME.com", None, "https://fab.com",
+                        "https://initech.com"],
+        "primary_phone_number": ["N/A", "N/A", "+1 555 0100", "+1 555 0100", "+1 555 0100", "N/A"],
+        "ceo_name": ["Jane Roe", "Ann Lee", "Bo Chan", "Cy Park", "Jane Roe", "Di Wu"],
+    })
+    shards = []
+    for shard, part in enumerate([df.iloc[[0, 3]], df.iloc[[1, 4]], df.iloc[[2, 5]]]):
+        shards.append({"shard": shard, "rows": len(part), "results": {}, "names": {}, "worker": ["local", 0],
+                       "attempts": 1, "errors": [], "identity": identity_signatures(part)})
+    report = merge_shard_results(shards, min_share=0.5)
+
+    # The phone number is shared by half the companies, so it is common; "N/A" is a null token
+    assert report["shared_identity_values"] == [
+        {"companies": [1, 3], "columns": ["website_url"]},
+        {"companies": [1, 5], "columns": ["ceo_name"]},
+    ]
+
+
+def test_workers_in_separate_processes(master):
+    df, keys = master
+    context = multiprocessing.get_context("spawn")
+    ready = context.Queue()
+    processes = [context.Process(target=serve_worker, kwargs={"ready": ready}, daemon=True) for _ in range(2)]
+    for process in processes:
+        process.start()
+    try:
+        addresses = [ready.get(timeout=60) for _ in processes]
+        report = ShardCoordinator(addresses, n_shards=4).run(MASTER_CSV)
+    finally:
+        for process in processes:
+            process.terminate()
+            process.join()
+
+    assert {tuple(shard["worker"]) for shard in report["shards"]} == set(map(tuple, addresses))
+    assert report["results"] == json.loads(json.dumps(summarize(ValidationSuite().run(df), keys)))
@@ -0,0 +1,65 @@
+"""
+Shared Normalized-Text Cache
+Tests derived columns are computed once, shared, and invalidated explicitly
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+
+from validators.text_cache import NormalizedTextCache
+
+
+def make_frame():
+    return pd.DataFrame({
+        "name": ["  Acme  Corp ", "BETA\tLtd", np.nan],
+        "office_count": [3, np.nan, 12],
+    })
+
+
+def test_variants_are_normalized():
+    """Stripped, lower, collapsed and length variants follow the scalar str() semantics"""
+    cache = NormalizedTextCache(make_frame())
+    
+    assert cache.stripped("name").tolist()[:2] == ["Acme  Corp", "BETA\tLtd"]
+    assert cache.lower("name").tolist()[:2] == ["acme  corp", "beta\tltd"]
+    assert cache.collapsed("name").tolist()[:2] == ["acme corp", "beta ltd"]
+    assert cache.lengths("name").tolist() == [10, 8, 0]
+    assert pd.isna(cache.value("name", 2))
+    assert cache.value("office_count", 0) == "3.0"
+
+
+def test_columns_computed_once():
+    """Repeated access reuses the derived column instead of recomputing it"""
+    cache = NormalizedTextCache(make_frame())
+    
+    first = cache.lower("name")
+    misses = cache.misses
+    second = cache.lower("name")
+    
+    assert first is second
+    assert cache.misses == misses
+    assert cache.hits >= 1
+
+
+def test_invalidation_after_base_change():
+    """Explicit invalidation picks up edits to the base frame"""
+    df = make_frame()
+    cache = NormalizedTextCache(df)
+    assert cache.value("name", 0) == "acme  corp"
+    
+    df.loc[0, "name"] = "Gamma Inc"
+    assert cache.value("name", 0) == "acme  corp"
+    
+    cache.invalidate("name")
+    assert cache.value("name", 0) == "gamma inc"
+    
+    cache.rebind(pd.DataFrame({"name": ["Delta"]}))
+    assert cache.value("name", 0) == "delta"
+
+
+def test_unknown_variant_rejected():
+    """Only the documented variants can be requested"""
+    cache = NormalizedTextCache(make_frame())
+    with pytest.raises(ValueError):
+        cache.get("name", "upper")
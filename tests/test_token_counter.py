@@ -0,0 +1,69 @@
+"""
+Offline Token Counter (TC-13.3)
+Tests the heuristic tokenizer, its memo cache and column / section totals
+"""
+
+import pandas as pd
+import numpy as np
+
+from validators.token_counter import TokenCounter, split_sections
+
+
+def test_pretokenization_covers_text():
+    """Pieces concatenate back to the original text"""
+    text = "Acme_Corp's revenue grew 12,345% in 2024 — très bien!\n\nNext line."
+    
+    assert "".join(TokenCounter.tokenize(text)) == text
+
+
+def test_counts_scale_with_text():
+    """Short words are one token; longer and non-ASCII text costs more"""
+    counter = TokenCounter()
+    
+    assert counter.count("the cat sat") == 3
+    assert counter.count("internationalization") > counter.count("global")
+    assert counter.count("東京都") > 1
+    assert counter.count(None) == counter.count(np.nan) == counter.count("") == 0
+    assert counter.count(2024.0) == counter.count("2024.0")
+
+
+def test_memo_cache_hits():
+    """Repeated texts are served from the cache"""
+    counter = TokenCounter()
+    first = counter.count("Repeated overview text.")
+    second = counter.count("Repeated overview text.")
+    
+    assert first == second
+    assert counter.hits == 1 and counter.misses == 1
+
+
+def test_cache_is_bounded():
+    """The text cache never grows past its limit"""
+    counter = TokenCounter(max_cache_entries=10)
+    for i in range(25):
+        counter.count(f"text number {i}")
+    
+    assert len(counter._cache) <= 10
+
+
+def test_column_counts_match_per_value():
+    """Column counting (distinct values once) equals per-value counting"""
+    counter = TokenCounter()
+    values = pd.Series(["Pune; Austin", np.nan, "Pune; Austin", "Remote-first company"])
+    
+    counts = counter.count_column(values)
+    
+    assert counts.tolist() == [counter.count(v) for v in values]
+    assert counts.iloc[1] == 0
+
+
+def test_section_totals():
+    """Rendered profiles split on upper-case headers and sum to the total"""
+    rendered = "Intro line\nCOMPANY IDENTITY\nName: Acme\nBUSINESS OVERVIEW\nAcme builds rockets.\n"
+    
+    sections = split_sections(rendered)
+    totals = TokenCounter().count_rendered_sections(rendered)
+    
+    assert list(sections) == ["preamble", "COMPANY IDENTITY", "BUSINESS OVERVIEW"]
+    assert sections["BUSINESS OVERVIEW"] == "Acme builds rockets."
+    assert totals["total"] == sum(v for k, v in totals.items() if k != "total")
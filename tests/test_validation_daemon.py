@@ -0,0 +1,160 @@
+"""
+Validation Daemon
+Tests the resident daemon answers whole-run, rule-subset and company-subset
+requests like a direct ValidationSuite run, within milliseconds, and reloads
+when the master or a rule file changes
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+import pytest
+
+from validators.constraint_engine import CONSTRAINTS_PATH
+from validators.validation_daemon import ValidationClient, ValidationDaemon
+from validators.validation_suite import ValidationSuite, company_keys, summarize
+
+MASTER_CSV = "data/Company Master(Flat Companies Data).csv"
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Copies of the master and constraints file, and a short socket path (AF_UNIX paths are length-limited)"""
+    master = tmp_path / "master.csv"
+    constraints = tmp_path / "constraints.json"
+    shutil.copy(MASTER_CSV, master)
+    shutil.copy(CONSTRAINTS_PATH, constraints)
+    socket_dir = tempfile.mkdtemp(prefix="vd")
+    yield {"master": str(master), "constraints": str(constraints), "socket": os.path.join(socket_dir, "sock")}
+    shutil.rmtree(socket_dir, ignore_errors=True)
+
+
+def start_daemon(workspace, poll_interval=1.0):
+    return ValidationDaemon(workspace["socket"], workspace["master"], poll_interval=poll_interval,
+                            constraints_path=workspace["constraints"])
+
+
+def touch(path, content):
+    """Rewrite a file and move its mtime forward, so coarse filesystem clocks still see a change"""
+    with open(path, "w") as f:
+        f.write(content)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_whole_run_matches_direct_suite(workspace):
+    df = pd.read_csv(workspace["master"])
+    expected = summarize(ValidationSuite(constraints_path=workspace["constraints"]).run(df), company_keys(df))
+
+    with start_daemon(workspace), ValidationClient(workspace["socket"]) as client:
+        assert client.request("ping")["ok"]
+        response = client.validate()
+
+    assert response["ok"]
+    assert response["results"] == json.loads(json.dumps(expected))
+    assert {result["check"] for result in response["results"].values()} == {
+        "cross_field", "contact_fields", "entity_type", "mandatory"}
+
+
+def test_rule_company_and_check_subsets(workspace):
+    with start_daemon(workspace), ValidationClient(workspace["socket"]) as client:
+        whole = client.validate()["results"]
+        rule_id = max(whole, key=lambda r: whole[r]["violations"])
+        companies = whole[rule_id]["companies"][:2]
+
+        by_rule = client.validate(rules=[rule_id])["results"]
+        by_company = client.validate(companies=companies)["results"]
+        by_check = client.validate(checks=["cross_field"])["results"]
+        capped = client.validate(rules=[rule_id], max_rows=1)["results"]
+        unknown = client.validate(rules=["CF-99"])
+
+    assert list(by_rule) == [rule_id]
+    assert by_company[rule_id] == {"check": whole[rule_id]["check"], "violations": 2, "companies": companies}
+    assert all(set(result["companies"]) <= set(companies) for result in by_company.values())
+    assert set(by_check) == {r for r, result in whole.items() if result["check"] == "cross_field"}
+    assert capped[rule_id]["violations"] == whole[rule_id]["violations"]
+    assert len(capped[rule_id]["companies"]) == 1
+    assert not unknown["ok"] and "CF-99" in unknown["error"]
+
+
+def test_requests_answer_in_milliseconds(workspace):
+    with start_daemon(workspace), ValidationClient(workspace["socket"]) as client:
+        client.validate()
+        start = time.perf_counter()
+        for _ in range(50):
+            response = client.validate(rules=["CF-07"], companies=[15, 17])
+        average_ms = (time.perf_counter() - start) * 1000 / 50
+
+    assert response["results"]["CF-07"]["companies"] == [15, 17]
+    assert average_ms < 50, f"Average request latency {average_ms:.1f}ms"
+
+
+def test_reloads_when_master_or_rules_change(workspace):
+    with start_daemon(workspace, poll_interval=0.05) as daemon, ValidationClient(workspace["socket"]) as client:
+        before = client.validate(rules=["TC_14.3:website_url"])
+        initial = client.request("status")
+
+        df = pd.read_csv(workspace["master"])
+        df.loc[df["company_id"] == 1, "website_url"] = None
+        touch(workspace["master"], df.to_csv(index=False))
+        assert wait_for(lambda: daemon.reloads == 1), "Master change was not picked up"
+        after = client.validate(rules=["TC_14.3:website_url"])
+
+        with open(workspace["constraints"]) as f:
+            rules = json.load(f)
+        rules["constraints"] = [c for c in rules["constraints"] if c["id"] != "CF-07"]
+        touch(workspace["constraints"], json.dumps(rules))
+        assert wait_for(lambda: daemon.reloads == 2), "Rules change was not picked up"
+        status = client.request("status")
+
+    assert after["snapshot"] != initial["snapshot"] == before["snapshot"]
+    assert after["results"]["TC_14.3:website_url"]["violations"] == \
+        before["results"]["TC_14.3:website_url"]["violations"] + 1
+    assert 1 in after["results"]["TC_14.3:website_url"]["companies"]
+    assert status["rules"] == initial["rules"] - 1
+
+
+def test_failed_reload_keeps_serving_previous_state(workspace):
+    with start_daemon(workspace, poll_interval=0.05) as daemon, ValidationClient(workspace["socket"]) as client:
+        before = client.validate()
+        touch(workspace["constraints"], '{"constraints": [')  # half-written rules file
+        assert wait_for(lambda: daemon.reload_error is not None), "Broken rules file was not noticed"
+        status = client.request("status")
+        during = client.validate()
+
+        with open(CONSTRAINTS_PATH) as f:
+            touch(workspace["constraints"], f.read())
+        assert wait_for(lambda: daemon.reload_error is None and daemon.reloads == 1)
+
+    assert status["reload_error"].startswith("JSONDecodeError")
+    assert during["results"] == before["results"]
+
+
+@pytest.mark.parametrize("request_line, error", [
+    (b"[1]", "JSON object"),
+    (b'{"op": "validate", "max_rows": "3"}', "max_rows"),
+    (b'{"op": "validate", "companies": [[1]]}', "companies"),
+    (b'{"op": "validate", "checks": ["nope"]}', "nope"),
+    (b'{"op": "validate", "rules": "CF-01"}', "rules"),
+    (b"{not json", ""),
+])
+def test_malformed_requests_get_error_responses(workspace, request_line, error):
+    with start_daemon(workspace), ValidationClient(workspace["socket"]) as client:
+        response = client._request_line(request_line)
+        alive = client.request("ping")
+
+    assert not response["ok"] and error in response["error"]
+    assert alive["ok"], "The connection was dropped after a bad request"
@@ -0,0 +1,198 @@
+"""
+One-pass streaming column profiler
+Reads the master in chunks and keeps mergeable sketches per column: a
+HyperLogLog for the distinct count, t-digests for text lengths and for parsed
+numeric values (ratings, scores, amounts), and exact counters for the null
+placeholders NullDataHandler recognizes. Each chunk is factorized first, so
+sketches see every distinct value once with its count as weight. Memory per
+column is fixed (4 KB of HLL registers plus a few hundred centroids) whatever
+the file size, and profiles of separate chunks or files merge into the profile
+of their union. The summary is a small JSON document that check_profile
+compares against the numeric ranges and enums of rules/rules.json.
+"""
+
+import json
+from collections import Counter
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from validators.field_names import column_for
+from validators.null_tokens import NULL_TOKENS
+from validators.numeric_features import NUMERIC_COLUMNS, parse_numeric_values
+from validators.sketches import HyperLogLog, TDigest
+
+# Columns whose parsed values get a quantile sketch, besides the numeric feature columns
+RATING_COLUMNS = [
+    "glassdoor_rating", "indeed_rating", "google_rating", "website_rating", "brand_sentiment_score",
+    "net_promoter_score", "diversity_inclusion_score", "tech_adoption_rating",
+]
+PROFILE_QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+# Exact value counts (for enum checks) are kept while a column has at most MAX_TRACKED_VALUES
+# distinct values, none longer than MAX_TRACKED_LENGTH characters
+MAX_TRACKED_VALUES = 256
+MAX_TRACKED_LENGTH = 64
+NULL_KEY = "<null>"
+
+
+class ColumnProfile:
+    """Sketches of one column: rows, null placeholders, distinct values, text lengths, numeric values"""
+
+    def __init__(self, numeric: bool = False, precision: int = 12, compression: float = 200):
+        self.rows = 0
+        self.nulls = Counter()
+        self.distinct = HyperLogLog(precision)
+        self.lengths = TDigest(compression)
+        self.numbers = TDigest(compression) if numeric else None
+        self.values = Counter()  # None once more than MAX_TRACKED_VALUES distinct values were seen
+
+    def update(self, values: pd.Series):
+        self.rows += len(values)
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        missing = int((codes < 0).sum())
+        if missing:
+            self.nulls[NULL_KEY] += missing
+        if not len(uniques):
+            return
+
+        text = pd.Series(uniques, dtype=object).astype(str).str.strip()
+        lowered = text.str.lower()
+        placeholder = lowered.isin(NULL_TOKENS).to_numpy()
+        if placeholder.any():
+            per_token = pd.Series(counts[placeholder]).groupby(lowered[placeholder].to_numpy()).sum()
+            self.nulls.update({token: int(n) for token, n in per_token.items()})
+
+        present = text[~placeholder]
+        weights = counts[~placeholder]
+        if not len(present):
+            return
+        self.distinct.add_hashes(pd.util.hash_pandas_object(present, index=False).to_numpy())
+        lengths = present.str.len().to_numpy()
+        self.lengths.add(lengths, weights)
+        if self.numbers is not None:
+            parsed = parse_numeric_values(present.reset_index(drop=True))
+            self.numbers.add(parsed["value"].to_numpy(), weights)
+        if self.values is not None and lengths.max() > MAX_TRACKED_LENGTH:
+            self.values = None
+        if self.values is not None:
+            # Distinct raw values can strip to the same text ("Low", "Low "), so sum their counts
+            per_value = pd.Series(weights).groupby(present.to_numpy()).sum()
+            self.values.update({value: int(n) for value, n in per_value.items()})
+            if len(self.values) > MAX_TRACKED_VALUES:
+                self.values = None
+
+    def merge(self, other: "ColumnProfile"):
+        self.rows += other.rows
+        self.nulls.update(other.nulls)
+        self.distinct.merge(other.distinct)
+        self.lengths.merge(other.lengths)
+        if self.numbers is not None and other.numbers is not None:
+            self.numbers.merge(other.numbers)
+        if self.values is not None and other.values is not None:
+            self.values.update(other.values)
+            if len(self.values) > MAX_TRACKED_VALUES:
+                self.values = None
+        else:
+            self.values = None
+
+    def summary(self) -> Dict:
+        null_count = sum(self.nulls.values())
+        summary = {
+            "rows": self.rows,
+            "null_count": null_count,
+            "null_rate": round(null_count / self.rows, 6) if self.rows else 0.0,
+            "null_tokens": dict(self.nulls.most_common()),
+            "distinct_estimate": self.distinct.count(),
+            "length": self._quantiles(self.lengths),
+        }
+        if self.numbers is not None:
+            summary["numeric"] = self._quantiles(self.numbers)
+        summary["values"] = dict(self.values.most_common()) if self.values is not None else None
+        return summary
+
+    @staticmethod
+    def _quantiles(digest: TDigest) -> Dict:
+        if not digest.count:
+            return {"count": 0}
+        return {
+            "count": int(digest.count),
+            "min": digest.min,
+            "max": digest.max,
+            **{f"p{round(q * 100):02d}": round(digest.quantile(q), 4) for q in PROFILE_QUANTILES},
+        }
+
+
+class StreamingProfiler:
+    """Column profiles built one chunk at a time"""
+
+    def __init__(self, numeric_columns: List = None, precision: int = 12, compression: float = 200):
+        self.numeric_columns = set(RATING_COLUMNS + NUMERIC_COLUMNS if numeric_columns is None else numeric_columns)
+        self.precision = precision
+        self.compression = compression
+        self.columns = {}
+        self.chunks = 0
+
+    def update(self, chunk: pd.DataFrame) -> "StreamingProfiler":
+        for column in chunk.columns:
+            if column not in self.columns:
+                self.columns[column] = ColumnProfile(column in self.numeric_columns, self.precision, self.compression)
+            self.columns[column].update(chunk[column])
+        self.chunks += 1
+        return self
+
+    def profile_csv(self, path: str, chunksize: int = 100_000) -> "StreamingProfiler":
+        """One pass over a CSV; cells are read as text so placeholders such as "NA" reach the null counters"""
+        for chunk in pd.read_csv(path, chunksize=chunksize, dtype=str, keep_default_na=False, na_values=[""]):
+            self.update(chunk)
+        return self
+
+    def merge(self, other: "StreamingProfiler") -> "StreamingProfiler":
+        for column, profile in other.columns.items():
+            if column in self.columns:
+                self.columns[column].merge(profile)
+            else:
+                self.columns[column] = profile
+        self.chunks += other.chunks
+        return self
+
+    def summary(self) -> Dict:
+        rows = max((profile.rows for profile in self.columns.values()), default=0)
+        return {"rows": rows, "chunks": self.chunks,
+                "columns": {column: profile.summary() for column, profile in self.columns.items()}}
+
+    def save(self, path: str) -> Dict:
+        summary = self.summary()
+        with open(path, "w") as f:
+            json.dump(summary, f, indent=1)
+        return summary
+
+
+def check_profile(summary: Dict, rules: Dict) -> List[Dict]:
+    """Violations of rules.json-style numeric ranges and enums by a profile summary"""
+    violations = []
+    for field, rule in rules.items():
+        column = column_for(field)
+        profile = summary["columns"].get(column)
+        if profile is None:
+            continue
+        if rule.get("type") == "numeric":
+            numeric = profile.get("numeric", {})
+            if numeric.get("count"):
+                if "min" in rule and numeric["min"] < rule["min"]:
+                    violations.append({"field": field, "column": column, "check": "min",
+                                       "limit": rule["min"], "observed": numeric["min"]})
+                if "max" in rule and numeric["max"] > rule["max"]:
+                    violations.append({"field": field, "column": column, "check": "max",
+                                       "limit": rule["max"], "observed": numeric["max"]})
+        elif rule.get("type") == "enum":
+            if profile["values"] is None:
+                violations.append({"field": field, "column": column, "check": "enum",
+                                   "observed": "too many or too long distinct values to be an enum"})
+                continue
+            unexpected = {value: n for value, n in profile["values"].items() if value not in rule["allowed"]}
+            if unexpected:
+                violations.append({"field": field, "column": column, "check": "enum", "observed": unexpected})
+    return violations
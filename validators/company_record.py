@@ -0,0 +1,123 @@
+"""
+Immutable company records
+Frozen mappings that share their field schema and value references instead of
+deep-copying, with copy-on-write updates. Mutable containers are frozen on entry,
+so isolation between registered companies is structural.
+"""
+
+import weakref
+from collections.abc import Mapping
+
+
+class RecordSchema:
+    """Interned, ordered field names with a name -> position lookup"""
+
+    __slots__ = ("fields", "positions", "__weakref__")
+
+    # Held only while some record uses the schema, so one-off field orders do not accumulate
+    _interned = weakref.WeakValueDictionary()
+
+    def __init__(self, fields: tuple):
+        self.fields = fields
+        self.positions = {name: pos for pos, name in enumerate(fields)}
+
+    @classmethod
+    def for_fields(cls, fields) -> "RecordSchema":
+        """Shared schema instance for this exact field order"""
+        fields = tuple(fields)
+        schema = cls._interned.get(fields)
+        if schema is None:
+            schema = cls._interned[fields] = cls(fields)
+        return schema
+
+
+def freeze(value):
+    """Immutable equivalent of a value; scalars are returned as-is (by reference)"""
+    if isinstance(value, CompanyRecord):
+        return value
+    if isinstance(value, dict):
+        return CompanyRecord.of(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    return value
+
+
+class CompanyRecord(Mapping):
+    """Read-only company mapping: a shared schema plus a tuple of value references"""
+
+    __slots__ = ("_schema", "_values")
+
+    def __init__(self, schema: RecordSchema, values: tuple):
+        if len(values) != len(schema.fields):
+            raise ValueError(f"Expected {len(schema.fields)} values, got {len(values)}")
+        self._schema = schema
+        self._values = values
+
+    @classmethod
+    def of(cls, data) -> "CompanyRecord":
+        """Record for a mapping; existing records are returned by reference"""
+        if isinstance(data, CompanyRecord):
+            return data
+        schema = RecordSchema.for_fields(data.keys())
+        return cls(schema, tuple(freeze(data[name]) for name in schema.fields))
+
+    @classmethod
+    def from_row(cls, row, fields) -> "CompanyRecord":
+        """Record of selected fields from a Series or RowView, without copying the row"""
+        schema = RecordSchema.for_fields(fields)
+        return cls(schema, tuple(freeze(row.get(name)) for name in schema.fields))
+
+    @property
+    def schema(self) -> RecordSchema:
+        return self._schema
+
+    def __getitem__(self, key):
+        pos = self._schema.positions.get(key)
+        if pos is None:
+            raise KeyError(key)
+        return self._values[pos]
+
+    def __iter__(self):
+        return iter(self._schema.fields)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key) -> bool:
+        return key in self._schema.positions
+
+    def __setattr__(self, name, value):
+        if hasattr(self, "_values"):
+            raise AttributeError("CompanyRecord is immutable; use set() to derive a new record")
+        object.__setattr__(self, name, value)
+
+    def __hash__(self) -> int:
+        return hash((self._schema.fields, self._values))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompanyRecord):
+            return self._schema.fields == other._schema.fields and self._values == other._values
+        return Mapping.__eq__(self, other)
+
+    def __repr__(self) -> str:
+        return f"CompanyRecord({dict(self.items())!r})"
+
+    def set(self, key, value) -> "CompanyRecord":
+        """Copy-on-write update: a new record sharing every other value reference"""
+        pos = self._schema.positions.get(key)
+        if pos is None:
+            schema = RecordSchema.for_fields(self._schema.fields + (key,))
+            return CompanyRecord(schema, self._values + (freeze(value),))
+        values = list(self._values)
+        values[pos] = freeze(value)
+        return CompanyRecord(self._schema, tuple(values))
+
+    def map_values(self, func) -> "CompanyRecord":
+        """New record with func applied to every value, sharing this record's schema"""
+        return CompanyRecord(self._schema, tuple(func(v) for v in self._values))
+
+    def to_dict(self) -> dict:
+        """Plain mutable dict copy for callers that need to edit"""
+        return dict(zip(self._schema.fields, self._values))
@@ -0,0 +1,325 @@
+"""
+Declarative cross-field constraints
+Constraints are loaded from rules/cross_field_constraints.json as pairs of
+expressions: `when` (which rows the constraint applies to) and `require` (what
+must hold there), e.g. "present(annual_profit)" -> "present(annual_revenue)" or
+"tam >= sam >= som". Each expression is parsed once into a tree of vectorized
+numpy operations. A shared ColumnContext derives every column view (null mask,
+parsed number, percent, pattern match) at most once, so all constraints are
+evaluated over all rows in one pass.
+
+Numbers are read through validators.numeric_features, so amounts in other
+currencies are converted to USD with approximate rates (DEFAULT_CURRENCY_RATES,
+or the rules file's currency_rates); they are only meant for consistency checks.
+Comparisons with a value that is missing or not a number are unknown rather than
+false (three-valued logic), so a row only violates a constraint when `when` is
+known true and `require` is known false. Names in BOUND_NAMES (current_year) are
+not columns; the engine binds them when it evaluates a frame.
+"""
+
+import ast
+import json
+import operator
+from datetime import date
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from validators.null_tokens import NULL_TOKENS
+from validators.numeric_features import NumericFeatureStore, parse_numeric_values
+
+CONSTRAINTS_PATH = "rules/cross_field_constraints.json"
+
+# Expression names bound by the engine rather than read from a column
+BOUND_NAMES = ("current_year",)
+
+_COMPARE = {
+    ast.Gt: operator.gt, ast.GtE: operator.ge, ast.Lt: operator.lt, ast.LtE: operator.le,
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+}
+_ARITHMETIC = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv}
+
+
+class ColumnContext:
+    """Per-frame cache of derived column arrays shared by every constraint"""
+
+    def __init__(self, df: pd.DataFrame, currency_rates: Dict = None, feature_store: NumericFeatureStore = None,
+                 names: Dict = None):
+        self.df = df
+        self.currency_rates = currency_rates
+        self.feature_store = feature_store
+        self.names = names or {}
+        self._cache = {}
+
+    def _get(self, key: tuple, compute):
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _distinct(self, column: str) -> tuple:
+        """(codes, distinct values as strings); text views are derived per distinct value and broadcast"""
+        def compute():
+            codes, uniques = pd.factorize(self.df[column], use_na_sentinel=True)
+            return codes, pd.Series(uniques, dtype=object).astype("string")
+        return self._get(("distinct", column), compute)
+
+    def _broadcast(self, column: str, per_value: np.ndarray, missing) -> np.ndarray:
+        codes, _ = self._distinct(column)
+        # Slot -1 (missing cells) takes the `missing` value
+        return np.append(per_value, missing)[codes]
+
+    def null(self, column: str) -> np.ndarray:
+        def compute():
+            values = self.df[column]
+            if pd.api.types.is_numeric_dtype(values):
+                return values.isna().to_numpy()
+            lowered = self._distinct(column)[1].str.strip().str.lower()
+            return self._broadcast(column, lowered.isin(NULL_TOKENS).to_numpy(dtype=bool), True)
+        return self._get(("null", column), compute)
+
+    def _parsed(self, column: str) -> Dict:
+        def compute():
+            # Reuse the snapshot's parsed features when they were built with the same rates
+            store = self.feature_store
+            if store is not None and column in store.columns and self.currency_rates is None:
+                features = store[column]
+            else:
+                features = parse_numeric_values(self.df[column], self.currency_rates)
+            return {"value": features["value"].to_numpy(), "percent": features["percent"].to_numpy()}
+        return self._get(("parsed", column), compute)
+
+    def number(self, column: str) -> np.ndarray:
+        """Numeric value of a column (NaN when missing, non-numeric or a percentage)"""
+        def compute():
+            values = self.df[column]
+            if pd.api.types.is_numeric_dtype(values):
+                return values.to_numpy(dtype=float)
+            parsed = self._parsed(column)
+            return np.where(parsed["percent"] | self.null(column), np.nan, parsed["value"])
+        return self._get(("number", column), compute)
+
+    def percent(self, column: str) -> np.ndarray:
+        """Percentage value of a column (NaN unless the cell is a percentage)"""
+        def compute():
+            parsed = self._parsed(column)
+            return np.where(parsed["percent"] & ~self.null(column), parsed["value"], np.nan)
+        return self._get(("percent", column), compute)
+
+    def matches(self, column: str, pattern: str) -> np.ndarray:
+        def compute():
+            found = self._distinct(column)[1].str.contains(pattern, case=False, regex=True)
+            return self._broadcast(column, found.fillna(False).to_numpy(dtype=bool), False)
+        return self._get(("matches", column, pattern), compute)
+
+
+class _Node:
+    """Compiled expression node; evaluate() returns a float array or a (value, known) bool pair"""
+
+    def __init__(self, kind: str, evaluate, columns: set):
+        self.kind = kind  # "number" or "bool"
+        self.evaluate = evaluate
+        self.columns = columns
+
+
+class Constraint:
+    """One compiled constraint: rows where `when` holds must satisfy `require`"""
+
+    FUNCTIONS = {
+        "present": ("bool", lambda ctx, col: (~ctx.null(col), np.ones(len(ctx.df), dtype=bool))),
+        "null": ("bool", lambda ctx, col: (ctx.null(col), np.ones(len(ctx.df), dtype=bool))),
+        "number": ("number", lambda ctx, col: ctx.number(col)),
+        "percent": ("number", lambda ctx, col: ctx.percent(col)),
+        "matches": ("bool", lambda ctx, col, pattern: (ctx.matches(col, pattern), np.ones(len(ctx.df), dtype=bool))),
+    }
+
+    def __init__(self, constraint_id: str, require: str, when: str = None, description: str = "",
+                 severity: str = "error"):
+        self.id = constraint_id
+        self.description = description
+        self.severity = severity
+        self.when_text = when
+        self.require_text = require
+        self._when = self._compile_bool(when) if when else None
+        self._require = self._compile_bool(require)
+        self.columns = self._require.columns | (self._when.columns if self._when else set())
+
+    @classmethod
+    def from_dict(cls, spec: Dict) -> "Constraint":
+        return cls(spec["id"], spec["require"], when=spec.get("when"),
+                   description=spec.get("description", ""), severity=spec.get("severity", "error"))
+
+    def _compile_bool(self, text: str) -> _Node:
+        try:
+            tree = ast.parse(text, mode="eval").body
+        except SyntaxError as exc:
+            raise ValueError(f"{self.id}: cannot parse '{text}': {exc.msg}") from None
+        node = self._compile(tree)
+        if node.kind != "bool":
+            raise ValueError(f"{self.id}: '{text}' is a number, not a condition")
+        return node
+
+    def _compile(self, tree) -> _Node:
+        if isinstance(tree, ast.Name) and tree.id in BOUND_NAMES:
+            name = tree.id
+            return _Node("number", lambda ctx: np.full(len(ctx.df), float(ctx.names[name])), set())
+
+        if isinstance(tree, ast.Name):
+            column = tree.id
+            return _Node("number", lambda ctx: ctx.number(column), {column})
+
+        if isinstance(tree, ast.Constant) and isinstance(tree.value, (int, float)) and not isinstance(tree.value, bool):
+            value = float(tree.value)
+            return _Node("number", lambda ctx: np.full(len(ctx.df), value), set())
+
+        if isinstance(tree, ast.Call) and isinstance(tree.func, ast.Name) and tree.func.id in self.FUNCTIONS:
+            kind, function = self.FUNCTIONS[tree.func.id]
+            args = []
+            for arg in tree.args:
+                if isinstance(arg, ast.Name):
+                    args.append(arg.id)
+                elif isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                    args.append(arg.value)
+                else:
+                    raise ValueError(f"{self.id}: {tree.func.id}() takes column names and string literals")
+            columns = {arg.id for arg in tree.args if isinstance(arg, ast.Name)}
+            return _Node(kind, lambda ctx: function(ctx, *args), columns)
+
+        if isinstance(tree, ast.BinOp) and type(tree.op) in _ARITHMETIC:
+            left, right = self._number(tree.left), self._number(tree.right)
+            op = _ARITHMETIC[type(tree.op)]
+
+            def arithmetic(ctx):
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    result = op(left.evaluate(ctx), right.evaluate(ctx))
+                return np.where(np.isfinite(result), result, np.nan)
+            return _Node("number", arithmetic, left.columns | right.columns)
+
+        if isinstance(tree, ast.UnaryOp) and isinstance(tree.op, ast.USub):
+            operand = self._number(tree.operand)
+            return _Node("number", lambda ctx: -operand.evaluate(ctx), operand.columns)
+
+        if isinstance(tree, ast.UnaryOp) and isinstance(tree.op, ast.Not):
+            operand = self._bool(tree.operand)
+
+            def negate(ctx):
+                value, known = operand.evaluate(ctx)
+                return ~value, known
+            return _Node("bool", negate, operand.columns)
+
+        if isinstance(tree, ast.Compare) and all(type(op) in _COMPARE for op in tree.ops):
+            # Chained comparisons (tam >= sam >= som) are the conjunction of each link
+            operands = [self._number(operand) for operand in [tree.left] + tree.comparators]
+            ops = [_COMPARE[type(op)] for op in tree.ops]
+
+            def compare(ctx):
+                values = [operand.evaluate(ctx) for operand in operands]
+                result = np.ones(len(ctx.df), dtype=bool)
+                known = np.ones(len(ctx.df), dtype=bool)
+                for op, left, right in zip(ops, values, values[1:]):
+                    with np.errstate(invalid="ignore"):
+                        result &= op(left, right)
+                    known &= ~np.isnan(left) & ~np.isnan(right)
+                return result, known
+            return _Node("bool", compare, set().union(*(operand.columns for operand in operands)))
+
+        if isinstance(tree, ast.BoolOp):
+            operands = [self._bool(operand) for operand in tree.values]
+            is_and = isinstance(tree.op, ast.And)
+
+            def combine(ctx):
+                value, known = operands[0].evaluate(ctx)
+                for operand in operands[1:]:
+                    other, other_known = operand.evaluate(ctx)
+                    if is_and:
+                        # Known when both are known, or either is known false
+                        known = (known & other_known) | (known & ~value) | (other_known & ~other)
+                        value = value & other
+                    else:
+                        # Known when both are known, or either is known true
+                        known = (known & other_known) | (known & value) | (other_known & other)
+                        value = value | other
+                return value, known
+            return _Node("bool", combine, set().union(*(operand.columns for operand in operands)))
+
+        raise ValueError(f"{self.id}: unsupported expression '{ast.unparse(tree)}'")
+
+    def _number(self, tree) -> _Node:
+        node = self._compile(tree)
+        if node.kind != "number":
+            raise ValueError(f"{self.id}: '{ast.unparse(tree)}' is a condition, expected a number")
+        return node
+
+    def _bool(self, tree) -> _Node:
+        node = self._compile(tree)
+        if node.kind != "bool":
+            raise ValueError(f"{self.id}: '{ast.unparse(tree)}' is a number, expected a condition")
+        return node
+
+    def evaluate(self, ctx: ColumnContext) -> Dict:
+        """Boolean masks of applicable rows and violating rows"""
+        if self._when is None:
+            applicable = np.ones(len(ctx.df), dtype=bool)
+        else:
+            value, known = self._when.evaluate(ctx)
+            applicable = value & known
+        value, known = self._require.evaluate(ctx)
+        return {"applicable": applicable, "violated": applicable & known & ~value}
+
+
+class ConstraintEngine:
+    """Evaluates a set of cross-field constraints over a frame"""
+
+    def __init__(self, constraints: List, currency_rates: Dict = None, today: date = None):
+        self.currency_rates = currency_rates
+        self.today = today  # date that binds current_year; None means the day of each evaluation
+        self.constraints = [c if isinstance(c, Constraint) else Constraint.from_dict(c) for c in constraints]
+        ids = [c.id for c in self.constraints]
+        duplicates = sorted({i for i in ids if ids.count(i) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate constraint ids: {duplicates}")
+
+    @classmethod
+    def from_rules(cls, path: str = CONSTRAINTS_PATH, today: date = None) -> "ConstraintEngine":
+        with open(path) as f:
+            rules = json.load(f)
+        return cls(rules["constraints"], currency_rates=rules.get("currency_rates"), today=today)
+
+    def bound_names(self) -> Dict:
+        """Values of BOUND_NAMES for an evaluation"""
+        return {"current_year": (self.today or date.today()).year}
+
+    def evaluate(self, df: pd.DataFrame, max_rows: int = None, feature_store: NumericFeatureStore = None) -> Dict:
+        """Evaluate every constraint over every row.
+
+        Returns a row x constraint violation matrix and, per constraint, the number
+        of applicable rows, the violation count and the violating row labels (the
+        first max_rows when given). Constraints naming columns absent from df are skipped.
+        A NumericFeatureStore of df, when given, supplies already-parsed numbers.
+        """
+        ctx = ColumnContext(df, self.currency_rates, feature_store, names=self.bound_names())
+        matrix = {}
+        results = {}
+        skipped = {}
+        for constraint in self.constraints:
+            missing = sorted(constraint.columns - set(df.columns))
+            if missing:
+                skipped[constraint.id] = missing
+                continue
+            masks = constraint.evaluate(ctx)
+            matrix[constraint.id] = masks["violated"]
+            rows = df.index[masks["violated"]]
+            results[constraint.id] = {
+                "description": constraint.description,
+                "severity": constraint.severity,
+                "applicable": int(masks["applicable"].sum()),
+                "violations": int(masks["violated"].sum()),
+                "rows": rows[:max_rows].tolist() if max_rows is not None else rows.tolist(),
+            }
+        violations = pd.DataFrame(matrix, index=df.index)
+        return {
+            "constraints": results,
+            "violations": violations,
+            "violating_rows": int(violations.any(axis=1).sum()) if len(violations.columns) else 0,
+            "skipped": skipped,
+        }
@@ -0,0 +1,156 @@
+"""
+Contact field format validation
+Checks the website, social, video, email and phone columns of the master with
+precompiled patterns applied column-wise (str.extract / str.fullmatch over the
+column's distinct values), returning one violation code per cell. URL hosts are extracted
+in the same pass and checked against each column's expected hosts through a
+per-host memo, so a million LinkedIn URLs cost one suffix check per distinct host.
+"""
+
+import re
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from validators.null_tokens import NULL_TOKENS
+
+# Violation codes, in the order they are checked (first failure wins)
+CODES = (
+    "OK", "NULL", "INVALID_URL", "WRONG_HOST", "MISSING_PROFILE_PATH", "MISSING_SCHEME",
+    "INVALID_HANDLE", "INVALID_EMAIL", "INVALID_PHONE", "PHONE_LENGTH",
+)
+
+CONTACT_FIELDS = {
+    "website_url": {"kind": "url"},
+    "linkedin_url": {"kind": "url", "hosts": ("linkedin.com",),
+                     "profile_path": r"/(?:company|school|showcase|in)/[^/?#\s]+/?"},
+    "twitter_handle": {"kind": "handle", "hosts": ("twitter.com", "x.com"), "profile_path": r"/@?\w{1,15}/?"},
+    "facebook_url": {"kind": "url", "hosts": ("facebook.com", "fb.com"), "profile_path": r"/[^?#\s]+"},
+    "instagram_url": {"kind": "url", "hosts": ("instagram.com",), "profile_path": r"/[\w.]+/?"},
+    "marketing_video_url": {"kind": "url", "hosts": ("youtube.com", "youtu.be", "vimeo.com")},
+    "primary_contact_email": {"kind": "email"},
+    "primary_phone_number": {"kind": "phone"},
+}
+
+URL_PATTERN = re.compile(
+    r"^(?P<scheme>https?://)?"
+    r"(?P<host>(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63})"
+    r"(?::\d{1,5})?"
+    r"(?P<path>[/?#]\S*)?$",
+    re.IGNORECASE,
+)
+HANDLE_PATTERN = re.compile(r"@?\w{1,15}", re.ASCII)
+EMAIL_PATTERN = re.compile(
+    r"[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+@(?:[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?\.)+[A-Za-z]{2,63}"
+)
+PHONE_PATTERN = re.compile(r"\+?[0-9()\s./-]+(?:\s*(?:x|ext\.?)\s*\d{1,6})?", re.IGNORECASE)
+
+# E.164 allows at most 15 digits; shorter than 7 is not a dialable number
+PHONE_DIGITS = (7, 15)
+
+
+class HostMemo:
+    """Memoized "is this host one of the expected domains (or a subdomain)" check"""
+
+    def __init__(self):
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def matches(self, host: str, expected: tuple) -> bool:
+        key = (host, expected)
+        if key in self._cache:
+            self.hits += 1
+            return self._cache[key]
+        self.misses += 1
+        host = host.lower().rstrip(".")
+        result = any(host == domain or host.endswith("." + domain) for domain in expected)
+        self._cache[key] = result
+        return result
+
+    def matches_column(self, hosts: pd.Series, expected: tuple) -> np.ndarray:
+        """matches() per cell, evaluated once per distinct host; missing hosts are False"""
+        codes, uniques = pd.factorize(hosts, use_na_sentinel=True)
+        per_host = np.array([self.matches(host, expected) for host in uniques] + [False], dtype=bool)
+        return per_host[codes]
+
+
+class ContactFieldValidator:
+    """Column-wise format checks for contact fields (see CONTACT_FIELDS)"""
+
+    def __init__(self, fields: Dict = None, host_memo: HostMemo = None):
+        self.fields = CONTACT_FIELDS if fields is None else fields
+        self.host_memo = host_memo or HostMemo()
+        self._profile_patterns = {
+            column: re.compile(spec["profile_path"]) for column, spec in self.fields.items() if "profile_path" in spec
+        }
+
+    def _null_mask(self, values: pd.Series) -> pd.Series:
+        return values.isna() | values.str.lower().isin(NULL_TOKENS)
+
+    def _url_codes(self, values: pd.Series, column: str, spec: Dict) -> list:
+        """(condition, code) pairs for URL cells, in precedence order"""
+        parts = values.str.extract(URL_PATTERN)
+        parsed = parts["host"].notna()
+        checks = [(~parsed, "INVALID_URL")]
+        if spec.get("hosts"):
+            host_ok = self.host_memo.matches_column(parts["host"].where(parsed), tuple(spec["hosts"]))
+            checks.append((~host_ok, "WRONG_HOST"))
+        if column in self._profile_patterns:
+            path = parts["path"].fillna("")
+            checks.append((~path.str.fullmatch(self._profile_patterns[column].pattern).astype(bool),
+                           "MISSING_PROFILE_PATH"))
+        checks.append((parts["scheme"].isna(), "MISSING_SCHEME"))
+        return checks
+
+    def validate_column(self, values: pd.Series, column: str) -> pd.Series:
+        """Violation code per cell (categorical over CODES); each distinct value is checked once"""
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        unique_codes = self._codes(pd.Series(uniques, dtype=object), column)
+        # Slot -1 (missing cells) is NULL
+        category = np.append(pd.Categorical(unique_codes, categories=CODES).codes, CODES.index("NULL"))
+        return pd.Series(pd.Categorical.from_codes(category[codes], categories=CODES), index=values.index, name=column)
+
+    def _codes(self, values: pd.Series, column: str) -> np.ndarray:
+        spec = self.fields[column]
+        kind = spec["kind"]
+        text = values.astype("string").str.strip()
+        null = self._null_mask(text).fillna(True).to_numpy(dtype=bool)
+        text = text.fillna("")
+
+        checks = [(null, "NULL")]
+        if kind == "url":
+            checks += self._url_codes(text, column, spec)
+        elif kind == "handle":
+            # A bare "@handle", or a profile URL on one of the expected hosts
+            is_handle = ~text.str.contains(r"[/.]", regex=True)
+            handle_ok = text.str.fullmatch(HANDLE_PATTERN.pattern).astype(bool)
+            checks.append((is_handle & ~handle_ok, "INVALID_HANDLE"))
+            checks += [(~is_handle & condition, code) for condition, code in self._url_codes(text, column, spec)]
+        elif kind == "email":
+            checks.append((~text.str.fullmatch(EMAIL_PATTERN.pattern).astype(bool), "INVALID_EMAIL"))
+        elif kind == "phone":
+            digits = text.str.count(r"\d")
+            checks.append((~text.str.fullmatch(PHONE_PATTERN.pattern).astype(bool), "INVALID_PHONE"))
+            checks.append(((digits < PHONE_DIGITS[0]) | (digits > PHONE_DIGITS[1]), "PHONE_LENGTH"))
+        else:
+            raise ValueError(f"Unknown contact field kind '{kind}' for {column}")
+
+        conditions = [np.asarray(condition, dtype=bool) for condition, _ in checks]
+        return np.select(conditions, [code for _, code in checks], default="OK")
+
+    def validate(self, df: pd.DataFrame) -> Dict:
+        """Codes for every configured column present in df, with per-column violation counts"""
+        columns = [column for column in self.fields if column in df.columns]
+        codes = pd.DataFrame({column: self.validate_column(df[column], column) for column in columns}, index=df.index)
+        violations = {}
+        for column in columns:
+            counts = codes[column].value_counts()
+            violations[column] = {code: int(n) for code, n in counts.items() if n and code not in ("OK", "NULL")}
+        return {
+            "codes": codes,
+            "violations": violations,
+            "invalid_rows": int((~codes.isin(["OK", "NULL"])).any(axis=1).sum()),
+            "missing_columns": [column for column in self.fields if column not in df.columns],
+        }
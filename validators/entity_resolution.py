@@ -0,0 +1,234 @@
+"""
+Company-name entity resolution for TC-13.4-01 (no name leakage)
+Names are normalized (case, accents, punctuation, parentheticals, legal
+suffixes such as Inc/Ltd/Pvt, also dotted or spaced like S.p.A.) and
+deduplicated, then each distinct name gets blocking keys: sorted tokens, a
+phonetic code of the leading tokens and a prefix. Candidates are only compared within a block, using a sorted-neighbourhood
+window so oversized blocks stay linear; matching pairs are merged into duplicate
+clusters with union-find. Work is O(distinct names x window x key types).
+"""
+
+import re
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from validators.gazetteer import strip_accents
+
+# Legal-form tokens removed from the end of a name (after punctuation is dropped)
+LEGAL_SUFFIXES = frozenset({
+    "inc", "incorporated", "corp", "corporation", "co", "company", "llc", "llp", "lp",
+    "ltd", "limited", "plc", "pvt", "private", "pte", "pty", "gmbh", "ag", "sa", "se",
+    "nv", "bv", "ab", "as", "oy", "spa", "srl", "kk", "kg",
+})
+LEADING_ARTICLES = frozenset({"the"})
+
+_PARENTHETICAL = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_APOSTROPHE = re.compile(r"['’`]")
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+
+_SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"), **dict.fromkeys("cgjkqsxz", "2"), **dict.fromkeys("dt", "3"),
+    "l": "4", **dict.fromkeys("mn", "5"), "r": "6",
+}
+
+
+def normalize_name(name) -> str:
+    """Comparable form of a company name: "Groww Invest Tech Pvt. Ltd." -> "groww invest tech" """
+    if name is None or (isinstance(name, float) and pd.isna(name)):
+        return ""
+    text = _PARENTHETICAL.sub(" ", strip_accents(str(name)).casefold())
+    text = _APOSTROPHE.sub("", text.replace("&", " and "))
+    tokens = _NON_WORD.sub(" ", text).split()
+    while tokens and tokens[0] in LEADING_ARTICLES:
+        tokens.pop(0)
+    # Keep at least one token: "Company" or "Limited" alone is still a name
+    while len(tokens) > 1:
+        size = _legal_suffix_size(tokens)
+        if not size:
+            break
+        del tokens[-size:]
+        # "Smith & Co." leaves a dangling conjunction once the legal form is gone
+        while len(tokens) > 1 and tokens[-1] == "and":
+            tokens.pop()
+    return " ".join(tokens)
+
+
+def _legal_suffix_size(tokens: List) -> int:
+    """Number of trailing tokens forming a legal form: "ltd", or dotted/spaced letters such as "s p a" (S.p.A.)"""
+    if tokens[-1] in LEGAL_SUFFIXES:
+        return 1
+    letters = 0
+    while letters < len(tokens) - 1 and len(tokens[-1 - letters]) == 1 and tokens[-1 - letters].isalpha():
+        letters += 1
+    for size in range(letters, 1, -1):
+        if "".join(tokens[-size:]) in LEGAL_SUFFIXES:
+            return size
+    return 0
+
+
+def soundex(token: str) -> str:
+    """American Soundex of an ASCII word (digits pass through): "robert" -> "R163" """
+    if not token:
+        return ""
+    if token[0].isdigit():
+        return token[:4]
+    first = token[0].upper()
+    digits = []
+    previous = _SOUNDEX_CODES.get(token[0], "")
+    for ch in token[1:]:
+        code = _SOUNDEX_CODES.get(ch, "")
+        if code and code != previous:
+            digits.append(code)
+        if ch not in "hw":
+            previous = code
+    return (first + "".join(digits) + "000")[:4]
+
+
+def _profile(name: str) -> tuple:
+    """(token set, character bigram set, number tokens) of a normalized name"""
+    tokens = frozenset(name.split())
+    compact = name.replace(" ", "")
+    bigrams = frozenset(compact[i:i + 2] for i in range(len(compact) - 1)) or frozenset([compact])
+    return tokens, bigrams, frozenset(token for token in tokens if token.isdigit())
+
+
+def _similarity(profile_a: tuple, profile_b: tuple) -> float:
+    tokens_a, bigrams_a, numbers_a = profile_a
+    tokens_b, bigrams_b, numbers_b = profile_b
+    if numbers_a != numbers_b:
+        return 0.0  # "Studio 54" and "Studio 55" are different companies
+    overlap = len(tokens_a & tokens_b) / len(tokens_a | tokens_b) if tokens_a and tokens_b else 0.0
+    dice = 2 * len(bigrams_a & bigrams_b) / (len(bigrams_a) + len(bigrams_b))
+    return max(overlap, dice)
+
+
+def name_similarity(a: str, b: str) -> float:
+    """Similarity of two normalized names: the better of token overlap and character-bigram Dice
+    (0 when their number tokens differ)"""
+    if a == b:
+        return 1.0
+    return _similarity(_profile(a), _profile(b))
+
+
+class _UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, i: int) -> int:
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def union(self, i: int, j: int):
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+
+class NameBlockingIndex:
+    """Blocking index over company names that yields duplicate clusters.
+
+    threshold is the name_similarity a candidate pair needs to be merged; window
+    is how many sorted neighbours each name is compared with inside a block (a
+    block of up to window + 1 names is compared exhaustively).
+    """
+
+    KEY_TYPES = ("sorted_tokens", "phonetic", "prefix")
+
+    def __init__(self, threshold: float = 0.9, window: int = 10, prefix_length: int = 6):
+        self.threshold = threshold
+        self.window = window
+        self.prefix_length = prefix_length
+
+    def normalize(self, names: pd.Series) -> pd.Series:
+        """normalize_name per cell, computed once per distinct value"""
+        codes, uniques = pd.factorize(names, use_na_sentinel=True)
+        normalized = np.array([normalize_name(value) for value in uniques] + [""], dtype=object)
+        return pd.Series(normalized[codes], index=names.index, dtype=object)
+
+    def blocking_keys(self, name: str) -> Dict:
+        """Blocking key per key type for one normalized name"""
+        tokens = name.split()
+        return {
+            "sorted_tokens": " ".join(sorted(tokens)),
+            "phonetic": " ".join(soundex(token) for token in tokens[:2]),
+            "prefix": name.replace(" ", "")[:self.prefix_length],
+        }
+
+    def candidate_pairs(self, names: List) -> np.ndarray:
+        """Distinct (i, j) index pairs, i < j, of names sharing a block within the window"""
+        n = len(names)
+        if n < 2:
+            return np.empty((0, 2), dtype=np.int64)
+        keys = [self.blocking_keys(name) for name in names]
+        name_rank, _ = pd.factorize(pd.Series(names, dtype=object), sort=True)
+        batches = []
+        for key_type in self.KEY_TYPES:
+            block, _ = pd.factorize(pd.Series([k[key_type] for k in keys], dtype=object))
+            # Sort by block, then name, so near-identical names are neighbours within a block
+            order = np.lexsort((name_rank, block))
+            sorted_block = block[order]
+            for offset in range(1, min(self.window, n - 1) + 1):
+                same = sorted_block[:-offset] == sorted_block[offset:]
+                first, second = order[:-offset][same], order[offset:][same]
+                # One int64 code per unordered pair, so duplicates across keys collapse in a 1-d unique
+                batches.append(np.minimum(first, second).astype(np.int64) * n + np.maximum(first, second))
+        codes = np.unique(np.concatenate(batches))
+        return np.stack([codes // n, codes % n], axis=1)
+
+    def find_clusters(self, names: pd.Series) -> Dict:
+        """Duplicate clusters of a name column.
+
+        Returns a cluster label per row (smallest row position of its cluster, -1
+        for empty names), the clusters with more than one row (row positions),
+        the matched name pairs and the number of comparisons made.
+        """
+        return self.cluster(self.normalize(names))
+
+    def cluster(self, normalized: pd.Series) -> Dict:
+        """find_clusters over names already normalized, e.g. signatures gathered from several shards"""
+        codes, uniques = pd.factorize(normalized, use_na_sentinel=True)
+        distinct = [str(name) for name in uniques]
+        pairs = self.candidate_pairs(distinct)
+
+        profiles = [_profile(name) for name in distinct]
+        union = _UnionFind(len(distinct))
+        matches = []
+        for i, j in zip(pairs[:, 0].tolist(), pairs[:, 1].tolist()):
+            if not distinct[i] or not distinct[j]:
+                continue
+            score = _similarity(profiles[i], profiles[j])
+            if score >= self.threshold:
+                union.union(i, j)
+                matches.append((distinct[i], distinct[j], round(score, 4)))
+
+        empty = [pos for pos, name in enumerate(distinct) if not name]
+        roots = np.array([union.find(i) for i in range(len(distinct))], dtype=np.int64)
+        row_roots = roots[codes]
+        # Label each cluster by the first row that belongs to it
+        _, first_rows, inverse = np.unique(row_roots, return_index=True, return_inverse=True)
+        labels = first_rows[inverse]
+        if empty:
+            labels[np.isin(codes, empty)] = -1
+
+        in_cluster = (np.bincount(inverse)[inverse] > 1) & (labels >= 0)
+        rows = np.flatnonzero(in_cluster)
+        clusters = pd.Series(rows).groupby(labels[rows]).agg(list).tolist() if len(rows) else []
+        return {
+            "normalized": normalized,
+            "labels": pd.Series(labels, index=normalized.index),
+            "clusters": clusters,
+            "matches": matches,
+            "distinct_names": len(distinct),
+            "comparisons": int(len(pairs)),
+        }
+
+
+def find_duplicate_companies(df: pd.DataFrame, name_column: str = "name", **index_options) -> Dict:
+    """Duplicate clusters of a master by company name (see NameBlockingIndex.find_clusters)"""
+    return NameBlockingIndex(**index_options).find_clusters(df[name_column])
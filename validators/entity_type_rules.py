@@ -0,0 +1,201 @@
+"""
+Entity-type applicability for TC-14.2 (structurally non-applicable fields)
+Each rule in rules/test_tc_14_2.json names an entity type (VC firm,
+bootstrapped startup, remote-first company) and the fields that must be N/A
+for it; rules may also be restricted by company type and stage. The
+ApplicabilityIndex segments every company once (entity types matched on the
+declared type text, company_type, stage) and stores which rules and which
+must-be-N/A fields apply to each row as packed bitmaps. Validators then visit
+only applicable (row, rule) pairs, and the N/A check is a masked comparison per
+field instead of a per-row loop.
+"""
+
+import json
+import re
+from functools import lru_cache
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from validators.field_names import column_for
+from validators.null_tokens import NA_TOKENS
+
+ENTITY_TYPE_RULES_PATH = "rules/test_tc_14_2.json"
+
+# How each rules-file entity type is recognized in a declared type ("category") text
+ENTITY_TYPE_PATTERNS = {
+    "Venture Capital firm": r"\bventure capital\b|\bvc (?:firm|fund)\b",
+    "Bootstrapped startup": r"\bbootstrapped\b|\bself-funded\b",
+    "Remote-first company": r"\bremote[- ]first\b|\bfully remote\b|\bfully distributed\b",
+}
+
+# First matching stage wins, checked against category and company_maturity
+STAGE_PATTERNS = {
+    "Startup": r"\bstart-?up\b|\bearly[- ]stage\b",
+    "Scale-up": r"\bscale-?up\b|\bunicorn\b",
+    "Enterprise": r"\benterprise\b|\bpublic\b|\blarge cap\b|\bmature\b|\blisted\b|\bconglomerate\b",
+}
+
+
+def load_entity_type_rules(path: str = ENTITY_TYPE_RULES_PATH) -> List[Dict]:
+    """Rules file conditions as rule dicts with ids and master column names"""
+    with open(path) as f:
+        spec = json.load(f)
+    na_tokens = NA_TOKENS | {spec.get("na_value", "N/A").strip().lower()}
+    return [
+        {
+            "id": f"{spec['test_id']}-{position:02d}",
+            "entity_type": condition.get("entity_type"),
+            "company_type": condition.get("company_type"),
+            "stage": condition.get("stage"),
+            "must_be_na": [column_for(field) for field in condition.get("must_be_na", [])],
+            "na_tokens": na_tokens,
+        }
+        for position, condition in enumerate(spec["conditions"], start=1)
+    ]
+
+
+def _entity_pattern(entity_type: str) -> str:
+    return ENTITY_TYPE_PATTERNS.get(entity_type, re.escape(entity_type))
+
+
+def _as_set(selector) -> set:
+    return {selector} if isinstance(selector, str) else set(selector)
+
+
+def is_na(values, na_tokens=NA_TOKENS) -> np.ndarray:
+    """True where a value is null or an N/A token (each distinct value is normalized once)"""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    text = pd.Series(uniques, dtype=object).astype(str).str.strip().str.lower()
+    return np.append(text.isin(na_tokens).to_numpy(dtype=bool), True)[codes]
+
+
+def stage_of(*texts) -> str:
+    """Stage from declared type / maturity texts ("" when none matches)"""
+    text = " ".join(str(t) for t in texts if isinstance(t, str)).lower()
+    for stage, pattern in STAGE_PATTERNS.items():
+        if re.search(pattern, text):
+            return stage
+    return ""
+
+
+class ApplicabilityIndex:
+    """Per-company bitmaps of applicable rules and must-be-N/A fields"""
+
+    def __init__(self, df: pd.DataFrame, rules: List[Dict] = None, entity_type_column: str = "category"):
+        self.rules = load_entity_type_rules() if rules is None else rules
+        self.rule_ids = [rule["id"] for rule in self.rules]
+        self.index = df.index
+        self.segments = self._segment(df, entity_type_column)
+        rule_masks = np.column_stack([self._rule_mask(rule) for rule in self.rules]) if self.rules \
+            else np.zeros((len(df), 0), dtype=bool)
+
+        self.fields = list(dict.fromkeys(column for rule in self.rules for column in rule["must_be_na"]))
+        field_masks = np.zeros((len(df), len(self.fields)), dtype=bool)
+        for r, rule in enumerate(self.rules):
+            for column in rule["must_be_na"]:
+                field_masks[:, self.fields.index(column)] |= rule_masks[:, r]
+
+        self.rule_bits = np.packbits(rule_masks, axis=1)
+        self.field_bits = np.packbits(field_masks, axis=1)
+
+    def _segment(self, df: pd.DataFrame, entity_type_column: str) -> pd.DataFrame:
+        """entity types (one bool column each), company_type and stage per row, derived per distinct value"""
+        declared = df[entity_type_column] if entity_type_column in df.columns else pd.Series(None, index=df.index)
+        codes, uniques = pd.factorize(declared.astype(object).where(declared.notna(), ""))
+        text = pd.Series(uniques, dtype=object).astype(str)
+        segments = {}
+        for entity_type in dict.fromkeys(rule["entity_type"] for rule in self.rules if rule.get("entity_type")):
+            found = text.str.contains(_entity_pattern(entity_type), case=False, regex=True).to_numpy(dtype=bool)
+            segments[entity_type] = found[codes]
+
+        maturity = df["company_maturity"] if "company_maturity" in df.columns else pd.Series(None, index=df.index)
+        pairs = pd.DataFrame({"declared": declared.astype(object), "maturity": maturity.astype(object)})
+        pair_codes, pair_uniques = pd.factorize(pd.MultiIndex.from_frame(pairs.fillna("")))
+        stages = np.array([stage_of(a, b) for a, b in pair_uniques], dtype=object)
+        segments["stage"] = stages[pair_codes] if len(stages) else np.array([], dtype=object)
+        segments["company_type"] = (df["company_type"].astype(object).str.strip() if "company_type" in df.columns
+                                    else pd.Series(None, index=df.index, dtype=object)).to_numpy()
+        return pd.DataFrame(segments, index=df.index)
+
+    def _rule_mask(self, rule: Dict) -> np.ndarray:
+        mask = np.ones(len(self.segments), dtype=bool)
+        if rule.get("entity_type"):
+            mask &= self.segments[rule["entity_type"]].to_numpy()
+        for selector in ("company_type", "stage"):
+            if rule.get(selector):
+                mask &= self.segments[selector].isin(_as_set(rule[selector])).to_numpy()
+        return mask
+
+    def _bit(self, bits: np.ndarray, position: int) -> np.ndarray:
+        return ((bits[:, position // 8] >> (7 - position % 8)) & 1).astype(bool)
+
+    def applies(self, rule_id: str) -> np.ndarray:
+        """Rows a rule applies to"""
+        return self._bit(self.rule_bits, self.rule_ids.index(rule_id))
+
+    def must_be_na(self, column: str) -> np.ndarray:
+        """Rows where a column must be N/A under any applicable rule"""
+        return self._bit(self.field_bits, self.fields.index(column))
+
+    def rules_for(self, position: int) -> List[str]:
+        row = np.unpackbits(self.rule_bits[position], count=len(self.rules)).astype(bool)
+        return [rule_id for rule_id, on in zip(self.rule_ids, row) if on]
+
+    def pairs(self) -> tuple:
+        """(row positions, rule positions) of every applicable pair"""
+        matrix = np.unpackbits(self.rule_bits, axis=1, count=len(self.rules)).astype(bool)
+        return np.nonzero(matrix)
+
+    def check(self, df: pd.DataFrame) -> Dict:
+        """Must-be-N/A violations: a row x field matrix and the violating rows per rule.
+
+        Only rows where a field must be N/A are compared, once per field.
+        """
+        violations = pd.DataFrame(False, index=self.index, columns=self.fields)
+        for f, column in enumerate(self.fields):
+            rows = np.flatnonzero(self._bit(self.field_bits, f))
+            if not len(rows) or column not in df.columns:
+                continue  # An absent column holds no generated value
+            tokens = frozenset().union(*(rule.get("na_tokens", NA_TOKENS) for rule in self.rules
+                                         if column in rule["must_be_na"]))
+            violations.iloc[rows, f] = ~is_na(df[column].to_numpy()[rows], tokens)
+
+        by_rule = {}
+        for r, rule in enumerate(self.rules):
+            columns = [column for column in rule["must_be_na"] if column in violations.columns]
+            bad = self._bit(self.rule_bits, r) & violations[columns].to_numpy().any(axis=1) if columns \
+                else np.zeros(len(self.index), dtype=bool)
+            by_rule[rule["id"]] = self.index[bad].tolist()
+        return {
+            "violations": violations,
+            "rows": by_rule,
+            "checked_pairs": int(len(self.pairs()[0])),
+            "violating_rows": int(violations.to_numpy().any(axis=1).sum()) if self.fields else 0,
+        }
+
+
+@lru_cache(maxsize=1)
+def _default_rules() -> List[Dict]:
+    return load_entity_type_rules()
+
+
+def validate_entity_type(entity_type, row, rules: List[Dict] = None) -> bool:
+    """True when every field that must be N/A for the row's entity type (and company type / stage) is N/A"""
+    rules = _default_rules() if rules is None else rules
+    declared = str(entity_type) if isinstance(entity_type, str) else ""
+    stage = stage_of(entity_type, row.get("company_maturity"))
+    company_type = row.get("company_type")
+    company_type = company_type.strip() if isinstance(company_type, str) else company_type
+    for rule in rules:
+        if rule.get("entity_type") and not re.search(_entity_pattern(rule["entity_type"]), declared, re.IGNORECASE):
+            continue
+        if rule.get("company_type") and company_type not in _as_set(rule["company_type"]):
+            continue
+        if rule.get("stage") and stage not in _as_set(rule["stage"]):
+            continue
+        present = [column for column in rule["must_be_na"] if column in row.index]
+        if present and not is_na([row[column] for column in present], rule.get("na_tokens", NA_TOKENS)).all():
+            return False
+    return True
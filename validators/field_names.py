@@ -0,0 +1,40 @@
+"""
+Display field names used by the rules files, mapped to company master columns
+"""
+
+FIELD_COLUMNS = {
+    "Company Name": "name",
+    "Short Name": "short_name",
+    "Category": "category",
+    "Year of Incorporation": "incorporation_year",
+    "Overview of the Company": "overview_text",
+    "Nature of Company": "nature_of_company",
+    "Company Headquarters": "headquarters_address",
+    "Office Locations": "office_locations",
+    "Employee Size": "employee_size",
+    "Focus Sectors / Industries": "focus_sectors",
+    "Services / Offerings / Products": "offerings_description",
+    "Website URL": "website_url",
+    "CEO Name": "ceo_name",
+    "Key Investors / Backers": "key_investors",
+    "Recent Funding Rounds": "recent_funding_rounds",
+    "Total Capital Raised": "total_capital_raised",
+    "Annual Revenues": "annual_revenue",
+    "Profitability Status": "profitability_status",
+    "Market Share (%)": "market_share_percentage",
+    "Total Addressable Market (TAM)": "tam",
+    "Burn Rate": "burn_rate",
+    "Runway": "runway_months",
+    "Glassdoor Rating": "glassdoor_rating",
+    "Brand Sentiment Score": "brand_sentiment_score",
+    "Net Promoter Score (NPS)": "net_promoter_score",
+}
+
+
+def column_for(field: str) -> str:
+    """Master column of a display field name; column names pass through unchanged"""
+    if field in FIELD_COLUMNS:
+        return FIELD_COLUMNS[field]
+    if field in FIELD_COLUMNS.values():
+        return field
+    raise KeyError(f"No master column for field '{field}'")
@@ -0,0 +1,151 @@
+"""
+Dataset fingerprinting
+Vectorized per-cell hashes folded into per-row and per-column Merkle trees, so
+"did anything change?" is a single root comparison and changed cells can be
+localized by descending only the differing branches.
+Hashes are for change detection, not tamper resistance.
+"""
+
+import numpy as np
+import pandas as pd
+
+_MULT_1 = np.uint64(0x9E3779B97F4A7C15)
+_MULT_2 = np.uint64(0xBF58476D1CE4E5B9)
+_MULT_3 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Order-dependent combination of two uint64 hash arrays (splitmix64 finalizer)"""
+    x = (left * _MULT_1) ^ right
+    x = (x ^ (x >> np.uint64(30))) * _MULT_2
+    x = (x ^ (x >> np.uint64(27))) * _MULT_3
+    return x ^ (x >> np.uint64(31))
+
+
+def _merkle_levels(leaves: np.ndarray) -> list:
+    """All tree levels from the leaves up to a single root"""
+    levels = [leaves]
+    current = leaves
+    while len(current) > 1:
+        if len(current) % 2:
+            current = np.append(current, current[-1])
+        current = _mix(current[0::2], current[1::2])
+        levels.append(current)
+    return levels
+
+
+def _fold_blocks(hashes: np.ndarray, block_size: int) -> np.ndarray:
+    """Combine consecutive runs of block_size hashes into one hash per block (pairwise, log2 steps)"""
+    n_blocks = -(-len(hashes) // block_size)
+    blocks = np.zeros((n_blocks, block_size), dtype=np.uint64)
+    blocks.reshape(-1)[:len(hashes)] = hashes
+    while blocks.shape[1] > 1:
+        if blocks.shape[1] % 2:
+            blocks = np.hstack([blocks, blocks[:, -1:]])
+        blocks = _mix(blocks[:, 0::2], blocks[:, 1::2])
+    return blocks[:, 0]
+
+
+def _changed_leaves(levels_a: list, levels_b: list) -> list:
+    """Leaf positions that differ, visiting only differing branches (O(k log n))"""
+    candidates = [0]
+    for level in range(len(levels_a) - 1, -1, -1):
+        a, b = levels_a[level], levels_b[level]
+        candidates = [i for i in candidates if i < len(a) and a[i] != b[i]]
+        if level:
+            candidates = [child for i in candidates for child in (2 * i, 2 * i + 1)]
+    return candidates
+
+
+def _label_hashes(labels: list) -> np.ndarray:
+    return pd.util.hash_pandas_object(pd.Series([str(label) for label in labels], dtype=object), index=False).to_numpy()
+
+
+class DatasetFingerprint:
+    """Merkle fingerprint of a DataFrame's cell values"""
+
+    def __init__(self, columns: list, n_rows: int, block_size: int, row_levels: list, column_levels: list):
+        self.columns = columns
+        self.n_rows = n_rows
+        self.block_size = block_size
+        self.row_levels = row_levels
+        self.column_levels = column_levels
+
+        column_roots = np.array([levels[-1][0] for levels in column_levels], dtype=np.uint64)
+        self.column_hashes = dict(zip(columns, column_roots))
+        schema = np.append(np.array([n_rows], dtype=np.uint64), _label_hashes(columns))
+        schema_root = _merkle_levels(schema)[-1]
+        self.root = int(_mix(row_levels[-1][:1], schema_root)[0])
+
+    @classmethod
+    def of(cls, df: pd.DataFrame, block_size: int = 64) -> "DatasetFingerprint":
+        """Fingerprint a frame; block_size sets the row granularity of the per-column trees"""
+        n_rows = len(df)
+        columns = list(df.columns)
+        row_hashes = np.zeros(n_rows, dtype=np.uint64)
+        column_levels = []
+
+        for pos, column in enumerate(columns):
+            cells = pd.util.hash_pandas_object(df.iloc[:, pos], index=False).to_numpy()
+            row_hashes = _mix(row_hashes, cells)
+            leaves = _fold_blocks(cells, block_size) if n_rows else np.zeros(1, dtype=np.uint64)
+            column_levels.append(_merkle_levels(leaves))
+
+        if not n_rows:
+            row_hashes = np.zeros(1, dtype=np.uint64)
+        return cls(columns, n_rows, block_size, _merkle_levels(row_hashes), column_levels)
+
+    @property
+    def row_hashes(self) -> np.ndarray:
+        return self.row_levels[0]
+
+    def hexdigest(self) -> str:
+        return f"{self.root:016x}"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, DatasetFingerprint) and self.root == other.root
+
+    def __hash__(self) -> int:
+        return self.root
+
+    def _check_comparable(self, other: "DatasetFingerprint"):
+        if (self.columns != other.columns or self.n_rows != other.n_rows
+                or self.block_size != other.block_size):
+            raise ValueError(
+                f"Fingerprints cover different shapes: {self.n_rows}x{len(self.columns)} "
+                f"(block {self.block_size}) vs {other.n_rows}x{len(other.columns)} (block {other.block_size})"
+            )
+
+    def changed_rows(self, other: "DatasetFingerprint") -> list:
+        """Row positions whose values differ"""
+        self._check_comparable(other)
+        if self.root == other.root:
+            return []
+        return [r for r in _changed_leaves(self.row_levels, other.row_levels) if r < self.n_rows]
+
+    def changed_columns(self, other: "DatasetFingerprint") -> list:
+        """Column labels whose values differ"""
+        self._check_comparable(other)
+        if self.root == other.root:
+            return []
+        return [c for c in self.columns if self.column_hashes[c] != other.column_hashes[c]]
+
+    def diff(self, other: "DatasetFingerprint") -> list:
+        """Changed (row, column) cells.
+
+        Exact when at most one row per block changed in a column; otherwise the
+        result may include neighbouring changed rows of that block (block_size=1
+        is always exact).
+        """
+        rows = self.changed_rows(other)
+        if not rows:
+            return []
+
+        cells = []
+        for pos, column in enumerate(self.columns):
+            if self.column_hashes[column] == other.column_hashes[column]:
+                continue
+            blocks = set(_changed_leaves(self.column_levels[pos], other.column_levels[pos]))
+            cells.extend((row, column) for row in rows if row // self.block_size in blocks)
+        order = {column: pos for pos, column in enumerate(self.columns)}
+        return sorted(cells, key=lambda cell: (cell[0], order[cell[1]]))
@@ -0,0 +1,193 @@
+"""
+Offline gazetteer for location fields
+Resolves free-text places (office_locations, headquarters_address,
+operating_countries) to canonical ids from the bundled data/gazetteer.json:
+macro regions (X-EUROPE), countries (IN), first-level regions (IN-KA) and major
+cities (IN:bangalore). Names and aliases are compiled into token tries, so each
+string is resolved in one left-to-right longest-match pass; all-capital aliases
+(US, UK, CA, NSW) only match in capitals. Columns are resolved once per distinct value.
+"""
+
+import json
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, Tuple
+
+import pandas as pd
+
+GAZETTEER_PATH = "data/gazetteer.json"
+
+_TOKEN = re.compile(r"[^\W_]+")
+_END = ""  # trie key holding the ids of a complete name (never a token)
+
+
+def strip_accents(text: str) -> str:
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> list:
+    """Accent-free word tokens, case preserved"""
+    return _TOKEN.findall(strip_accents(text))
+
+
+def normalize_text(text: str) -> str:
+    """Case- and accent-folded text with punctuation collapsed to single spaces"""
+    return " ".join(token.casefold() for token in tokenize(text))
+
+
+def _is_code(alias: str) -> bool:
+    letters = [ch for ch in alias if ch.isalpha()]
+    return bool(letters) and all(ch.isupper() for ch in letters) and len(letters) <= 5
+
+
+class Gazetteer:
+    """Token-trie index from place names and aliases to canonical ids"""
+
+    def __init__(self, data: Dict):
+        self.entries = {}
+        self._folded = {}
+        self._exact = {}
+
+        continents = {}
+        for macro in data.get("macro_regions", []):
+            self._add(macro, "macro_region", parent=None)
+            for continent in macro.get("continents", []):
+                continents.setdefault(continent, macro["id"])
+        for country in data.get("countries", []):
+            self._add(country, "country", parent=continents.get(country.get("continent")))
+        for region in data.get("regions", []):
+            self._add(region, "region", parent=region.get("country"))
+        for city in data.get("cities", []):
+            self._add(city, "city", parent=city.get("region") or city.get("country"))
+
+    @classmethod
+    def load(cls, path: str = GAZETTEER_PATH) -> "Gazetteer":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _add(self, record: Dict, kind: str, parent: str):
+        place_id = record["id"]
+        self.entries[place_id] = {"kind": kind, "name": record["name"], "parent": parent}
+        for name in [record["name"]] + record.get("aliases", []):
+            exact = _is_code(name)
+            trie = self._exact if exact else self._folded
+            node = trie
+            for token in tokenize(name):
+                node = node.setdefault(token if exact else token.casefold(), {})
+            ids = node.setdefault(_END, [])
+            if place_id not in ids:
+                ids.append(place_id)
+
+    def ancestors(self, place_id: str) -> Tuple:
+        """Parent chain of an id, nearest first (city -> region -> country -> macro region)"""
+        chain = []
+        parent = self.entries[place_id]["parent"]
+        while parent is not None and parent in self.entries:
+            chain.append(parent)
+            parent = self.entries[parent]["parent"]
+        return tuple(chain)
+
+    def kind(self, place_id: str) -> str:
+        return self.entries[place_id]["kind"]
+
+    def name(self, place_id: str) -> str:
+        return self.entries[place_id]["name"]
+
+    @staticmethod
+    def _longest(trie: Dict, tokens: list, start: int) -> tuple:
+        node = trie
+        best_end, best_ids = start, None
+        for pos in range(start, len(tokens)):
+            node = node.get(tokens[pos])
+            if node is None:
+                break
+            if _END in node:
+                best_end, best_ids = pos + 1, node[_END]
+        return best_end, best_ids
+
+    def _matches(self, text: str) -> list:
+        """Candidate id lists for each longest match, left to right"""
+        exact_tokens = tokenize(text)
+        folded_tokens = [token.casefold() for token in exact_tokens]
+        matches = []
+        pos = 0
+        while pos < len(exact_tokens):
+            folded_end, folded_ids = self._longest(self._folded, folded_tokens, pos)
+            exact_end, exact_ids = self._longest(self._exact, exact_tokens, pos)
+            if folded_ids is None and exact_ids is None:
+                pos += 1
+                continue
+            if exact_end > folded_end or folded_ids is None:
+                end, ids = exact_end, exact_ids
+            elif folded_end > exact_end or exact_ids is None:
+                end, ids = folded_end, folded_ids
+            else:
+                end, ids = folded_end, folded_ids + [i for i in exact_ids if i not in folded_ids]
+            matches.append(ids)
+            pos = end
+        return matches
+
+    def resolve(self, text) -> Tuple:
+        """Canonical ids of every place named in a string, in order of appearance.
+
+        Ambiguous names (Cambridge, Georgia, WA) are resolved towards the
+        countries and regions named elsewhere in the same string.
+        """
+        if text is None or (isinstance(text, float) and pd.isna(text)):
+            return ()
+        matches = self._matches(str(text))
+        context = set()
+        for ids in matches:
+            if len(ids) == 1:
+                context.add(ids[0])
+                context.update(self.ancestors(ids[0]))
+
+        resolved = []
+        for ids in matches:
+            choice = ids[0]
+            if len(ids) > 1:
+                choice = next((i for i in ids if context.intersection((i,) + self.ancestors(i))), ids[0])
+            if choice not in resolved:
+                resolved.append(choice)
+        return tuple(resolved)
+
+    def resolve_column(self, values: pd.Series) -> pd.Series:
+        """Ids per cell, resolving each distinct value once"""
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        resolved = [self.resolve(value) for value in uniques]
+        return pd.Series([resolved[code] if code >= 0 else () for code in codes], index=values.index, dtype=object)
+
+    def most_specific(self, ids: Iterable) -> Tuple:
+        """Drop ids implied by a more specific id in the same set (India next to Bangalore)"""
+        ids = tuple(ids)
+        implied = {ancestor for place_id in ids for ancestor in self.ancestors(place_id)}
+        return tuple(place_id for place_id in ids if place_id not in implied)
+
+    def canonical_key(self, text) -> str:
+        """Comparison key: most specific place ids, or the normalized text when no place is named"""
+        ids = self.most_specific(self.resolve(text))
+        if ids:
+            return "|".join(sorted(ids))
+        return normalize_text(str(text)) if text is not None else ""
+
+    def id_frequency(self, frame: pd.DataFrame, columns: list = None) -> Counter:
+        """Number of rows naming each id (directly or through a more specific place) in the given columns"""
+        columns = list(frame.columns) if columns is None else columns
+        per_row = [set() for _ in range(len(frame))]
+        for column in columns:
+            for row_ids, ids in zip(per_row, self.resolve_column(frame[column])):
+                for place_id in ids:
+                    row_ids.add(place_id)
+                    row_ids.update(self.ancestors(place_id))
+        return Counter(place_id for row_ids in per_row for place_id in row_ids)
+
+
+@lru_cache(maxsize=4)
+def load_gazetteer(path: str = GAZETTEER_PATH) -> Gazetteer:
+    """Shared gazetteer instance (the index is read-only once built)"""
+    return Gazetteer.load(path)
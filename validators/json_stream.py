@@ -0,0 +1,356 @@
+"""
+Streaming JSON integrity checks for TC-13.3-03
+A pushdown validator that consumes output in chunks as it is generated and
+checks the full JSON grammar in a single pass. Memory is O(nesting depth): only
+the open-container stack (with the current key or index per level) is kept, never
+the decoded document. A truncated document reports the byte offset where it ended
+and the containers still open; a syntax error aborts validation at the offending byte.
+"""
+
+import json
+import re
+from typing import Dict, Iterable
+
+# Parser states
+_VALUE = 0            # a value is required (root, after ':' or after ',' in an array)
+_VALUE_OR_CLOSE = 1   # just after '['
+_KEY_OR_CLOSE = 2     # just after '{'
+_KEY = 3              # after ',' in an object
+_COLON = 4            # after an object key
+_COMMA_OR_CLOSE = 5   # after a value inside a container
+_END = 6              # root value complete; only whitespace may follow
+_STRING = 7
+_ESCAPE = 8
+_UNICODE = 9
+_LITERAL = 10         # number or true/false/null
+
+_WHITESPACE_RUN = re.compile(rb"[ \t\r\n]+")
+_STRING_RUN = re.compile(rb'[^"\\\x00-\x1f]+')
+_COMPLETE_STRING = re.compile(rb'"[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*"')
+_LITERAL_RUN = re.compile(rb"[-+.0-9eEtruefalsn]+")
+_WHITESPACE = frozenset(b" \t\r\n")
+_NUMBER = re.compile(rb"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_KEYWORDS = (b"true", b"false", b"null")
+_LITERAL_BYTES = frozenset(b"0123456789+-.eEtruefalsn")
+_LITERAL_START = frozenset(b"-0123456789tfn")
+_HEX_BYTES = frozenset(b"0123456789abcdefABCDEF")
+_SIMPLE_ESCAPES = frozenset(b'"\\/bfnrt')
+
+# Longest literal accepted before giving up on it, and key bytes kept for error paths
+MAX_LITERAL_BYTES = 64
+MAX_KEY_BYTES = 64
+
+_EXPECTED = {
+    _VALUE: "a value",
+    _VALUE_OR_CLOSE: "a value or ']'",
+    _KEY_OR_CLOSE: "an object key or '}'",
+    _KEY: "an object key",
+    _COLON: "':'",
+    _COMMA_OR_CLOSE: "',' or a closing bracket",
+}
+
+
+def _is_literal_prefix(literal: bytes) -> bool:
+    """True for an unfinished literal that more input could still complete ("tru", "1.", "-")"""
+    if literal[:1] in (b"t", b"f", b"n"):
+        return any(keyword != literal and keyword.startswith(literal) for keyword in _KEYWORDS)
+    # Numbers: a trailing sign, dot or exponent marker still needs digits
+    return literal[-1:] in (b"-", b"+", b".", b"e", b"E")
+
+
+def _decode_key(raw: bytes) -> str:
+    """Decoded text of the first MAX_KEY_BYTES raw bytes of a key (escapes included)"""
+    text = raw.decode("utf-8", "replace")
+    try:
+        return json.loads(f'"{text}"')
+    except ValueError:
+        # Cut inside an escape sequence: decode what precedes it
+        cut = raw.rfind(b"\\")
+        return _decode_key(raw[:cut]) if cut >= 0 else text
+
+
+class StreamingJSONValidator:
+    """Incremental JSON structural validator.
+
+    Call feed() with str or bytes chunks as they arrive, then close() for the report.
+    feed() returns False as soon as the document is known to be invalid (or exceeds
+    max_bytes / max_depth), so producers can abort generation early.
+    """
+
+    def __init__(self, max_depth: int = None, max_bytes: int = None):
+        self.max_depth = max_depth
+        self.max_bytes = max_bytes
+        self._stack = []
+        self._state = _VALUE
+        self._consumed = 0
+        self._error = None
+        self._error_offset = None
+        self._is_key = False
+        self._key = bytearray()
+        self._literal = bytearray()
+        self._hex_left = 0
+        self._deepest = 0
+        self._root_type = None
+        self._root_members = 0
+        self._closed = False
+
+    @property
+    def ok(self) -> bool:
+        """No error found so far"""
+        return self._error is None
+
+    def _fail(self, message: str, offset: int) -> bool:
+        self._error = message
+        self._error_offset = offset
+        # Nothing from the error offset on counts as consumed, whatever the chunking
+        self._consumed = offset
+        return False
+
+    def _start_value(self, kind: str):
+        if not self._stack:
+            self._root_type = kind
+        elif self._stack[-1][0] == "[":
+            self._stack[-1][1] += 1
+
+    def _end_value(self):
+        if not self._stack:
+            self._state = _END
+            return
+        if len(self._stack) == 1:
+            self._root_members += 1
+        self._state = _COMMA_OR_CLOSE
+
+    def _keep_key(self, data: bytes):
+        """Append raw key bytes, up to MAX_KEY_BYTES; decoded when the key closes"""
+        if len(self._key) < MAX_KEY_BYTES:
+            self._key += data[:MAX_KEY_BYTES - len(self._key)]
+
+    def _end_literal(self, offset: int) -> bool:
+        literal = bytes(self._literal)
+        if literal not in _KEYWORDS and not _NUMBER.fullmatch(literal):
+            return self._fail(f"Invalid literal {literal.decode('ascii', 'replace')!r}", offset - len(literal))
+        self._end_value()
+        return True
+
+    def feed(self, chunk) -> bool:
+        """Consume the next chunk; returns False once the document is invalid"""
+        if self._error is not None:
+            return False
+        if self._closed:
+            raise ValueError("feed() called after close()")
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+
+        base = self._consumed
+        if self.max_bytes is not None and base + len(chunk) > self.max_bytes:
+            return self._fail(f"Output exceeds {self.max_bytes} bytes", self.max_bytes)
+
+        n = len(chunk)
+        i = 0
+        stack = self._stack
+        while i < n:
+            state = self._state
+
+            if state == _STRING:
+                run = _STRING_RUN.match(chunk, i)
+                if run:
+                    if self._is_key:
+                        self._keep_key(chunk[i:run.end()])
+                    i = run.end()
+                    continue
+                byte = chunk[i]
+                if byte == 0x22:  # closing quote
+                    if self._is_key:
+                        stack[-1][1] = _decode_key(bytes(self._key))
+                        self._state = _COLON
+                    else:
+                        self._end_value()
+                elif byte == 0x5C:  # backslash
+                    if self._is_key:
+                        self._keep_key(chunk[i:i + 1])
+                    self._state = _ESCAPE
+                else:
+                    return self._fail("Unescaped control character in string", base + i)
+                i += 1
+                continue
+
+            if state == _ESCAPE:
+                byte = chunk[i]
+                if self._is_key:
+                    self._keep_key(chunk[i:i + 1])
+                if byte in _SIMPLE_ESCAPES:
+                    self._state = _STRING
+                elif byte == 0x75:  # \u
+                    self._state = _UNICODE
+                    self._hex_left = 4
+                else:
+                    return self._fail("Invalid escape sequence", base + i - 1)
+                i += 1
+                continue
+
+            if state == _UNICODE:
+                if chunk[i] not in _HEX_BYTES:
+                    return self._fail("Invalid \\u escape", base + i)
+                if self._is_key:
+                    self._keep_key(chunk[i:i + 1])
+                self._hex_left -= 1
+                if not self._hex_left:
+                    self._state = _STRING
+                i += 1
+                continue
+
+            if state == _LITERAL:
+                byte = chunk[i]
+                if byte in _LITERAL_BYTES:
+                    if len(self._literal) >= MAX_LITERAL_BYTES:
+                        return self._fail("Literal too long", base + i)
+                    self._literal.append(byte)
+                    i += 1
+                    continue
+                # Delimiter: the literal ended just before this byte, which is then re-read
+                if not self._end_literal(base + i):
+                    return False
+                continue
+
+            byte = chunk[i]
+            if byte in _WHITESPACE:
+                i = _WHITESPACE_RUN.match(chunk, i).end()
+                continue
+
+            if state == _END:
+                return self._fail("Unexpected data after the root value", base + i)
+
+            if state == _COLON:
+                if byte != 0x3A:
+                    return self._fail("Expected ':'", base + i)
+                self._state = _VALUE
+
+            elif state == _COMMA_OR_CLOSE:
+                top = stack[-1]
+                if byte == 0x2C:  # ','
+                    self._state = _KEY if top[0] == "{" else _VALUE
+                elif (byte == 0x7D and top[0] == "{") or (byte == 0x5D and top[0] == "["):
+                    stack.pop()
+                    self._end_value()
+                else:
+                    closer = "}" if top[0] == "{" else "]"
+                    return self._fail(f"Expected ',' or '{closer}'", base + i)
+
+            elif state in (_KEY_OR_CLOSE, _KEY):
+                if byte == 0x22:
+                    whole = _COMPLETE_STRING.match(chunk, i)
+                    if whole:
+                        # Fast path: the whole key is inside this chunk
+                        stack[-1][1] = _decode_key(chunk[i + 1:min(whole.end() - 1, i + 1 + MAX_KEY_BYTES)])
+                        self._state = _COLON
+                        i = whole.end()
+                        continue
+                    self._state = _STRING
+                    self._is_key = True
+                    self._key.clear()
+                elif byte == 0x7D and state == _KEY_OR_CLOSE:
+                    stack.pop()
+                    self._end_value()
+                else:
+                    return self._fail(f"Expected {_EXPECTED[state]}", base + i)
+
+            else:  # _VALUE or _VALUE_OR_CLOSE
+                if byte == 0x5D and state == _VALUE_OR_CLOSE:
+                    stack.pop()
+                    self._end_value()
+                elif byte == 0x7B or byte == 0x5B:  # '{' or '['
+                    opener = "{" if byte == 0x7B else "["
+                    self._start_value("object" if opener == "{" else "array")
+                    stack.append([opener, None if opener == "{" else -1])
+                    self._deepest = max(self._deepest, len(stack))
+                    if self.max_depth is not None and len(stack) > self.max_depth:
+                        return self._fail(f"Nesting deeper than {self.max_depth}", base + i)
+                    self._state = _KEY_OR_CLOSE if opener == "{" else _VALUE_OR_CLOSE
+                elif byte == 0x22:
+                    self._start_value("string")
+                    whole = _COMPLETE_STRING.match(chunk, i)
+                    if whole:
+                        self._end_value()
+                        i = whole.end()
+                        continue
+                    self._state = _STRING
+                    self._is_key = False
+                elif byte in _LITERAL_START:
+                    self._start_value("literal")
+                    self._state = _LITERAL
+                    self._literal.clear()
+                    run = _LITERAL_RUN.match(chunk, i)
+                    if run.end() < n and run.end() - i <= MAX_LITERAL_BYTES:
+                        # Fast path: the literal's delimiter is inside this chunk
+                        self._literal += run.group()
+                        if not self._end_literal(base + run.end()):
+                            return False
+                        i = run.end()
+                        continue
+                    self._literal.append(byte)
+                else:
+                    return self._fail(f"Expected {_EXPECTED[state]}", base + i)
+            i += 1
+
+        self._consumed = base + n
+        return True
+
+    def path(self) -> str:
+        """JSONPath-style location of the innermost open container"""
+        parts = ["$"]
+        for opener, position in self._stack:
+            if opener == "{":
+                if position is not None:
+                    parts.append(f".{position}")
+            elif position >= 0:
+                parts.append(f"[{position}]")
+        return "".join(parts)
+
+    def close(self) -> Dict:
+        """Finish the stream and report; a document that did not reach its end is truncated"""
+        self._closed = True
+        truncated = False
+        if self._error is None:
+            if self._state == _LITERAL and not _is_literal_prefix(bytes(self._literal)):
+                self._end_literal(self._consumed)
+            if self._error is None and self._state != _END:
+                truncated = True
+                if self._root_type is None:
+                    message = "Empty document"
+                elif self._state in (_STRING, _ESCAPE, _UNICODE):
+                    message = "Truncated inside a string"
+                elif self._state == _LITERAL:
+                    message = "Truncated inside a literal"
+                else:
+                    message = f"Truncated with {len(self._stack)} open container(s), expecting {_EXPECTED.get(self._state, 'more input')}"
+                self._fail(message, self._consumed)
+
+        return {
+            "valid": self._error is None,
+            "complete": self._state == _END and self._error is None,
+            "truncated": truncated,
+            "error": self._error,
+            "offset": self._error_offset,
+            "open_stack": [opener for opener, _ in self._stack],
+            "path": self.path(),
+            "bytes_consumed": self._consumed,
+            "max_depth": self._deepest,
+            "root_type": self._root_type,
+            "root_members": self._root_members
+        }
+
+
+def validate_json_stream(chunks: Iterable, max_depth: int = None, max_bytes: int = None) -> Dict:
+    """Validate an iterable of chunks, stopping (without pulling more chunks) at the first error"""
+    validator = StreamingJSONValidator(max_depth=max_depth, max_bytes=max_bytes)
+    for chunk in chunks:
+        if not validator.feed(chunk):
+            break
+    return validator.close()
+
+
+def iter_chunks(text, chunk_size: int = 65536):
+    """Split a str or bytes document into fixed-size byte chunks"""
+    data = text.encode("utf-8") if isinstance(text, str) else text
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
@@ -0,0 +1,161 @@
+"""
+Streaming list validation for TC-13.3-02 (office locations)
+Tokenizes a delimited list field chunk by chunk, keeping only the unfinished
+trailing item between chunks. Each chunk's items are normalized and hashed in
+one vectorized step and appended to a growing uint64 array, so memory is
+8 bytes per item and the work is linear; duplicates are resolved once at the
+end. The last item is checked for signs of an abrupt cutoff.
+"""
+
+from typing import Callable, Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+# Endings that suggest the list was cut off inside its last item
+TRUNCATED_ENDINGS = ("...", "…", ",", "-", "/", "&")
+
+# Auto-detection buffers at most this much text while waiting for a ';'
+SEPARATOR_PROBE_CHARS = 65536
+
+
+def _is_truncated_item(item: str) -> str:
+    """Reason the trailing item looks cut off, or "" """
+    if item.endswith(TRUNCATED_ENDINGS):
+        return f"ends with {item[-3:]!r}"
+    if item.count("(") > item.count(")") or item.count("[") > item.count("]"):
+        return "unclosed bracket"
+    return ""
+
+
+class StreamingListValidator:
+    """Incremental validator for ';'-separated (or ','-separated) list fields.
+
+    With separator=None the separator is detected like analyze_list_completeness:
+    ';' if the text contains one, otherwise ','. Detection buffers at most
+    SEPARATOR_PROBE_CHARS of text before committing to ','.
+    Items are compared case-insensitively, or by `key(item)` when given (e.g.
+    Gazetteer.canonical_key, so "Bengaluru" and "Bangalore, India" are duplicates).
+    """
+
+    def __init__(self, separator: str = None, pagination_threshold: int = 50, key: Callable = None):
+        self.separator = separator
+        self.pagination_threshold = pagination_threshold
+        self.key = key
+        self._carry = ""
+        self._hashes = np.empty(1024, dtype=np.uint64)
+        self._n_hashes = 0
+        self._empty = 0
+        self._bracketed = 0
+        self._last_item = ""
+        self._saw_separator = False
+        self._ends_empty = False
+        self._closed = False
+
+    def _append_hashes(self, hashes: np.ndarray):
+        needed = self._n_hashes + len(hashes)
+        if needed > len(self._hashes):
+            grown = np.empty(max(needed, 2 * len(self._hashes)), dtype=np.uint64)
+            grown[:self._n_hashes] = self._hashes[:self._n_hashes]
+            self._hashes = grown
+        self._hashes[self._n_hashes:needed] = hashes
+        self._n_hashes = needed
+
+    def _consume(self, items: list):
+        """Process complete items (in order)"""
+        if not items:
+            return
+        normalized = pd.Series(items, dtype=object).str.strip()
+        non_empty = normalized[normalized != ""]
+        self._empty += len(normalized) - len(non_empty)
+        if len(non_empty):
+            self._bracketed += int(non_empty.str[:1].isin(["(", "["]).sum())
+            keys = non_empty.map(self.key).astype(str) if self.key is not None else non_empty.str.casefold()
+            self._append_hashes(pd.util.hash_array(keys.to_numpy(dtype=object), categorize=False))
+            self._last_item = non_empty.iloc[-1]
+
+    def feed(self, chunk: str):
+        """Consume the next piece of the field text"""
+        if self._closed:
+            raise ValueError("feed() called after close()")
+        text = self._carry + chunk
+        if self.separator is None:
+            if ";" in text:
+                self.separator = ";"
+            elif len(text) > SEPARATOR_PROBE_CHARS:
+                self.separator = ","
+            else:
+                self._carry = text
+                return
+        complete, sep, self._carry = text.rpartition(self.separator)
+        if sep:
+            self._saw_separator = True
+            self._consume(complete.split(self.separator))
+
+    def feed_items(self, items: Iterable):
+        """Consume already-split items (e.g. a list of locations)"""
+        items = [str(item) for item in items]
+        if items:
+            self._consume(items)
+            self._ends_empty = items[-1].strip() == ""
+
+    def close(self) -> Dict:
+        """Finish the list and report counts, duplicates, truncation and pagination"""
+        if self.separator is None:
+            # No ';' anywhere: the buffered text is a ','-separated list
+            self.separator = ","
+            carry, self._carry = self._carry, ""
+            self.feed(carry)
+        self._closed = True
+
+        trailing = self._carry.strip()
+        if trailing:
+            self._consume([trailing])
+            self._ends_empty = False
+        elif self._saw_separator:
+            self._empty += 1
+            self._ends_empty = True
+
+        hashes = self._hashes[:self._n_hashes]
+        unique, first_positions = np.unique(hashes, return_index=True)
+        # Positions (among non-empty items) of repeats of an earlier item
+        is_first = np.zeros(len(hashes), dtype=bool)
+        is_first[first_positions] = True
+        duplicate_positions = np.flatnonzero(~is_first)[:20].tolist()
+
+        item_count = int(len(hashes))
+        last_item = self._last_item
+        truncation_reason = _is_truncated_item(last_item) if last_item else ""
+        # All but the last item start with a bracket: typical of a list cut off mid-enumeration
+        last_bracketed = bool(last_item) and last_item[0] in "(["
+        bracket_pattern = item_count > 5 and self._bracketed - last_bracketed == item_count - 1
+
+        return {
+            "separator": self.separator,
+            "item_count": item_count,
+            "distinct_count": int(len(unique)),
+            "duplicate_count": item_count - int(len(unique)),
+            "duplicate_positions": duplicate_positions,
+            "empty_count": self._empty,
+            "last_item": last_item,
+            "ends_with_empty_item": self._ends_empty,
+            "truncated_trailing_item": bool(truncation_reason),
+            "truncation_reason": truncation_reason,
+            "bracket_pattern": bool(bracket_pattern),
+            "pagination_required": int(len(unique)) > self.pagination_threshold,
+        }
+
+
+def validate_list_field(value, separator: str = None, pagination_threshold: int = 50,
+                        chunk_size: int = 65536, key: Callable = None) -> Dict:
+    """Validate a list given as text, an iterable of text chunks, or a list of items"""
+    validator = StreamingListValidator(separator=separator, pagination_threshold=pagination_threshold, key=key)
+    if isinstance(value, str):
+        for start in range(0, len(value), chunk_size):
+            validator.feed(value[start:start + chunk_size])
+    elif isinstance(value, (list, tuple, pd.Series, np.ndarray)):
+        validator.feed_items(value)
+    else:
+        for chunk in value:
+            validator.feed(chunk)
+    return validator.close()
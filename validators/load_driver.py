@@ -0,0 +1,234 @@
+"""
+Asyncio load driver for profile-generation SLAs (TC-13.2)
+Fires generation requests for master-file companies either at a target arrival
+rate (open loop) or from N concurrent clients (closed loop), records latency into
+per-company_type and per-stage histograms, and reports throughput, p99 and the
+saturation point of a rate or concurrency sweep.
+"""
+
+import asyncio
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+from validators.profile_generator import LocalStubGenerator, ProfileGenerator
+from validators.row_view import ColumnStore
+
+COMPANY_MASTER_PATH = "data/Company Master(Flat Companies Data).csv"
+
+
+def load_companies(path: str = COMPANY_MASTER_PATH) -> list:
+    """Row views over every company in the master file"""
+    return list(ColumnStore(pd.read_csv(path)).rows())
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (about 1% relative precision), mergeable"""
+
+    def __init__(self, precision: float = 0.01):
+        self.precision = precision
+        self._log_base = math.log1p(precision)
+        self.buckets = {}
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float):
+        bucket = math.ceil(math.log(max(latency_ms, 1e-3)) / self._log_base)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def merge(self, other: "LatencyHistogram"):
+        for bucket, n in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + n
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def percentile(self, p: float) -> float:
+        """Upper edge of the bucket holding the p-th percentile (p in 0-100)"""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(math.exp(bucket * self._log_base), self.max_ms)
+        return self.max_ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def summary(self) -> Dict:
+        return {
+            "count": self.count,
+            "mean_ms": self.mean_ms,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms
+        }
+
+
+class AsyncStubBackend:
+    """Stub backend with finite capacity: requests beyond `capacity` queue, so latency grows under load"""
+
+    def __init__(self, stub: LocalStubGenerator, capacity: int = 8, time_scale: float = 0.001):
+        self.stub = stub
+        self.capacity = capacity
+        self.time_scale = time_scale
+        self._semaphores = {}
+
+    async def generate(self, company) -> Dict:
+        # One semaphore per event loop: asyncio primitives cannot be shared across loops
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            self._semaphores = {loop: asyncio.Semaphore(self.capacity)}
+            semaphore = self._semaphores[loop]
+        async with semaphore:
+            result = self.stub.generate(company)
+            await asyncio.sleep(result["latency_ms"] * self.time_scale / 1000)
+        return result
+
+
+class LoadDriver:
+    """Open- and closed-loop load against a profile generator.
+
+    `backend` is either an object with `async generate(company)` or a synchronous
+    ProfileGenerator (run on a thread pool). Latencies are measured on the wall
+    clock and reported in model time (wall / time_scale), so a stub running at
+    time_scale=0.001 reports the latencies a real backend would show.
+    """
+
+    def __init__(self, backend, companies: List, labels_of: Callable,
+                 time_scale: float = 1.0, max_workers: int = 64):
+        self.backend = backend
+        self.companies = companies
+        self.labels_of = labels_of
+        self.time_scale = time_scale
+        self.max_workers = max_workers
+
+    async def _call(self, company, executor) -> Dict:
+        if isinstance(self.backend, ProfileGenerator):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, self.backend.generate, company)
+        return await self.backend.generate(company)
+
+    def _new_stats(self) -> Dict:
+        return {"overall": LatencyHistogram(), "company_type": {}, "company_stage": {}, "errors": 0}
+
+    def _record(self, stats: Dict, company, latency_ms: float, success: bool):
+        if not success:
+            stats["errors"] += 1
+            return
+        stats["overall"].record(latency_ms)
+        labels = self.labels_of(company)
+        for dimension in ("company_type", "company_stage"):
+            label = labels.get(dimension, "Unknown")
+            stats[dimension].setdefault(label, LatencyHistogram()).record(latency_ms)
+
+    async def _timed(self, company, issued_at: float, stats: Dict, executor):
+        try:
+            result = await self._call(company, executor)
+            success = result.get("success", True)
+        except Exception:
+            success = False
+        latency_ms = (time.perf_counter() - issued_at) * 1000 / self.time_scale
+        self._record(stats, company, latency_ms, success)
+
+    async def open_loop(self, rate_per_s: float, n_requests: int, poisson: bool = True, seed: int = 0) -> Dict:
+        """Issue n_requests at `rate_per_s` (model time) regardless of completions; latency includes queueing"""
+        stats = self._new_stats()
+        rng = random.Random(seed)
+        tasks = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            start = time.perf_counter()
+            next_at = start
+            for i in range(n_requests):
+                delay = next_at - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                company = self.companies[i % len(self.companies)]
+                # Latency counts from the scheduled arrival, so a lagging driver cannot hide backlog
+                tasks.append(asyncio.create_task(self._timed(company, next_at, stats, executor)))
+                gap_s = rng.expovariate(rate_per_s) if poisson else 1 / rate_per_s
+                next_at += gap_s * self.time_scale
+            await asyncio.gather(*tasks)
+            elapsed = time.perf_counter() - start
+        return self._report(stats, elapsed, mode="open_loop", offered_rate_per_s=rate_per_s)
+
+    async def closed_loop(self, concurrency: int, n_requests: int) -> Dict:
+        """`concurrency` clients each send their next request as soon as the previous one completes"""
+        stats = self._new_stats()
+        queue = asyncio.Queue()
+        for i in range(n_requests):
+            queue.put_nowait(self.companies[i % len(self.companies)])
+
+        async def client(executor):
+            while True:
+                try:
+                    company = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await self._timed(company, time.perf_counter(), stats, executor)
+
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            start = time.perf_counter()
+            await asyncio.gather(*(client(executor) for _ in range(concurrency)))
+            elapsed = time.perf_counter() - start
+        return self._report(stats, elapsed, mode="closed_loop", concurrency=concurrency)
+
+    def _report(self, stats: Dict, elapsed_wall_s: float, **run_info) -> Dict:
+        elapsed_s = elapsed_wall_s / self.time_scale
+        completed = stats["overall"].count
+        return dict(
+            run_info,
+            completed=completed,
+            errors=stats["errors"],
+            elapsed_s=elapsed_s,
+            throughput_per_s=completed / elapsed_s if elapsed_s > 0 else 0.0,
+            overall=stats["overall"].summary(),
+            company_type={k: h.summary() for k, h in stats["company_type"].items()},
+            company_stage={k: h.summary() for k, h in stats["company_stage"].items()},
+        )
+
+    async def sweep(self, mode: str, levels: List, n_requests: int, min_gain: float = 0.10,
+                    latency_factor: float = 2.0) -> Dict:
+        """Run increasing load levels (rates for open loop, client counts for closed loop).
+
+        The saturation point is the last level the backend sustained: in open loop,
+        before median latency exceeds `latency_factor` x the lightest level's; in
+        closed loop, before adding clients improves throughput by less than `min_gain`.
+        """
+        reports = []
+        saturation = None
+        for level in levels:
+            if mode == "open_loop":
+                report = await self.open_loop(level, n_requests)
+            else:
+                report = await self.closed_loop(level, n_requests)
+            reports.append(report)
+
+            if saturation is not None or len(reports) < 2:
+                continue
+            if mode == "open_loop":
+                degraded = report["overall"]["p50_ms"] > latency_factor * reports[0]["overall"]["p50_ms"]
+            else:
+                degraded = report["throughput_per_s"] < reports[-2]["throughput_per_s"] * (1 + min_gain)
+            if degraded:
+                saturation = levels[len(reports) - 2]
+        return {"mode": mode, "reports": reports, "saturation_point": saturation}
+
+
+def run(coro):
+    """Run a driver coroutine from synchronous code"""
+    return asyncio.run(coro)
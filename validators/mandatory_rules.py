@@ -0,0 +1,190 @@
+"""
+Null-reason classification for TC-14.3 (missing / not disclosed / source failure)
+Every cell of the master gets a one-byte reason code: present, missing, not
+disclosed, not applicable or source failure. Codes come from placeholder tokens,
+classified once per distinct value of each column, and from optional source
+metadata: cells whose source fetch failed are source failures whatever their
+placeholder says. The codes are held in a column-major uint8 matrix, so
+per-column reason histograms and per-company mandatory-field failures are
+array reductions. The matrix is saved as a compressed .npz named by the
+frame's DatasetFingerprint, next to the dataset snapshot.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from validators.field_names import column_for
+from validators.fingerprint import DatasetFingerprint
+from validators.null_tokens import REASON_TOKENS
+
+MANDATORY_RULES_PATH = "rules/test_tc_14_3.json"
+
+# Null-reason codes (uint8), in code order
+REASONS = ("PRESENT", "MISSING", "NOT_DISCLOSED", "NOT_APPLICABLE", "SOURCE_FAILURE")
+REASON = {name: code for code, name in enumerate(REASONS)}
+
+
+def load_mandatory_rules(path: str = MANDATORY_RULES_PATH) -> Dict:
+    """Rules file with its mandatory fields resolved to master columns"""
+    with open(path) as f:
+        rules = json.load(f)
+    rules["mandatory_columns"] = [column_for(field) for field in rules["mandatory_fields"]]
+    return rules
+
+
+def classify_null_reason(value) -> int:
+    """Reason code of one cell value"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return REASON["MISSING"]
+    text = str(value).strip().lower()
+    for reason, tokens in REASON_TOKENS.items():
+        if text in tokens:
+            return REASON[reason]
+    return REASON["PRESENT"]
+
+
+def classify_column(values: pd.Series) -> np.ndarray:
+    """Reason codes of a column, classified once per distinct value"""
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    per_value = np.array([classify_null_reason(value) for value in uniques] + [REASON["MISSING"]], dtype=np.uint8)
+    return per_value[codes]
+
+
+class NullReasonMatrix:
+    """N x C uint8 reason codes for a frame (column-major)"""
+
+    def __init__(self, codes: np.ndarray, columns: List, index: pd.Index, snapshot: DatasetFingerprint = None):
+        self.codes = codes
+        self.columns = list(columns)
+        self.index = index
+        self.snapshot = snapshot
+        self._positions = {column: pos for pos, column in enumerate(self.columns)}
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, source_failed=None, snapshot: DatasetFingerprint = None) -> "NullReasonMatrix":
+        """Classify every cell; source_failed marks failed fetches per row (array / Series) or per cell
+        (a bool frame with df's shape, or a column -> row mask dict)"""
+        codes = np.empty((len(df), len(df.columns)), dtype=np.uint8, order="F")
+        for pos, column in enumerate(df.columns):
+            codes[:, pos] = classify_column(df[column])
+
+        failed = cls._source_mask(df, source_failed)
+        if failed is not None:
+            # A failed fetch explains the gap better than whatever placeholder was written
+            codes[failed & (codes != REASON["PRESENT"])] = REASON["SOURCE_FAILURE"]
+        return cls(codes, df.columns, df.index, snapshot)
+
+    @staticmethod
+    def _source_mask(df: pd.DataFrame, source_failed):
+        if source_failed is None:
+            return None
+        if isinstance(source_failed, dict):
+            mask = np.zeros((len(df), len(df.columns)), dtype=bool, order="F")
+            for column, rows in source_failed.items():
+                mask[:, df.columns.get_loc(column)] = np.asarray(rows, dtype=bool)
+            return mask
+        mask = np.asarray(source_failed, dtype=bool)
+        return np.broadcast_to(mask[:, None], (len(df), len(df.columns))) if mask.ndim == 1 else mask
+
+    def column(self, column: str) -> np.ndarray:
+        return self.codes[:, self._positions[column]]
+
+    def reasons(self, column: str) -> pd.Series:
+        """Reason names of one column (categorical)"""
+        return pd.Series(pd.Categorical.from_codes(self.column(column), categories=REASONS), index=self.index,
+                         name=column)
+
+    def histogram(self, columns: List = None) -> pd.DataFrame:
+        """Cells per reason for each column (columns x REASONS), from one bincount"""
+        positions = [self._positions[c] for c in (self.columns if columns is None else columns)]
+        codes = self.codes[:, positions]
+        offsets = np.arange(len(positions), dtype=np.int64) * len(REASONS)
+        counts = np.bincount((codes + offsets).ravel(order="F"), minlength=len(positions) * len(REASONS))
+        return pd.DataFrame(counts.reshape(len(positions), len(REASONS)), index=[self.columns[p] for p in positions],
+                            columns=list(REASONS))
+
+    def blank_rows(self) -> np.ndarray:
+        """Rows where every cell is missing (e.g. trailing empty CSV lines): not companies"""
+        return (self.codes == REASON["MISSING"]).all(axis=1)
+
+    def mandatory_failures(self, mandatory_columns: List) -> pd.DataFrame:
+        """Per company: mandatory columns without a value (row x column bool), absent columns and blank rows
+        excluded"""
+        present = [column for column in mandatory_columns if column in self._positions]
+        codes = self.codes[:, [self._positions[column] for column in present]]
+        failures = (codes != REASON["PRESENT"]) & ~self.blank_rows()[:, None]
+        return pd.DataFrame(failures, index=self.index, columns=present)
+
+    def flag_optional(self, rules: Dict) -> "NullReasonMatrix":
+        """Apply the rules' optional_null_behavior: with FLAG_AS_NOT_DISCLOSED, missing values of
+        non-mandatory columns are reported as not disclosed"""
+        if rules.get("optional_null_behavior") != "FLAG_AS_NOT_DISCLOSED":
+            return self
+        codes = self.codes.copy(order="F")
+        optional = [pos for column, pos in self._positions.items() if column not in rules["mandatory_columns"]]
+        view = codes[:, optional]
+        view[view == REASON["MISSING"]] = REASON["NOT_DISCLOSED"]
+        codes[:, optional] = view
+        return NullReasonMatrix(codes, self.columns, self.index, self.snapshot)
+
+    def failing_companies(self, mandatory_columns: List) -> pd.Index:
+        return self.index[self.mandatory_failures(mandatory_columns).to_numpy().any(axis=1)]
+
+    def cache_path(self, cache_dir: str) -> str:
+        return os.path.join(cache_dir, f"null_reasons_{self.snapshot.hexdigest()}.npz")
+
+    def save(self, cache_dir: str) -> str:
+        """Write the codes next to the dataset, named by its snapshot digest"""
+        if self.snapshot is None:
+            raise ValueError("Saving a null-reason matrix requires its dataset snapshot")
+        path = self.cache_path(cache_dir)
+        np.savez_compressed(path, codes=self.codes, columns=np.asarray(self.columns, dtype=str))
+        return path
+
+    @classmethod
+    def load(cls, path: str, df: pd.DataFrame, snapshot: DatasetFingerprint = None) -> "NullReasonMatrix":
+        with np.load(path, allow_pickle=False) as data:
+            columns = data["columns"].tolist()
+            if columns != list(df.columns) or len(data["codes"]) != len(df):
+                raise ValueError(f"{path} does not match the frame's shape")
+            return cls(np.asfortranarray(data["codes"]), columns, df.index, snapshot)
+
+    @classmethod
+    def for_snapshot(cls, df: pd.DataFrame, cache_dir: str, source_failed=None) -> "NullReasonMatrix":
+        """Load the matrix saved for this exact frame, or build and save it"""
+        snapshot = DatasetFingerprint.of(df)
+        path = os.path.join(cache_dir, f"null_reasons_{snapshot.hexdigest()}.npz")
+        if source_failed is None and os.path.exists(path):
+            return cls.load(path, df, snapshot)
+        matrix = cls.build(df, source_failed, snapshot)
+        if source_failed is None:
+            matrix.save(cache_dir)
+        return matrix
+
+
+@lru_cache(maxsize=1)
+def _default_rules() -> Dict:
+    return load_mandatory_rules()
+
+
+def classify_field(field: str, value, rules: Dict = None) -> int:
+    """Reason code of one cell of a field (display or column name), with the rules' optional_null_behavior"""
+    rules = _default_rules() if rules is None else rules
+    reason = classify_null_reason(value)
+    optional = field not in rules["mandatory_columns"] and field not in rules["mandatory_fields"]
+    if optional and reason == REASON["MISSING"] and rules.get("optional_null_behavior") == "FLAG_AS_NOT_DISCLOSED":
+        return REASON["NOT_DISCLOSED"]
+    return reason
+
+
+def validate_mandatory(field: str, value, rules: Dict = None) -> bool:
+    """False when a mandatory field (display or column name) has no value; optional fields always pass"""
+    rules = _default_rules() if rules is None else rules
+    if field not in rules["mandatory_columns"] and field not in rules["mandatory_fields"]:
+        return True
+    return classify_null_reason(value) == REASON["PRESENT"]
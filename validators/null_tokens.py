@@ -0,0 +1,32 @@
+"""
+Placeholder tokens that stand in for a value in the master
+Cells are compared stripped and lowercased. The tokens are grouped by the
+reason they give for the missing value (the TC-14.3 null reasons); NULL_TOKENS
+is every placeholder, and NA_TOKENS the ones that are acceptable where a field
+must be N/A (blank or explicitly not applicable, but not "not disclosed").
+"""
+
+MISSING_TOKENS = frozenset(["", "-", "--", "null", "none", "nan", "nil"])
+
+NOT_DISCLOSED_TOKENS = frozenset([
+    "not disclosed", "undisclosed", "not public", "not publicly disclosed", "confidential", "proprietary",
+    "unknown", "not available",
+])
+
+NOT_APPLICABLE_TOKENS = frozenset(["na", "n/a", "not applicable"])
+
+SOURCE_FAILURE_TOKENS = frozenset([
+    "not found", "#n/a", "error", "source error", "source unavailable", "fetch failed", "timeout",
+    "could not retrieve", "retrieval failed",
+])
+
+REASON_TOKENS = {
+    "MISSING": MISSING_TOKENS,
+    "NOT_DISCLOSED": NOT_DISCLOSED_TOKENS,
+    "NOT_APPLICABLE": NOT_APPLICABLE_TOKENS,
+    "SOURCE_FAILURE": SOURCE_FAILURE_TOKENS,
+}
+
+NULL_TOKENS = MISSING_TOKENS | NOT_DISCLOSED_TOKENS | NOT_APPLICABLE_TOKENS | SOURCE_FAILURE_TOKENS
+
+NA_TOKENS = MISSING_TOKENS | NOT_APPLICABLE_TOKENS
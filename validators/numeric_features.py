@@ -0,0 +1,252 @@
+"""
+Parsed numeric feature store
+Financial and size columns hold text such as "$2.3B", "1001-5000",
+"~$5M/month", "₹508 crore" or "Undisclosed". Each distinct cell text is parsed
+once into value, lower and upper bound, currency (amounts converted to USD with
+approximate rates), percent and period flags, and a parse-status code; the
+results are broadcast back to typed numpy arrays. Stores are cached by the
+DatasetFingerprint of the columns they cover (in memory, and optionally as .npz
+files next to the dataset), so downstream validators read ready-made floats.
+"""
+
+import os
+import re
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from validators.fingerprint import DatasetFingerprint
+from validators.null_tokens import NOT_DISCLOSED_TOKENS, NULL_TOKENS
+
+NUMERIC_COLUMNS = [
+    "annual_revenue", "annual_profit", "burn_rate", "runway_months", "total_capital_raised",
+    "valuation", "employee_size", "tam", "sam", "som",
+]
+
+# Parse-status codes (uint8), most to least informative for a present value
+STATUS_CODES = ("exact", "range", "lower_bound", "upper_bound", "approximate", "missing", "undisclosed", "qualitative")
+STATUS = {name: code for code, name in enumerate(STATUS_CODES)}
+
+# Approximate USD conversion rates; parsed amounts are for consistency checks, not accounting
+DEFAULT_CURRENCY_RATES = {"USD": 1.0, "INR": 0.012, "EUR": 1.08, "GBP": 1.27, "AUD": 0.66, "JPY": 0.0067}
+
+# Withheld rather than absent: the NOT_DISCLOSED placeholders, alone or inside a longer note
+UNDISCLOSED = re.compile(
+    r"\b(?:%s)\b" % "|".join(map(re.escape, sorted(NOT_DISCLOSED_TOKENS, key=len, reverse=True))), re.I
+)
+
+MAGNITUDES = {
+    "trillion": 1e12, "tn": 1e12, "t": 1e12,
+    "billion": 1e9, "bn": 1e9, "b": 1e9,
+    "million": 1e6, "mn": 1e6, "mm": 1e6, "m": 1e6,
+    "thousand": 1e3, "k": 1e3,
+    "crores": 1e7, "crore": 1e7, "cr": 1e7,
+    "lakhs": 1e5, "lakh": 1e5, "lac": 1e5,
+}
+_UNITS = "|".join(sorted(MAGNITUDES, key=len, reverse=True))
+_NUM = r"\d{1,3}(?:,\d{2,3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+_SYMBOL = r"[$€£₹¥]|\b(?:usd|inr|rs\.?|eur|gbp|aud|jpy)\s*"
+AMOUNT = re.compile(
+    rf"(?P<neg>-\s*)?(?P<symbol>{_SYMBOL})?\s*(?P<low>{_NUM})\s*(?P<low_unit>(?:{_UNITS})(?![a-z]))?"
+    rf"(?:\s*(?:-|–|—|\bto\b)\s*(?:{_SYMBOL})?\s*(?P<high>{_NUM})\s*(?P<unit>(?:{_UNITS})(?![a-z]))?)?"
+    rf"(?P<plus>\s*\+)?",
+    re.IGNORECASE,
+)
+
+CURRENCY_MARKERS = {
+    "USD": r"\$|\busd\b|\bdollars?\b",
+    "INR": r"₹|\brs\.?|\binr\b|\brupees?\b|\bcrores?\b|\blakhs?\b",
+    "EUR": r"€|\beur\b|\beuros?\b",
+    "GBP": r"£|\bgbp\b",
+    "AUD": r"\baud\b|\ba\$",
+    "JPY": r"¥|\bjpy\b|\byen\b",
+}
+_CURRENCY = re.compile("|".join(f"(?P<{code}>{marker})" for code, marker in CURRENCY_MARKERS.items()), re.I)
+_APPROXIMATE = re.compile(r"~|≈|\b(?:approx\w*|about|around|roughly|est\w*)\b", re.I)
+_LOWER_BOUND = re.compile(r"(?:>|≥|\bover\b|\bat least\b|\bmore than\b|\babove\b)\s*$", re.I)
+_UPPER_BOUND = re.compile(r"(?:<|≤|\bunder\b|\bup to\b|\bless than\b|\bbelow\b)\s*$", re.I)
+_PER_MONTH = re.compile(r"/\s*(?:month|mo)\b|\bper month\b|\bmonthly\b|\ba month\b", re.I)
+_PER_YEAR = re.compile(r"/\s*(?:year|yr|annum)\b|\bper (?:year|annum)\b|\bannual(?:ly)?\b|\byearly\b", re.I)
+_LOSS = re.compile(r"\bloss\b|\bdeficit\b", re.I)
+
+# Field order of a parsed cell, as produced by parse_numeric_text
+FIELDS = ("value", "lower", "upper", "currency", "percent", "period", "status")
+
+
+def _number(text: str) -> float:
+    return float(text.replace(",", ""))
+
+
+@lru_cache(maxsize=65536)
+def parse_numeric_text(text: str, rates: tuple = tuple(DEFAULT_CURRENCY_RATES.items())) -> tuple:
+    """(value, lower, upper, currency, percent, period, status) for one cell text.
+
+    value is the midpoint of a range, or the bound itself for "500+" / "<5";
+    money is converted to USD with `rates` ((code, usd_rate) pairs).
+    """
+    stripped = text.strip()
+    if stripped.lower() in NULL_TOKENS - NOT_DISCLOSED_TOKENS:
+        return (np.nan, np.nan, np.nan, "", False, "", STATUS["missing"])
+
+    # Prefer an amount with a currency symbol ("FY2024: $5M" is five million, not 2024)
+    matches = [m for m in AMOUNT.finditer(stripped)]
+    match = next((m for m in matches if m.group("symbol")), matches[0] if matches else None)
+    if match is None:
+        status = STATUS["undisclosed"] if UNDISCLOSED.search(stripped) else STATUS["qualitative"]
+        return (np.nan, np.nan, np.nan, "", False, "", status)
+
+    scale = MAGNITUDES.get((match.group("unit") or match.group("low_unit") or "").lower(), 1.0)
+    low_scale = MAGNITUDES.get((match.group("low_unit") or "").lower(), scale)
+    low = _number(match.group("low")) * low_scale
+    high = _number(match.group("high")) * scale if match.group("high") else np.nan
+
+    currency_match = _CURRENCY.search(stripped)
+    currency = currency_match.lastgroup if currency_match else ""
+    rate = dict(rates).get(currency, 1.0) if currency else 1.0
+    sign = -1.0 if match.group("neg") or _LOSS.search(stripped) else 1.0
+    low, high = sign * low * rate, sign * high * rate
+    if sign < 0 and not np.isnan(high):
+        low, high = high, low
+
+    before = stripped[:match.start()]
+    if not np.isnan(high):
+        value, lower, upper, status = (low + high) / 2, low, high, STATUS["range"]
+    elif match.group("plus") or _LOWER_BOUND.search(before):
+        value, lower, upper, status = low, low, np.nan, STATUS["lower_bound"]
+    elif _UPPER_BOUND.search(before):
+        value, lower, upper, status = low, np.nan, low, STATUS["upper_bound"]
+    elif _APPROXIMATE.search(stripped):
+        value, lower, upper, status = low, low, low, STATUS["approximate"]
+    else:
+        value, lower, upper, status = low, low, low, STATUS["exact"]
+
+    percent = "%" in stripped
+    period = "month" if _PER_MONTH.search(stripped) else "year" if _PER_YEAR.search(stripped) else ""
+    return (value, lower, upper, currency, percent, period, status)
+
+
+def parse_numeric_values(values: pd.Series, currency_rates: Dict = None) -> pd.DataFrame:
+    """Parse a column once per distinct value into typed feature columns (see FIELDS)"""
+    rates = tuple(sorted((currency_rates or DEFAULT_CURRENCY_RATES).items()))
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    missing = (np.nan, np.nan, np.nan, "", False, "", STATUS["missing"])
+    parsed = [parse_numeric_text(str(value), rates) for value in uniques] + [missing]
+    columns = list(zip(*parsed))
+    take = lambda field, dtype: np.asarray(columns[FIELDS.index(field)], dtype=dtype)[codes]
+    return pd.DataFrame({
+        "value": take("value", np.float64),
+        "lower": take("lower", np.float64),
+        "upper": take("upper", np.float64),
+        "currency": pd.Categorical(take("currency", object)),
+        "percent": take("percent", bool),
+        "period": pd.Categorical(take("period", object)),
+        "status": take("status", np.uint8),
+    }, index=values.index)
+
+
+class NumericFeatureStore:
+    """Parsed numeric features of a frame's messy numeric columns, tied to a dataset snapshot"""
+
+    def __init__(self, features: Dict, snapshot: DatasetFingerprint):
+        self.features = features
+        self.snapshot = snapshot
+        self.columns = list(features)
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, columns: list = None, currency_rates: Dict = None,
+              snapshot: DatasetFingerprint = None) -> "NumericFeatureStore":
+        columns = [column for column in (NUMERIC_COLUMNS if columns is None else columns) if column in df.columns]
+        features = {column: parse_numeric_values(df[column], currency_rates) for column in columns}
+        return cls(features, snapshot or DatasetFingerprint.of(df[columns]))
+
+    def __getitem__(self, column: str) -> pd.DataFrame:
+        return self.features[column]
+
+    def value(self, column: str) -> np.ndarray:
+        return self.features[column]["value"].to_numpy()
+
+    def lower(self, column: str) -> np.ndarray:
+        return self.features[column]["lower"].to_numpy()
+
+    def upper(self, column: str) -> np.ndarray:
+        return self.features[column]["upper"].to_numpy()
+
+    def status(self, column: str) -> np.ndarray:
+        return self.features[column]["status"].to_numpy()
+
+    def frame(self, field: str = "value") -> pd.DataFrame:
+        """One feature field across all columns"""
+        return pd.DataFrame({column: features[field] for column, features in self.features.items()})
+
+    def status_counts(self) -> Dict:
+        """Rows per parse status for each column"""
+        return {
+            column: {STATUS_CODES[code]: int(n) for code, n in enumerate(np.bincount(self.status(column),
+                                                                                      minlength=len(STATUS_CODES))) if n}
+            for column in self.columns
+        }
+
+    def cache_path(self, cache_dir: str) -> str:
+        return os.path.join(cache_dir, f"numeric_features_{self.snapshot.hexdigest()}.npz")
+
+    def save(self, cache_dir: str) -> str:
+        """Write the features next to the dataset, named by its snapshot digest"""
+        arrays = {}
+        for column, features in self.features.items():
+            for field in FIELDS:
+                values = features[field]
+                # Labels are stored as fixed-width unicode so the file loads without pickle
+                arrays[f"{column}:{field}"] = np.asarray(values.astype(str), dtype=str) \
+                    if field in ("currency", "period") else values.to_numpy()
+        path = self.cache_path(cache_dir)
+        np.savez(path, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: str, df: pd.DataFrame, snapshot: DatasetFingerprint) -> "NumericFeatureStore":
+        features = {}
+        with np.load(path, allow_pickle=False) as data:
+            for key in data.files:
+                column, field = key.split(":", 1)
+                values = data[key]
+                features.setdefault(column, {})[field] = pd.Categorical(values) if field in ("currency", "period") \
+                    else values
+        return cls({column: pd.DataFrame({field: fields[field] for field in FIELDS}, index=df.index)
+                    for column, fields in features.items()}, snapshot)
+
+
+_STORES = OrderedDict()
+MAX_CACHED_STORES = 8
+
+
+def feature_store_for(df: pd.DataFrame, columns: list = None, currency_rates: Dict = None,
+                      cache_dir: str = None) -> NumericFeatureStore:
+    """Feature store for a frame, reused while the covered columns are unchanged.
+
+    Stores are keyed by the fingerprint of the covered columns; with cache_dir,
+    they are also loaded from / saved to .npz files named by that fingerprint.
+    """
+    columns = [column for column in (NUMERIC_COLUMNS if columns is None else columns) if column in df.columns]
+    snapshot = DatasetFingerprint.of(df[columns])
+    key = (snapshot.root, tuple(columns), tuple(sorted((currency_rates or DEFAULT_CURRENCY_RATES).items())))
+    if key in _STORES:
+        _STORES.move_to_end(key)
+        return _STORES[key]
+
+    # The on-disk cache holds default-rate features only
+    use_disk = cache_dir is not None and currency_rates is None
+    path = os.path.join(cache_dir, f"numeric_features_{snapshot.hexdigest()}.npz") if use_disk else None
+    if use_disk and os.path.exists(path):
+        store = NumericFeatureStore.load(path, df, snapshot)
+    else:
+        store = NumericFeatureStore.build(df, columns, currency_rates, snapshot=snapshot)
+        if use_disk:
+            store.save(cache_dir)
+
+    _STORES[key] = store
+    if len(_STORES) > MAX_CACHED_STORES:
+        _STORES.popitem(last=False)
+    return store
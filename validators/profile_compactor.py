@@ -0,0 +1,187 @@
+"""
+Budget-aware profile compaction for TC-13.3-05 graceful degradation
+Fits a rendered company profile into a token budget. Section headers and
+"Label: value" lines of mandatory sections are always kept; everything else is
+split into sentences and chosen with a greedy multiple-choice knapsack over
+per-section sentence prefixes (convex-hull slopes, O(n log n)), so sections
+keep their reading order and text is only ever cut at sentence boundaries.
+Sections that lost content, and the list of dropped ones, are flagged as
+summarized.
+"""
+
+import re
+from typing import Dict, List
+
+from validators.token_counter import TokenCounter, section_blocks
+
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(\[])")
+FIELD_LINE = re.compile(r"^[A-Z][\w /&()'-]{0,40}:(\s|$)")
+
+
+def split_sentences(text: str) -> List:
+    """Sentences of a line of prose (a line without terminal punctuation is one sentence)"""
+    return [sentence for sentence in SENTENCE_BOUNDARY.split(text.strip()) if sentence]
+
+
+def _upper_hull(steps: List) -> List:
+    """Group consecutive (cost, value, units) steps into segments of decreasing value per token"""
+    hull = []
+    for cost, value, units in steps:
+        segment = [cost, value, list(units)]
+        # Merge while this segment is denser than the one before it (keeps slopes decreasing)
+        while hull and segment[1] * hull[-1][0] > hull[-1][1] * segment[0]:
+            prev = hull.pop()
+            segment = [prev[0] + segment[0], prev[1] + segment[1], prev[2] + segment[2]]
+        hull.append(segment)
+    return hull
+
+
+class ProfileCompactor:
+    """Compacts rendered profiles to a token budget by section priority"""
+
+    def __init__(self, section_headers: Dict, mandatory_sections: List, section_priorities: Dict = None,
+                 default_priority: float = 10, sentence_decay: float = 0.85,
+                 summarized_flag: str = "[SUMMARIZED]", counter: TokenCounter = None):
+        # Upper-case header text -> section name
+        self.section_headers = {header.upper(): name for name, headers in section_headers.items() for header in headers}
+        self.mandatory_sections = set(mandatory_sections)
+        self.section_priorities = section_priorities or {}
+        self.default_priority = default_priority
+        self.sentence_decay = sentence_decay
+        self.summarized_flag = summarized_flag
+        self.counter = counter or TokenCounter()
+
+    @classmethod
+    def from_rules(cls, token_limit_rules: dict, counter: TokenCounter = None) -> "ProfileCompactor":
+        """Build from the section_detection and compaction blocks of token_limit_rules.json"""
+        sections = token_limit_rules.get("section_detection", {}).get("mandatory_sections", {})
+        config = token_limit_rules.get("compaction", {})
+        return cls(
+            {name: section.get("headers", []) for name, section in sections.items()},
+            list(sections),
+            section_priorities=config.get("section_priorities", {}),
+            default_priority=config.get("default_priority", 10),
+            sentence_decay=config.get("sentence_decay", 0.85),
+            summarized_flag=config.get("summarized_flag", "[SUMMARIZED]"),
+            counter=counter,
+        )
+
+    def _line_tokens(self, text: str) -> int:
+        # One extra token for the line break; the untitled preamble (header None) has no header line
+        return 0 if text is None else self.counter.count(text) + 1
+
+    def _omitted_note(self, sections: List) -> str:
+        titles = [section["header"] or section["name"] for section in sections]
+        return f"{self.summarized_flag} Omitted sections: {', '.join(titles)}."
+
+    def _units(self, header: str, body: str) -> Dict:
+        """Split a section body into fixed lines and optional sentences"""
+        name = "preamble" if header is None else self.section_headers.get(header.upper(), header)
+        mandatory = name in self.mandatory_sections
+        fixed = []
+        optional = []
+        for line_no, line in enumerate(body.splitlines()):
+            line = line.strip()
+            if not line:
+                continue
+            if mandatory and FIELD_LINE.match(line):
+                fixed.append((line_no, line))
+            else:
+                optional.extend((line_no, sentence) for sentence in split_sentences(line))
+        return {"header": header, "name": name, "mandatory": mandatory, "fixed": fixed, "optional": optional}
+
+    def compact(self, rendered: str, budget: int) -> Dict:
+        """Fit a rendered profile (upper-case header lines, as in section_blocks) into `budget` tokens.
+
+        Returns the compacted text, per-section texts, token total, whether it fits,
+        and which sections were summarized or dropped. Mandatory headers and field
+        lines are kept even when they alone exceed the budget (fits is then False).
+        """
+        sections = [self._units(header, body) for header, body in section_blocks(rendered)]
+        flag_tokens = self._line_tokens(self.summarized_flag)
+
+        # Fixed cost: mandatory headers and field lines, plus a reserved flag for sections that may lose text
+        used = 0
+        for section in sections:
+            if section["mandatory"]:
+                used += self._line_tokens(section["header"])
+                used += sum(self._line_tokens(line) for _, line in section["fixed"])
+                if section["optional"]:
+                    used += flag_tokens
+        optional_sections = [s for s in sections if not s["mandatory"] and s["optional"]]
+        if optional_sections:
+            # Room for the note listing omitted sections, should any be dropped
+            used += self._line_tokens(self._omitted_note(optional_sections))
+
+        segments = []
+        costs = []
+        for pos, section in enumerate(sections):
+            priority = self.section_priorities.get(section["name"], self.default_priority)
+            unit_costs = [self.counter.count(sentence) + 1 for _, sentence in section["optional"]]
+            if unit_costs and not section["mandatory"]:
+                # An optional section pays for its header and summarized flag with its first sentence
+                unit_costs[0] += self._line_tokens(section["header"]) + flag_tokens
+            costs.append(unit_costs)
+            steps = [(cost, priority * self.sentence_decay ** i, [i]) for i, cost in enumerate(unit_costs)]
+            for order, (cost, value, units) in enumerate(_upper_hull(steps)):
+                segments.append((value / cost, pos, order, cost, units))
+
+        # Highest value per token first; within a section hull slopes decrease, so prefixes are taken in order
+        segments.sort(key=lambda segment: (-segment[0], segment[1], segment[2]))
+        kept = [0] * len(sections)
+        blocked = set()
+        remaining = budget - used
+        for _, pos, _, cost, units in segments:
+            if pos in blocked:
+                continue
+            if cost <= remaining:
+                kept[pos] += len(units)
+                remaining -= cost
+                continue
+            # Take as many leading sentences of this segment as fit, then stop growing the section
+            for unit in units:
+                if costs[pos][unit] > remaining:
+                    break
+                kept[pos] += 1
+                remaining -= costs[pos][unit]
+            blocked.add(pos)
+
+        return self._render(sections, kept, budget)
+
+    def _render(self, sections: List, kept: List, budget: int) -> Dict:
+        blocks = []
+        texts = {}
+        summarized = []
+        dropped = []
+        for section, n_kept in zip(sections, kept):
+            if not section["mandatory"] and n_kept == 0:
+                if section["optional"]:
+                    dropped.append(section)
+                continue
+            lines = {}
+            for line_no, line in section["fixed"]:
+                lines[line_no] = [line]
+            for line_no, sentence in section["optional"][:n_kept]:
+                lines.setdefault(line_no, []).append(sentence)
+            body = [" ".join(lines[line_no]) for line_no in sorted(lines)]
+            if n_kept < len(section["optional"]):
+                body.append(self.summarized_flag)
+                summarized.append(section["name"])
+            texts[section["name"]] = "\n".join(body)
+            header = [] if section["header"] is None else [section["header"]]
+            blocks.append("\n".join(header + body))
+
+        if dropped:
+            blocks.append(self._omitted_note(dropped))
+
+        text = "\n\n".join(blocks)
+        tokens = self.counter.count(text)
+        return {
+            "text": text,
+            "sections": texts,
+            "tokens": tokens,
+            "budget": budget,
+            "fits": tokens <= budget,
+            "summarized": summarized,
+            "dropped": [section["name"] for section in dropped]
+        }
@@ -0,0 +1,238 @@
+"""
+Profile generators for TC-13.2 response-time checks
+A small interface that an LLM-backed service or a local stub can implement.
+The stub models latency from input size, populated fields and company type,
+with seeded jitter and tail spikes, so SLA checks run offline against
+realistic timings.
+"""
+
+import json
+import math
+import random
+import threading
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict
+
+
+PROFILE_FIELDS = [
+    "name", "nature_of_company", "headquarters_address", "overview_text",
+    "office_locations", "employee_size", "annual_revenue", "profitability_status"
+]
+
+
+def is_populated(value) -> bool:
+    """Non-null and non-blank"""
+    if value is None:
+        return False
+    if isinstance(value, float) and math.isnan(value):
+        return False
+    return str(value).strip() != ""
+
+
+def company_items(company):
+    """(field, value) pairs of a Series, RowView or mapping"""
+    if hasattr(company, "items"):
+        return company.items()
+    return zip(company.index, company.values)
+
+
+def build_profile(company) -> Dict:
+    """Profile payload: the populated PROFILE_FIELDS of a company"""
+    profile = {}
+    for field in PROFILE_FIELDS:
+        value = company.get(field)
+        if is_populated(value):
+            profile[field] = value if isinstance(value, str) else str(value)
+    return profile
+
+
+class ProfileGenerator(ABC):
+    """Generates a company profile and reports how long it took"""
+
+    @abstractmethod
+    def generate(self, company) -> Dict:
+        """Return {"profile": dict, "latency_ms": float, "success": bool}"""
+
+
+class LatencyModel:
+    """latency = (base + input size + populated fields) * company type multiplier * jitter * spike"""
+
+    def __init__(self, base_ms: float = 800, ms_per_input_kchar: float = 250,
+                 ms_per_populated_field: float = 6, company_type_multipliers: Dict = None,
+                 jitter_percent: float = 5, tail_spike_probability: float = 0.01,
+                 tail_spike_multiplier: float = 3.0):
+        self.base_ms = base_ms
+        self.ms_per_input_kchar = ms_per_input_kchar
+        self.ms_per_populated_field = ms_per_populated_field
+        self.company_type_multipliers = company_type_multipliers or {}
+        self.jitter_percent = jitter_percent
+        self.tail_spike_probability = tail_spike_probability
+        self.tail_spike_multiplier = tail_spike_multiplier
+
+    @classmethod
+    def from_rules(cls, rules: dict) -> "LatencyModel":
+        """Build from the latency_model block of rules/performance_rules.json"""
+        config = rules.get("profile_generation", {}).get("latency_model", {})
+        return cls(**{k: v for k, v in config.items() if k != "seed"})
+
+    @staticmethod
+    def complexity(company) -> tuple:
+        """(input characters, populated field count) of a company record"""
+        input_chars = 0
+        populated = 0
+        for _, value in company_items(company):
+            if is_populated(value):
+                input_chars += len(str(value))
+                populated += 1
+        return input_chars, populated
+
+    def expected_ms(self, company, company_type: str = "Unknown") -> float:
+        """Latency before jitter and spikes"""
+        input_chars, populated = self.complexity(company)
+        raw = (self.base_ms
+               + self.ms_per_input_kchar * input_chars / 1000
+               + self.ms_per_populated_field * populated)
+        return raw * self.company_type_multipliers.get(company_type, 1.0)
+
+    def sample_ms(self, company, company_type: str, rng: random.Random) -> float:
+        """One latency draw: expected latency with uniform jitter and occasional tail spikes"""
+        latency = self.expected_ms(company, company_type)
+        jitter = self.jitter_percent / 100
+        latency *= 1 + rng.uniform(-jitter, jitter)
+        if rng.random() < self.tail_spike_probability:
+            latency *= self.tail_spike_multiplier
+        return latency
+
+
+class LocalStubGenerator(ProfileGenerator):
+    """In-process stub. Virtual clock by default: reports modeled latency without sleeping."""
+
+    def __init__(self, model: LatencyModel, type_of: Callable = None, seed: int = 0,
+                 sleep: bool = False, time_scale: float = 1.0):
+        self.model = model
+        self.type_of = type_of or (lambda company: "Unknown")
+        self.seed = seed
+        self.sleep = sleep
+        self.time_scale = time_scale
+        self._attempts = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_rules(cls, rules: dict, type_of: Callable = None, **kwargs) -> "LocalStubGenerator":
+        seed = rules.get("profile_generation", {}).get("latency_model", {}).get("seed", 0)
+        return cls(LatencyModel.from_rules(rules), type_of=type_of, seed=seed, **kwargs)
+
+    def _rng(self, company) -> random.Random:
+        # Seeded per (company, attempt) so a company's latencies don't depend on request order
+        key = str(company.get("company_id", company.get("name")))
+        with self._lock:
+            attempt = self._attempts.get(key, 0)
+            self._attempts[key] = attempt + 1
+        return random.Random(f"{self.seed}:{key}:{attempt}")
+
+    def generate(self, company) -> Dict:
+        start_time = time.perf_counter()
+        try:
+            profile = build_profile(company)
+            latency_ms = self.model.sample_ms(company, self.type_of(company), self._rng(company))
+            if self.sleep:
+                time.sleep(latency_ms * self.time_scale / 1000)
+                latency_ms = (time.perf_counter() - start_time) * 1000
+            return {"profile": profile, "latency_ms": latency_ms, "success": True}
+        except Exception as e:
+            return {
+                "error": str(e),
+                "latency_ms": (time.perf_counter() - start_time) * 1000,
+                "success": False
+            }
+
+
+def _json_safe(company) -> Dict:
+    return {
+        str(field): (value if isinstance(value, str) else str(value)) if is_populated(value) else None
+        for field, value in company_items(company)
+    }
+
+
+class StubProfileServer:
+    """Local HTTP stub: POST /generate {"company": {...}} -> {"profile": {...}}, after the modeled latency"""
+
+    def __init__(self, stub: LocalStubGenerator, host: str = "127.0.0.1", port: int = 0,
+                 time_scale: float = 1.0):
+        self.stub = stub
+        self.time_scale = time_scale
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path != "/generate":
+                    self.send_error(404)
+                    return
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                result = server.stub.generate(body.get("company", {}))
+                time.sleep(result["latency_ms"] * server.time_scale / 1000)
+                payload = json.dumps(result).encode()
+                self.send_response(200 if result["success"] else 500)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/generate"
+
+    def start(self) -> "StubProfileServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubProfileServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class HttpProfileGenerator(ProfileGenerator):
+    """Client for any backend speaking the /generate protocol (stub server or real service); wall-clock latency"""
+
+    def __init__(self, url: str, timeout: float = 30.0):
+        self.url = url
+        self.timeout = timeout
+
+    def generate(self, company) -> Dict:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps({"company": _json_safe(company)}).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        start_time = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = json.loads(response.read())
+            latency_ms = (time.perf_counter() - start_time) * 1000
+            return {"profile": body.get("profile", {}), "latency_ms": latency_ms, "success": True}
+        except Exception as e:
+            return {
+                "error": str(e),
+                "latency_ms": (time.perf_counter() - start_time) * 1000,
+                "success": False
+            }
@@ -0,0 +1,115 @@
+"""
+Zero-copy row views
+Per-company access backed by the frame's column arrays, so validators that take
+`row` can run without building a 165-element pd.Series per company.
+"""
+
+import pandas as pd
+
+
+class ColumnStore:
+    """Column arrays of a frame with a precomputed label -> position lookup"""
+
+    def __init__(self, df: pd.DataFrame):
+        self.index = df.columns
+        self.labels = df.index
+        self.positions = {label: pos for pos, label in enumerate(df.columns)}
+        # One array per column, extracted once; rows only hold (store, position)
+        self.arrays = [df.iloc[:, pos].to_numpy() for pos in range(len(df.columns))]
+        self.length = len(df)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def row(self, idx: int) -> "RowView":
+        """View of the row at position idx (supports negative positions like iloc)"""
+        if idx < 0:
+            idx += self.length
+        if not 0 <= idx < self.length:
+            raise IndexError(f"Row position {idx} out of range for {self.length} rows")
+        return RowView(self, idx)
+
+    def __getitem__(self, idx: int) -> "RowView":
+        return self.row(idx)
+
+    def rows(self):
+        """Iterate over views of every row in order"""
+        for idx in range(self.length):
+            yield RowView(self, idx)
+
+    def column(self, label: str):
+        """Underlying array for a column label"""
+        return self.arrays[self.positions[label]]
+
+
+class RowView:
+    """Read-only row accessor with the pd.Series subset validators use (get, [], in, index, to_dict).
+
+    As for a row from df.iloc, .name is the row label, iteration yields the
+    values, and other attributes fall back to columns.
+    """
+
+    __slots__ = ("_store", "_idx")
+
+    def __init__(self, store: ColumnStore, idx: int):
+        self._store = store
+        self._idx = idx
+
+    @property
+    def index(self):
+        """Column labels, shared by every row of the store"""
+        return self._store.index
+
+    @property
+    def name(self):
+        """Row label in the frame's index, as Series.name of df.iloc[position]"""
+        return self._store.labels[self._idx]
+
+    @property
+    def position(self) -> int:
+        return self._idx
+
+    def get(self, key, default=None):
+        pos = self._store.positions.get(key)
+        if pos is None:
+            return default
+        return self._store.arrays[pos][self._idx]
+
+    def __getitem__(self, key):
+        pos = self._store.positions.get(key)
+        if pos is None:
+            raise KeyError(key)
+        return self._store.arrays[pos][self._idx]
+
+    def __getattr__(self, name):
+        # Only reached when normal attribute lookup fails, so methods and slots win over columns
+        if name.startswith("_"):
+            raise AttributeError(name)
+        pos = self._store.positions.get(name)
+        if pos is None:
+            raise AttributeError(name)
+        return self._store.arrays[pos][self._idx]
+
+    def __contains__(self, key) -> bool:
+        return key in self._store.positions
+
+    def __iter__(self):
+        idx = self._idx
+        return (values[idx] for values in self._store.arrays)
+
+    def __len__(self) -> int:
+        return len(self._store.index)
+
+    def keys(self):
+        return self._store.index
+
+    def items(self):
+        idx = self._idx
+        for label, values in zip(self._store.index, self._store.arrays):
+            yield label, values[idx]
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"RowView(position={self._idx}, columns={len(self._store.index)})"
@@ -0,0 +1,178 @@
+"""
+Multi-pattern section detection for TC-13.3-05/06
+An Aho-Corasick automaton compiled once from the mandatory section headers and
+indicator words in rules/token_limit_rules.json plus the TC-14.3 mandatory
+field labels. Each generated output is scanned in a single linear pass that
+reports every match with its position, so section presence, order, per-section
+length and degradation markers all come from the same scan.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List
+
+
+class AhoCorasick:
+    """Compiled multi-pattern matcher (case-insensitive by default)"""
+
+    def __init__(self, patterns: Iterable, ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        self.patterns = []
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+
+        for pattern in patterns:
+            self._add(pattern)
+        self._build_failure_links()
+
+    def _add(self, pattern: str):
+        if not pattern:
+            raise ValueError("Empty pattern")
+        pattern_id = len(self.patterns)
+        self.patterns.append(pattern)
+        key = pattern.lower() if self.ignore_case else pattern
+        state = 0
+        for ch in key:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((pattern_id, len(key)))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(ch, 0)
+                # Matches ending at the fallback state also end here
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _fold(self, text: str) -> str:
+        if not self.ignore_case:
+            return text
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered
+        # A few characters lower-case to two; keep offsets aligned with the original text
+        return "".join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+    def finditer(self, text: str):
+        """Yield (start, end, pattern_id) for every (possibly overlapping) match, in order of end position"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for pos, ch in enumerate(self._fold(text)):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                end = pos + 1
+                for pattern_id, length in out[state]:
+                    yield end - length, end, pattern_id
+
+    def findall(self, text: str) -> List:
+        return list(self.finditer(text))
+
+
+def _is_header_line(text: str, start: int, end: int) -> bool:
+    """Match stands alone on its line (only whitespace or a trailing colon around it)"""
+    line_start = text.rfind("\n", 0, start) + 1
+    line_end = text.find("\n", end)
+    line_end = len(text) if line_end == -1 else line_end
+    return not text[line_start:start].strip() and text[end:line_end].strip() in ("", ":")
+
+
+class SectionDetector:
+    """Finds section headers, section indicators, degradation markers and field labels in one pass"""
+
+    def __init__(self, sections: Dict, degradation_markers: Dict = None, summarized_flags: List = None,
+                 field_labels: List = None, keyword_groups: Dict = None):
+        self.section_order = list(sections)
+        # (kind, name) per pattern; one pattern may serve several roles, so roles are a list
+        roles = {}
+
+        def add(pattern: str, role: tuple):
+            roles.setdefault(pattern.lower(), []).append(role)
+
+        for section, config in sections.items():
+            for header in config.get("headers", []):
+                add(header, ("header", section))
+            for indicator in config.get("indicators", []):
+                add(indicator, ("indicator", section))
+        for strategy, markers in (degradation_markers or {}).items():
+            for marker in markers:
+                add(marker, ("degradation", strategy))
+        for flag in summarized_flags or []:
+            add(flag, ("summarized", flag))
+        for label in field_labels or []:
+            add(label, ("field", label))
+        for group, words in (keyword_groups or {}).items():
+            for word in words:
+                add(word, ("keyword:" + group, word))
+
+        self._roles = list(roles.values())
+        self.matcher = AhoCorasick(roles.keys())
+
+    @classmethod
+    def from_rules(cls, token_limit_rules: dict, mandatory_field_rules: dict = None) -> "SectionDetector":
+        """Build from the section_detection block of token_limit_rules.json and TC-14.3 mandatory_fields"""
+        config = token_limit_rules.get("section_detection", {})
+        keyword_groups = {
+            "key_information": config.get("key_information_stems", []),
+            "quality": config.get("quality_keywords", []),
+        }
+        return cls(
+            config.get("mandatory_sections", {}),
+            degradation_markers=config.get("degradation_markers", {}),
+            summarized_flags=config.get("summarized_flags", []),
+            field_labels=(mandatory_field_rules or {}).get("mandatory_fields", []),
+            keyword_groups=keyword_groups,
+        )
+
+    def scan(self, output: str) -> Dict:
+        """Single pass over an output.
+
+        Returns header positions (first stand-alone occurrence per section, in
+        text order) with per-section body lengths, whether headers follow the
+        configured order, and every indicator / marker / field label / keyword
+        found with its first position.
+        """
+        headers = {}
+        found = {}
+        for start, end, pattern_id in self.matcher.finditer(output):
+            for kind, name in self._roles[pattern_id]:
+                if kind == "header":
+                    if name not in headers and _is_header_line(output, start, end):
+                        headers[name] = (start, end)
+                else:
+                    found.setdefault(kind, {}).setdefault(name, start)
+
+        ordered = sorted(headers.items(), key=lambda item: item[1][0])
+        sections = []
+        for i, (name, (start, end)) in enumerate(ordered):
+            body_end = ordered[i + 1][1][0] if i + 1 < len(ordered) else len(output)
+            sections.append({
+                "section": name,
+                "start": start,
+                "end": body_end,
+                "length": len(output[end:body_end].strip())
+            })
+
+        expected_order = [name for name in self.section_order if name in headers]
+        return {
+            "sections": sections,
+            "order_valid": [s["section"] for s in sections] == expected_order,
+            "indicators": found.get("indicator", {}),
+            "degradation": found.get("degradation", {}),
+            "summarized_flags": found.get("summarized", {}),
+            "fields": found.get("field", {}),
+            "keywords": {kind.split(":", 1)[1]: names for kind, names in found.items() if kind.startswith("keyword:")}
+        }
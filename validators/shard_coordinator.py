@@ -0,0 +1,276 @@
+"""
+Sharded validation: a coordinator and TCP shard workers
+The coordinator splits the master into N partitions by a stable hash of each
+company key and sends one job per shard to a pool of worker processes over TCP
+(newline-delimited JSON, one connection per job). Workers read the master in
+chunks from a path they all can see and keep only the rows of their shard, so
+no process holds the whole file. Failed shards (worker unreachable, timed out
+or reporting an error) are retried on the next worker, up to max_attempts.
+
+Each worker runs the ValidationSuite over its rows and returns per-rule counts
+and violating (row, company) pairs; the coordinator merges them in row order,
+so the result does not depend on which worker answered first. Checks that span
+shards are answered from compact signatures instead of rows:
+
+- duplicates: each shard's distinct normalized names (entity_resolution), which
+  the coordinator clusters with one NameBlockingIndex;
+- shared identity values: 64-bit hashes of normalized identity values (website,
+  social handles, contact emails and phones, CEO), so a value of one company
+  appearing in another company's record is found across shards. As in the
+  TC-13.4 contamination checks, values named by many companies are common and
+  never count, and companies of one duplicate cluster may share values.
+"""
+
+import json
+import socket
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from validators.entity_resolution import NameBlockingIndex
+from validators.gazetteer import normalize_text
+from validators.null_tokens import NULL_TOKENS
+from validators.validation_suite import ValidationSuite, company_keys
+
+IDENTITY_COLUMNS = [
+    "website_url", "linkedin_url", "twitter_handle", "facebook_url", "instagram_url", "primary_contact_email",
+    "primary_phone_number", "ceo_name", "ceo_linkedin_url", "contact_person_email", "contact_person_phone",
+]
+
+# A value named by at least this share of companies is common, not evidence of contamination
+COMMON_VALUE_MIN_SHARE = 0.05
+
+
+def shard_of(keys: List, n_shards: int) -> np.ndarray:
+    """Partition of each company key; stable across processes and machines"""
+    hashes = pd.util.hash_array(np.array([str(key) for key in keys], dtype=object))
+    return (hashes % np.uint64(n_shards)).astype(np.int64)
+
+
+def read_shard(master_path: str, shard: int, n_shards: int, chunksize: int = 100_000) -> pd.DataFrame:
+    """Rows of one shard, read chunk by chunk; the index keeps each row's position in the file"""
+    frames = []
+    for chunk in pd.read_csv(master_path, chunksize=chunksize):
+        frames.append(chunk[shard_of(company_keys(chunk), n_shards) == shard])
+    return pd.concat(frames) if len(frames) > 1 else frames[0]
+
+
+def identity_signatures(df: pd.DataFrame, columns: List = None) -> List:
+    """[value hash, row position, company key, column] per present identity value"""
+    columns = IDENTITY_COLUMNS if columns is None else columns
+    key_of = dict(zip(df.index.tolist(), company_keys(df)))
+    signatures = []
+    for column in [c for c in columns if c in df.columns]:
+        values = df[column].dropna().astype(str)
+        values = values[~values.str.strip().str.lower().isin(NULL_TOKENS)].map(normalize_text)
+        values = values[values != ""]
+        hashes = pd.util.hash_array(values.to_numpy(dtype=object)).tolist()
+        signatures.extend([h, row, key_of[row], column] for h, row in zip(hashes, values.index.tolist()))
+    return signatures
+
+
+def validate_shard(master_path: str, shard: int, n_shards: int, max_rows: int = None, chunksize: int = 100_000,
+                   suite_options: Dict = None, name_column: str = "name", identity_columns: List = None) -> Dict:
+    """Worker side of one shard job: per-rule violations plus the signatures for cross-shard checks"""
+    df = read_shard(master_path, shard, n_shards, chunksize)
+    keys = company_keys(df)
+    positions = df.index.to_numpy()
+    results = {}
+    for rule_id, (check, mask) in ValidationSuite(**(suite_options or {})).run(df).items():
+        violating = np.flatnonzero(mask)
+        listed = violating if max_rows is None else violating[:max_rows]
+        results[rule_id] = {
+            "check": check,
+            "violations": int(len(violating)),
+            "rows": [[int(positions[i]), keys[i]] for i in listed.tolist()],
+        }
+    names = NameBlockingIndex().normalize(df[name_column]) if name_column in df.columns else pd.Series(dtype=object)
+    named = np.flatnonzero((names != "").to_numpy())
+    by_name = {}
+    for i in named.tolist():
+        by_name.setdefault(names.iat[i], []).append([int(positions[i]), keys[i]])
+    return {
+        "shard": shard,
+        "rows": len(df),
+        "results": results,
+        "names": by_name,
+        "identity": identity_signatures(df, identity_columns),
+    }
+
+
+def handle_job(line: bytes) -> Dict:
+    """Response to one worker request; failures are reported to the coordinator, not raised"""
+    try:
+        job = json.loads(line)
+        op = job.pop("op", None)
+        if op == "ping":
+            return {"ok": True}
+        if op == "validate_shard":
+            return {"ok": True, **validate_shard(**job)}
+        return {"ok": False, "error": f"Unknown op '{op}'"}
+    except Exception as e:
+        return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+class ShardWorker:
+    """TCP server answering shard jobs ({"op": "validate_shard", ...}) and pings"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    self.wfile.write(json.dumps(handle_job(line)).encode() + b"\n")
+                    self.wfile.flush()
+
+        self._server = socketserver.ThreadingTCPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def address(self) -> tuple:
+        return self._server.server_address[:2]
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def start(self) -> "ShardWorker":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ShardWorker":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def serve_worker(host: str = "127.0.0.1", port: int = 0, ready=None):
+    """Process entry point: serve shard jobs until terminated; the bound address is put on `ready` (a queue)"""
+    worker = ShardWorker(host, port)
+    if ready is not None:
+        ready.put(worker.address)
+    worker.serve_forever()
+
+
+def send_job(address: tuple, job: Dict, timeout: float = 300.0) -> Dict:
+    with socket.create_connection(tuple(address), timeout=timeout) as sock:
+        sock.sendall(json.dumps(job).encode() + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise ConnectionError(f"Worker {address} closed the connection")
+    response = json.loads(line)
+    if not response.pop("ok"):
+        raise RuntimeError(f"Worker {address}: {response['error']}")
+    return response
+
+
+class ShardCoordinator:
+    """Dispatches shard jobs to workers, retries failed shards and merges their results"""
+
+    def __init__(self, workers: List, n_shards: int = None, max_attempts: int = 3, timeout: float = 300.0,
+                 chunksize: int = 100_000, min_share: float = COMMON_VALUE_MIN_SHARE, **suite_options):
+        if not workers:
+            raise ValueError("ShardCoordinator needs at least one worker address")
+        self.workers = [tuple(address) for address in workers]
+        self.n_shards = len(self.workers) if n_shards is None else n_shards
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self.chunksize = chunksize
+        self.min_share = min_share
+        self.suite_options = suite_options
+
+    def _run_shard(self, master_path: str, shard: int, max_rows: int) -> Dict:
+        job = {"op": "validate_shard", "master_path": master_path, "shard": shard, "n_shards": self.n_shards,
+               "max_rows": max_rows, "chunksize": self.chunksize, "suite_options": self.suite_options}
+        errors = []
+        for attempt in range(self.max_attempts):
+            # Each retry goes to the next worker, so one dead worker costs its shards one attempt
+            address = self.workers[(shard + attempt) % len(self.workers)]
+            try:
+                response = send_job(address, job, self.timeout)
+            except (OSError, RuntimeError, ValueError) as e:
+                errors.append(f"{address[0]}:{address[1]}: {e}")
+                continue
+            response["attempts"] = attempt + 1
+            response["worker"] = list(address)
+            response["errors"] = errors
+            return response
+        raise RuntimeError(f"Shard {shard} failed after {self.max_attempts} attempts: {errors}")
+
+    def run(self, master_path: str, max_rows: int = None) -> Dict:
+        with ThreadPoolExecutor(max_workers=self.n_shards) as pool:
+            shards = list(pool.map(lambda shard: self._run_shard(master_path, shard, max_rows), range(self.n_shards)))
+        return merge_shard_results(shards, max_rows, self.min_share)
+
+
+def merge_shard_results(shards: List, max_rows: int = None, min_share: float = COMMON_VALUE_MIN_SHARE) -> Dict:
+    """One report from per-shard results, independent of shard order and of which worker ran each shard"""
+    shards = sorted(shards, key=lambda s: s["shard"])
+    results = {}
+    for s in shards:
+        for rule_id, result in s["results"].items():
+            merged = results.setdefault(rule_id, {"check": result["check"], "violations": 0, "rows": []})
+            merged["violations"] += result["violations"]
+            merged["rows"].extend(map(tuple, result["rows"]))
+    for merged in results.values():
+        # Each shard sent its first max_rows violations, so the global first max_rows are among them
+        rows = sorted(merged.pop("rows"))
+        merged["companies"] = [key for _, key in (rows if max_rows is None else rows[:max_rows])]
+
+    rows = sum(s["rows"] for s in shards)
+    duplicates, cluster_of = _duplicate_clusters(shards)
+    return {
+        "rows": rows,
+        "shards": [{"shard": s["shard"], "rows": s["rows"], "worker": s["worker"], "attempts": s["attempts"],
+                    "errors": s["errors"]} for s in shards],
+        "results": results,
+        "duplicates": duplicates,
+        "shared_identity_values": _shared_identity_values(shards, rows, cluster_of, min_share),
+    }
+
+
+def _duplicate_clusters(shards: List) -> tuple:
+    """Duplicate clusters (company keys) from the shards' normalized names, and each clustered row's cluster"""
+    names, keys = {}, {}
+    for s in shards:
+        for name, rows in s["names"].items():
+            for row, key in rows:
+                names[row], keys[row] = name, key
+    order = sorted(names)
+    report = NameBlockingIndex().cluster(pd.Series([names[row] for row in order], index=order, dtype=object))
+    clusters = [[order[i] for i in cluster] for cluster in report["clusters"]]
+    cluster_of = {row: c for c, cluster in enumerate(clusters) for row in cluster}
+    return [[keys[row] for row in cluster] for cluster in clusters], cluster_of
+
+
+def _shared_identity_values(shards: List, total_rows: int, cluster_of: Dict, min_share: float) -> List:
+    """Identity values held by more than one company (outside one duplicate cluster) but not common"""
+    signatures = pd.DataFrame([sig for s in shards for sig in s["identity"]], columns=["hash", "row", "key", "column"])
+    if signatures.empty:
+        return []
+    keys = dict(zip(signatures["row"].tolist(), signatures["key"].tolist()))
+    min_rows = max(2, min_share * total_rows)
+    shared = []
+    for _, group in signatures.groupby("hash", sort=False):
+        rows = sorted(set(group["row"]))
+        if len(rows) < 2 or len(rows) >= min_rows:
+            continue
+        if len({cluster_of.get(row, ("row", row)) for row in rows}) < 2:
+            continue
+        shared.append((rows, sorted(set(group["column"]))))
+    shared.sort()
+    return [{"companies": [keys[row] for row in rows], "columns": columns} for rows, columns in shared]
@@ -0,0 +1,73 @@
+"""
+Normalized text column cache
+Derived string columns (stripped, lower-cased, whitespace-collapsed, lengths)
+computed lazily once per column and shared by every string validator.
+"""
+
+import pandas as pd
+
+
+class NormalizedTextCache:
+    """Per-dataset cache of normalized text columns"""
+
+    VARIANTS = ("stripped", "lower", "collapsed", "length")
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._derived = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, column: str, variant: str = "lower") -> pd.Series:
+        """Return the derived column, computing it on first access"""
+        if variant not in self.VARIANTS:
+            raise ValueError(f"Unknown variant '{variant}', expected one of {self.VARIANTS}")
+
+        key = (column, variant)
+        if key in self._derived:
+            self.hits += 1
+            return self._derived[key]
+
+        self.misses += 1
+        if variant == "stripped":
+            base = self.df[column]
+            # Non-string cells (numbers) are normalized through str() like the scalar validators do
+            derived = base.map(lambda v: v if pd.isna(v) else str(v)).astype(object).str.strip()
+        elif variant == "lower":
+            derived = self.get(column, "stripped").str.lower()
+        elif variant == "collapsed":
+            derived = self.get(column, "lower").str.replace(r"\s+", " ", regex=True)
+        else:
+            derived = self.get(column, "stripped").str.len().fillna(0).astype(int)
+
+        self._derived[key] = derived
+        return derived
+
+    def stripped(self, column: str) -> pd.Series:
+        return self.get(column, "stripped")
+
+    def lower(self, column: str) -> pd.Series:
+        return self.get(column, "lower")
+
+    def collapsed(self, column: str) -> pd.Series:
+        return self.get(column, "collapsed")
+
+    def lengths(self, column: str) -> pd.Series:
+        return self.get(column, "length")
+
+    def value(self, column: str, idx: int, variant: str = "lower"):
+        """Normalized value of a single cell by row position"""
+        return self.get(column, variant).iat[idx]
+
+    def invalidate(self, column: str = None):
+        """Drop derived columns for one base column, or all of them"""
+        if column is None:
+            self._derived.clear()
+            return
+        for key in [k for k in self._derived if k[0] == column]:
+            del self._derived[key]
+
+    def rebind(self, df: pd.DataFrame):
+        """Point the cache at a new base frame and discard everything derived from the old one"""
+        self.df = df
+        self.invalidate()
@@ -0,0 +1,120 @@
+"""
+Offline token counting for TC-13.3 token-budget checks
+A heuristic tokenizer in the style of byte-pair-encoding models: text is
+pre-tokenized the way BPE tokenizers split it (words with their leading space,
+digit runs of up to three, punctuation runs, whitespace), and each piece costs
+one token plus extra subword tokens for long or non-ASCII pieces. Rare long words
+are charged on the high side, which keeps budget checks conservative.
+Counts are memoized per piece and per text (keyed by a digest of the text).
+"""
+
+import hashlib
+import math
+import re
+from functools import lru_cache
+from typing import Dict, List, Mapping
+
+import pandas as pd
+
+# Same piece boundaries as common BPE pre-tokenizers (contractions, words, 1-3 digit runs, symbols, spaces)
+PRETOKENIZE_PATTERN = re.compile(
+    r"'(?:s|t|re|ve|m|ll|d)|[^\S\n]?[^\W\d_]+|\d{1,3}|[^\S\n]?(?:[^\s\w]|_)+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"
+)
+
+# Pieces up to SHORT_PIECE_CHARS are one token; each further CHARS_PER_SUBWORD characters add one
+SHORT_PIECE_CHARS = 8
+CHARS_PER_SUBWORD = 5
+
+SECTION_HEADER_PATTERN = re.compile(r"^[ \t]*([A-Z][A-Z &/\-]{2,})[ \t]*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=200_000)
+def piece_tokens(piece: str) -> int:
+    """Token cost of one pre-tokenized piece"""
+    stripped = piece.lstrip(" ")
+    if not stripped or stripped.isspace():
+        return 1
+    if not stripped.isascii():
+        # Non-ASCII text falls back to roughly one token per UTF-8 byte pair
+        return max(1, math.ceil(len(stripped.encode("utf-8")) / 2))
+    if len(stripped) <= SHORT_PIECE_CHARS:
+        return 1
+    return 1 + math.ceil((len(stripped) - SHORT_PIECE_CHARS) / CHARS_PER_SUBWORD)
+
+
+class TokenCounter:
+    """Counts tokens with a bounded memo cache keyed by text digest"""
+
+    def __init__(self, max_cache_entries: int = 500_000):
+        self.max_cache_entries = max_cache_entries
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    @staticmethod
+    def tokenize(text: str) -> list:
+        """Pre-tokenized pieces of a text"""
+        return PRETOKENIZE_PATTERN.findall(text)
+
+    def count(self, text) -> int:
+        """Token count of a value; null or empty values count as zero"""
+        if text is None or (isinstance(text, float) and math.isnan(text)):
+            return 0
+        text = text if isinstance(text, str) else str(text)
+        if not text:
+            return 0
+
+        key = self._key(text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        total = sum(piece_tokens(piece) for piece in PRETOKENIZE_PATTERN.findall(text))
+        if len(self._cache) >= self.max_cache_entries:
+            self._cache.clear()
+        self._cache[key] = total
+        return total
+
+    def count_column(self, values: pd.Series) -> pd.Series:
+        """Token counts for a whole column, counting each distinct value once"""
+        codes, uniques = pd.factorize(values, use_na_sentinel=True)
+        unique_counts = [self.count(value) for value in uniques]
+        counts = [unique_counts[code] if code >= 0 else 0 for code in codes]
+        return pd.Series(counts, index=values.index, dtype="int64")
+
+    def count_frame(self, df: pd.DataFrame, columns: list = None) -> pd.DataFrame:
+        """Per-cell token counts for the selected (default: all) columns"""
+        columns = list(df.columns) if columns is None else columns
+        return pd.DataFrame({column: self.count_column(df[column]) for column in columns}, index=df.index)
+
+    def count_sections(self, sections: Mapping) -> Dict:
+        """Per-section token totals of a profile given as {section: text}, plus "total" """
+        totals = {name: self.count(text) for name, text in sections.items()}
+        totals["total"] = sum(totals.values())
+        return totals
+
+    def count_rendered_sections(self, rendered: str) -> Dict:
+        """Per-section totals of a rendered profile whose sections start with upper-case header lines"""
+        return self.count_sections(split_sections(rendered))
+
+
+def section_blocks(rendered: str) -> List:
+    """(header, body) pairs of rendered text split on upper-case header lines; untitled leading text has header None"""
+    headers = list(SECTION_HEADER_PATTERN.finditer(rendered))
+    preamble = rendered[:headers[0].start()] if headers else rendered
+    blocks = [(None, preamble.strip())] if preamble.strip() else []
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(rendered)
+        blocks.append((header.group(1).strip(), rendered[header.end():end].strip()))
+    return blocks
+
+
+def split_sections(rendered: str) -> Dict:
+    """{header: body} of section_blocks; text before the first header is reported as "preamble" """
+    return {"preamble" if header is None else header: body for header, body in section_blocks(rendered)}
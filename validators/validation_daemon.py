@@ -0,0 +1,235 @@
+"""
+Local validation daemon
+Keeps the company master, its compiled ValidationSuite and the per-rule
+violation masks resident in one process and answers requests over a Unix
+socket, so interactive and CI runs skip interpreter start-up, CSV parsing and
+validator construction. Requests and responses are one JSON object per line:
+
+    {"op": "validate", "checks": [...], "rules": [...], "companies": [...], "max_rows": 10}
+    {"op": "status"} / {"op": "ping"} / {"op": "reload"}
+
+A watcher thread polls the modification times of the master CSV and the rule
+files and rebuilds the state in the background when any of them changes; the
+new state replaces the old one only once it is complete, and a failed reload
+(for example a half-written rules file) keeps serving the previous snapshot.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from validators.fingerprint import DatasetFingerprint
+from validators.load_driver import COMPANY_MASTER_PATH
+from validators.validation_suite import CHECKS, ValidationSuite, company_keys, summarize
+
+
+class DaemonState:
+    """One loaded snapshot: frame, suite, violation masks and company lookup"""
+
+    def __init__(self, master_path: str, suite_options: Dict):
+        start = time.perf_counter()
+        self.df = pd.read_csv(master_path)
+        self.suite = ValidationSuite(**suite_options)
+        self.snapshot = DatasetFingerprint.of(self.df)
+        self.masks = self.suite.run(self.df)
+        self.keys = company_keys(self.df)
+        self.positions = {key: position for position, key in enumerate(self.keys)}
+        self.rule_checks = {rule_id: check for rule_id, (check, _) in self.masks.items()}
+        self.load_ms = (time.perf_counter() - start) * 1000
+
+    def validate(self, checks: List = None, rules: List = None, companies: List = None,
+                 max_rows: int = None) -> Dict:
+        selected = list(self.masks)
+        if checks is not None:
+            unknown = sorted(set(checks) - set(CHECKS))
+            if unknown:
+                raise ValueError(f"Unknown checks: {unknown}")
+            selected = [rule_id for rule_id in selected if self.rule_checks[rule_id] in checks]
+        if rules is not None:
+            unknown = sorted(set(rules) - set(self.masks))
+            if unknown:
+                raise KeyError(f"Unknown rule ids: {unknown}")
+            selected = [rule_id for rule_id in selected if rule_id in set(rules)]
+        rows = None
+        if companies is not None:
+            unknown = [company for company in companies if company not in self.positions]
+            if unknown:
+                raise KeyError(f"Unknown companies: {unknown[:10]}")
+            rows = np.array(sorted(self.positions[company] for company in companies), dtype=np.intp)
+        return summarize({rule_id: self.masks[rule_id] for rule_id in selected}, self.keys, rows, max_rows)
+
+
+def _validate_params(request: Dict) -> tuple:
+    """(checks, rules, companies, max_rows) of a validate request, type-checked"""
+    params = []
+    for name in ("checks", "rules"):
+        value = request.get(name)
+        if value is not None and not (isinstance(value, list) and all(isinstance(v, str) for v in value)):
+            raise ValueError(f"'{name}' must be a list of strings")
+        params.append(value)
+    companies = request.get("companies")
+    if companies is not None and not (isinstance(companies, list) and
+                                      all(isinstance(c, (int, str)) and not isinstance(c, bool) for c in companies)):
+        raise ValueError("'companies' must be a list of company ids or keys")
+    params.append(companies)
+    max_rows = request.get("max_rows")
+    if max_rows is not None and (not isinstance(max_rows, int) or isinstance(max_rows, bool) or max_rows < 0):
+        raise ValueError("'max_rows' must be a non-negative integer")
+    params.append(max_rows)
+    return tuple(params)
+
+
+class ValidationDaemon:
+    """Unix-socket server over a resident DaemonState, reloaded when its input files change"""
+
+    def __init__(self, socket_path: str, master_path: str = COMPANY_MASTER_PATH, poll_interval: float = 1.0,
+                 **suite_options):
+        self.socket_path = socket_path
+        self.master_path = master_path
+        self.poll_interval = poll_interval
+        self.suite_options = suite_options
+        self.state = DaemonState(master_path, suite_options)
+        self.reloads = 0
+        self.reload_error = None
+        self._mtimes = self._watched_mtimes()
+        self._reload_lock = threading.Lock()
+        self._stopped = threading.Event()
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    response = daemon.handle_request(line)
+                    self.wfile.write(json.dumps(response).encode() + b"\n")
+                    self.wfile.flush()
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)  # left behind by a daemon that did not shut down cleanly
+        self._server = socketserver.ThreadingUnixStreamServer(socket_path, Handler)
+        self._server.daemon_threads = True
+        self._threads = []
+
+    def _watched_paths(self) -> List:
+        return [self.master_path] + list(self.state.suite.rule_files)
+
+    def _watched_mtimes(self) -> Dict:
+        return {path: os.stat(path).st_mtime_ns if os.path.exists(path) else None for path in self._watched_paths()}
+
+    def reload(self) -> bool:
+        """Rebuild the state from disk; the old state keeps serving until the new one is ready"""
+        with self._reload_lock:
+            mtimes = self._watched_mtimes()
+            try:
+                state = DaemonState(self.master_path, self.suite_options)
+            except Exception as e:
+                self.reload_error = f"{type(e).__name__}: {e}"
+                self._mtimes = mtimes  # retry after the next change rather than on every poll
+                return False
+            self.state = state
+            self.reloads += 1
+            self.reload_error = None
+            self._mtimes = mtimes
+            return True
+
+    def _watch(self):
+        while not self._stopped.wait(self.poll_interval):
+            if self._watched_mtimes() != self._mtimes:
+                self.reload()
+
+    def handle_request(self, line: bytes) -> Dict:
+        start = time.perf_counter()
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("A request must be a JSON object")
+            op = request.get("op")
+            state = self.state
+            if op == "ping":
+                response = {"ok": True}
+            elif op == "status":
+                response = {
+                    "ok": True, "snapshot": state.snapshot.hexdigest(), "rows": len(state.df),
+                    "rules": len(state.masks), "reloads": self.reloads, "reload_error": self.reload_error,
+                    "load_ms": round(state.load_ms, 1),
+                }
+            elif op == "reload":
+                response = {"ok": self.reload(), "snapshot": self.state.snapshot.hexdigest(),
+                            "reload_error": self.reload_error}
+            elif op == "validate":
+                results = state.validate(*_validate_params(request))
+                response = {"ok": True, "snapshot": state.snapshot.hexdigest(), "results": results}
+            else:
+                response = {"ok": False, "error": f"Unknown op '{op}'"}
+        except (ValueError, KeyError) as e:
+            response = {"ok": False, "error": str(e)}
+        except Exception as e:  # never let one bad request drop the client's connection
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        response["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return response
+
+    def start(self) -> "ValidationDaemon":
+        for target in (self._server.serve_forever, self._watch):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._server.shutdown()
+        self._server.server_close()
+        for thread in self._threads:
+            thread.join()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def __enter__(self) -> "ValidationDaemon":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class ValidationClient:
+    """Line-oriented JSON client for a ValidationDaemon; keeps one connection open"""
+
+    def __init__(self, socket_path: str, timeout: float = 30.0):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(socket_path)
+        self._reader = self._sock.makefile("rb")
+
+    def request(self, op: str, **params) -> Dict:
+        return self._request_line(json.dumps({"op": op, **params}).encode())
+
+    def _request_line(self, line: bytes) -> Dict:
+        self._sock.sendall(line + b"\n")
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Validation daemon closed the connection")
+        return json.loads(line)
+
+    def validate(self, checks: List = None, rules: List = None, companies: List = None, max_rows: int = None) -> Dict:
+        params = {key: value for key, value in
+                  (("checks", checks), ("rules", rules), ("companies", companies), ("max_rows", max_rows))
+                  if value is not None}
+        return self.request("validate", **params)
+
+    def close(self):
+        self._reader.close()
+        self._sock.close()
+
+    def __enter__(self) -> "ValidationClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,91 @@
+"""
+Compiled validation suite
+Builds the rule-driven validators once (cross-field constraints, contact field
+formats, TC-14.2 entity-type N/A rules, TC-14.3 mandatory fields) and runs them
+over a frame as one boolean violation mask per rule id. Long-running callers
+(the validation daemon, shard workers) keep a suite and its masks resident and
+answer subset queries by indexing the masks.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from validators.constraint_engine import CONSTRAINTS_PATH, ConstraintEngine
+from validators.contact_fields import ContactFieldValidator
+from validators.entity_type_rules import ENTITY_TYPE_RULES_PATH, ApplicabilityIndex, load_entity_type_rules
+from validators.mandatory_rules import MANDATORY_RULES_PATH, NullReasonMatrix, load_mandatory_rules
+
+CHECKS = ("cross_field", "contact_fields", "entity_type", "mandatory")
+
+
+def company_keys(df: pd.DataFrame, id_column: str = "company_id") -> List:
+    """JSON-friendly company identifiers: company_id (integral floats as int), else "row-<index label>"
+    (the row's position in the file for frames read with read_csv, also when read in chunks)"""
+    ids = df[id_column].tolist() if id_column in df.columns else [None] * len(df)
+    keys = []
+    for label, value in zip(df.index.tolist(), ids):
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            keys.append(f"row-{label}")
+        elif isinstance(value, float) and value.is_integer():
+            keys.append(int(value))
+        else:
+            keys.append(value if isinstance(value, (int, str)) else str(value))
+    return keys
+
+
+class ValidationSuite:
+    """Rule-driven validators compiled from rule files, evaluated as per-rule violation masks"""
+
+    def __init__(self, constraints_path: str = CONSTRAINTS_PATH, entity_type_rules_path: str = ENTITY_TYPE_RULES_PATH,
+                 mandatory_rules_path: str = MANDATORY_RULES_PATH):
+        self.rule_files = [constraints_path, entity_type_rules_path, mandatory_rules_path]
+        self.engine = ConstraintEngine.from_rules(constraints_path)
+        self.contact_validator = ContactFieldValidator()
+        self.entity_type_rules = load_entity_type_rules(entity_type_rules_path)
+        self.mandatory_columns = load_mandatory_rules(mandatory_rules_path)["mandatory_columns"]
+
+    def run(self, df: pd.DataFrame, checks: List = None) -> Dict:
+        """{rule_id: (check, violation mask over df's rows)} for the requested checks (default: all)"""
+        checks = CHECKS if checks is None else checks
+        unknown = sorted(set(checks) - set(CHECKS))
+        if unknown:
+            raise ValueError(f"Unknown checks: {unknown}")
+        masks = {}
+        if "cross_field" in checks:
+            violations = self.engine.evaluate(df, max_rows=0)["violations"]
+            masks.update({rule_id: ("cross_field", violations[rule_id].to_numpy()) for rule_id in violations.columns})
+        if "contact_fields" in checks:
+            codes = self.contact_validator.validate(df)["codes"]
+            masks.update({
+                f"CONTACT-{column}": ("contact_fields", (~codes[column].isin(["OK", "NULL"])).to_numpy())
+                for column in codes.columns
+            })
+        if "entity_type" in checks:
+            index = ApplicabilityIndex(df, rules=self.entity_type_rules)
+            violations = index.check(df)["violations"].to_numpy()
+            for r, rule in enumerate(self.entity_type_rules):
+                fields = [index.fields.index(column) for column in rule["must_be_na"] if column in df.columns]
+                applies = index.applies(rule["id"])
+                masks[rule["id"]] = ("entity_type", applies & violations[:, fields].any(axis=1) if fields
+                                     else np.zeros(len(df), dtype=bool))
+        if "mandatory" in checks:
+            failures = NullReasonMatrix.build(df).mandatory_failures(self.mandatory_columns)
+            masks.update({f"TC_14.3:{column}": ("mandatory", failures[column].to_numpy())
+                          for column in failures.columns})
+        return masks
+
+
+def summarize(masks: Dict, keys: List, rows: np.ndarray = None, max_rows: int = None) -> Dict:
+    """Per rule: check name, violation count and violating company keys, optionally over row positions `rows`"""
+    results = {}
+    for rule_id, (check, mask) in masks.items():
+        positions = np.flatnonzero(mask) if rows is None else rows[mask[rows]]
+        listed = positions if max_rows is None else positions[:max_rows]
+        results[rule_id] = {
+            "check": check,
+            "violations": int(len(positions)),
+            "companies": [keys[p] for p in listed.tolist()],
+        }
+    return results